@@ -0,0 +1,47 @@
+"""
+Measure the time taken to import openpyxl with python -X importtime
+
+Prints the total time and the slowest modules, eg.
+
+    python openpyxl/benchmarks/import_time.py
+"""
+
+import subprocess
+import sys
+
+
+def import_times(module="openpyxl"):
+    """
+    Return (module, self, cumulative) times in microseconds for a fresh import
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import {0}".format(module)],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        if not self_time.strip().isdigit():
+            continue # header
+        times.append((name.strip(), int(self_time), int(cumulative)))
+    return times
+
+
+def main(module="openpyxl", runs=5, top=15):
+    best = None
+    for _ in range(runs):
+        times = import_times(module)
+        total = times[-1][2]
+        if best is None or total < best[-1][2]:
+            best = times
+    print("{0}: {1:.1f} ms (best of {2})".format(module, best[-1][2] / 1000, runs))
+    print()
+    print("Slowest modules (self time):")
+    for name, self_time, cumulative in sorted(best, key=lambda t: -t[1])[:top]:
+        print("{0:>8.1f} ms {1:>8.1f} ms  {2}".format(self_time / 1000, cumulative / 1000, name))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,50 @@
+"""
+Compare copying serialisable objects with a round-trip through XML, eg.
+
+    python openpyxl/benchmarks/serialisable_copy.py
+"""
+
+from copy import copy
+import timeit
+
+from openpyxl.styles import Font, PatternFill, Border, Side, Color
+from openpyxl.worksheet.page import PageMargins, PrintPageSetup
+from openpyxl.worksheet.properties import WorksheetProperties
+from openpyxl.cell.text import Text
+from openpyxl.comments.comment_sheet import CommentRecord
+
+
+def xml_copy(obj):
+    """
+    How objects used to be copied
+    """
+    cp = obj.__class__.from_tree(obj.to_tree(tagname="dummy"))
+    for k in obj.__dict__:
+        if k not in obj.__attrs__ + obj.__elements__:
+            setattr(cp, k, copy(getattr(obj, k)))
+    return cp
+
+
+OBJECTS = [
+    Font(name="Calibri", sz=11, b=True, color="FF0000"),
+    PatternFill("solid", fgColor=Color(theme=4, tint=0.4)),
+    Border(left=Side("thin"), right=Side("thin"), top=Side("thick", color="00FF00")),
+    PageMargins(),
+    PrintPageSetup(orientation="landscape", paperSize=9, fitToWidth=1),
+    WorksheetProperties(tabColor="1072BA"),
+    CommentRecord(ref="A1", text=Text(t="A comment")),
+]
+
+
+def main(number=2000):
+    for obj in OBJECTS:
+        name = obj.__class__.__name__
+        assert copy(obj) == xml_copy(obj), name
+        old = min(timeit.repeat(lambda: xml_copy(obj), number=number, repeat=3))
+        new = min(timeit.repeat(lambda: copy(obj), number=number, repeat=3))
+        print("{0:<22} xml {1:>7.1f} us  copy {2:>7.1f} us  {3:>5.1f}x".format(
+            name, old / number * 1e6, new / number * 1e6, old / new))
+
+
+if __name__ == "__main__":
+    main()
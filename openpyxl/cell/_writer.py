@@ -1,9 +1,11 @@
 # Copyright (c) 2010-2021 openpyxl
 
-from openpyxl.compat import safe_string
+from openpyxl.compat import safe_string, NUMERIC_TYPES
 from openpyxl.xml.functions import Element, SubElement, whitespace, XML_NS, REL_NS
 from openpyxl import LXML
 from openpyxl.utils.datetime import to_excel, to_ISO8601
+from openpyxl.worksheet.formula import SharedFormula
+from openpyxl.cell.cell import ERROR_CODES, TIME_TYPES
 from datetime import timedelta
 
 
@@ -20,6 +22,10 @@ def _set_attributes(cell, styled=None):
         attrs['t'] = "inlineStr"
     elif cell.data_type != 'f':
         attrs['t'] = cell.data_type
+    else:
+        result_type, _ = _cached_value(cell)
+        if result_type is not None:
+            attrs['t'] = result_type
 
     value = cell._value
 
@@ -34,13 +40,45 @@ def _set_attributes(cell, styled=None):
             attrs['t'] = "n"
             value = to_excel(value, cell.parent.parent.epoch)
 
-    if cell.hyperlink:
-        cell.parent._hyperlinks.append(cell.hyperlink)
+    if cell._hyperlink:
+        cell.parent._hyperlinks.append(cell._hyperlink)
 
     return value, attrs
 
 
-def etree_write_cell(xf, worksheet, cell, styled=None):
+def _cached_value(cell):
+    """
+    The type and value calculated for a formula, if there is one
+    """
+    value = cell.cached_value
+    if value is None:
+        return None, None
+    if isinstance(value, bool):
+        return "b", value
+    if isinstance(value, NUMERIC_TYPES):
+        return None, value
+    if isinstance(value, TIME_TYPES):
+        return None, to_excel(value, cell.parent.parent.epoch)
+    if value in ERROR_CODES:
+        return "e", value
+    return "str", value
+
+
+def _formula_attributes(worksheet, cell, value, shared=None):
+    """
+    Attributes and text of a formula. Only the first cell of a shared
+    formula has the text.
+    """
+    if shared:
+        formula = shared.get((cell.row, cell.column))
+        if formula is not None:
+            return formula
+    if value.__class__ is SharedFormula:
+        value = value.formula(cell.row, cell.column)
+    return worksheet.formula_attributes.get(cell.coordinate, {}), value
+
+
+def etree_write_cell(xf, worksheet, cell, styled=None, shared=None):
 
     value, attributes = _set_attributes(cell, styled)
 
@@ -50,11 +88,11 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
         return
 
     if cell.data_type == 'f':
-        shared_formula = worksheet.formula_attributes.get(cell.coordinate, {})
+        shared_formula, value = _formula_attributes(worksheet, cell, value, shared)
         formula = SubElement(el, 'f', shared_formula)
         if value is not None:
             formula.text = value[1:]
-            value = None
+        _, value = _cached_value(cell)
 
     if cell.data_type == 's':
         inline_string = SubElement(el, 'is')
@@ -71,7 +109,7 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
     xf.write(el)
 
 
-def lxml_write_cell(xf, worksheet, cell, styled=False):
+def lxml_write_cell(xf, worksheet, cell, styled=False, shared=None):
     value, attributes = _set_attributes(cell, styled)
 
     if value == '' or value is None:
@@ -80,11 +118,11 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
 
     with xf.element('c', attributes):
         if cell.data_type == 'f':
-            shared_formula = worksheet.formula_attributes.get(cell.coordinate, {})
+            shared_formula, value = _formula_attributes(worksheet, cell, value, shared)
             with xf.element('f', shared_formula):
                 if value is not None:
                     xf.write(value[1:])
-                    value = None
+            _, value = _cached_value(cell)
 
         if cell.data_type == 's':
             with xf.element("is"):
@@ -25,8 +25,11 @@ from openpyxl.utils.exceptions import IllegalCharacterError
 
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import numbers, is_date_format
-from openpyxl.styles.styleable import StyleableObject
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.proxy import StyleProxy
+from openpyxl.styles.styleable import StyleableObject, StyleDescriptor
 from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.worksheet.formula import SharedFormula
 
 # constants
 
@@ -100,6 +103,7 @@ class Cell(StyleableObject):
         'parent',
         '_hyperlink',
         '_comment',
+        'cached_value',
                  )
 
     def __init__(self, worksheet, row=None, column=None, value=None, style_array=None):
@@ -112,6 +116,8 @@ class Cell(StyleableObject):
         self._value = None
         self._hyperlink = None
         self.data_type = 'n'
+        self.cached_value = None
+        """Calculated value of a formula"""
         if value is not None:
             self.value = value
         self._comment = None
@@ -207,22 +213,38 @@ class Cell(StyleableObject):
         :type: depends on the value (string, float, int or
             :class:`datetime.datetime`)
         """
-        return self._value
+        value = self._value
+        if value.__class__ is SharedFormula:
+            return value.formula(self.row, self.column)
+        return value
 
     @value.setter
     def value(self, value):
         """Set the value and infer type and display options."""
+        formula = self.data_type == 'f'
         self._bind_value(value)
+        self.cached_value = None
+        if formula or self.data_type == 'f':
+            wb = getattr(self.parent, "parent", None)
+            index = getattr(wb, "_formula_index", None)
+            if index is not None:
+                index.update(self)
 
     @property
     def internal_value(self):
         """Always returns the value for excel."""
-        return self._value
+        return self.value
 
     @property
     def hyperlink(self):
-        """Return the hyperlink target or an empty string"""
-        return self._hyperlink
+        """Return the hyperlink of the cell or of a range that contains it"""
+        link = self._hyperlink
+        if link is None:
+            ranges = getattr(self.parent, "_hyperlink_ranges", None)
+            if ranges:
+                for link in ranges.find(self.row, self.column):
+                    break
+        return link
 
 
     @hyperlink.setter
@@ -231,7 +253,13 @@ class Cell(StyleableObject):
         Automatically sets the `value` of the cell with link text,
         but you can modify it afterwards by setting the `value`
         property, and the hyperlink will remain.
-        Hyperlink is removed if set to ``None``."""
+        Hyperlink is removed if set to ``None``.
+        Hyperlinks of ranges are split so that they no longer include the
+        cell."""
+        ranges = getattr(self.parent, "_hyperlink_ranges", None)
+        if ranges:
+            self.parent._clear_hyperlinks(
+                (self.column, self.row, self.column, self.row))
         if val is None:
             self._hyperlink = None
         else:
@@ -294,6 +322,17 @@ class Cell(StyleableObject):
         self._comment = value
 
 
+class MergedProtectionDescriptor(StyleDescriptor):
+    """
+    Protection of a MergedCell, which is that of the top left cell of its
+    merged range unless the cell has its own
+    """
+
+    def __get__(self, instance, cls):
+        coll = getattr(instance.parent.parent, self.collection)
+        return StyleProxy(coll[instance._protection_id()])
+
+
 class MergedCell(StyleableObject):
 
     """
@@ -309,6 +348,7 @@ class MergedCell(StyleableObject):
     data_type = "n"
     comment = None
     hyperlink = None
+    protection = MergedProtectionDescriptor('_protections', "protectionId")
 
 
     def __init__(self, worksheet, row=None, column=None):
@@ -320,8 +360,44 @@ class MergedCell(StyleableObject):
     def __repr__(self):
         return "<MergedCell {0!r}.{1}>".format(self.parent.title, self.coordinate)
 
+
+    def _protection_id(self):
+        """
+        The protection of the cell or, if it has none of its own, that of
+        the top left cell of its merged range
+        """
+        if self._style is not None and self._style.protectionId:
+            return self._style.protectionId
+        merged = getattr(self.parent, "merged_cells", None)
+        if merged:
+            for mcr in merged._range_index.find(self.row, self.column):
+                start = self.parent._cells.get((mcr.min_row, mcr.min_col))
+                if start is not None and start._style is not None:
+                    return start._style.protectionId
+        return 0
+
+
+    def _resolved_style(self):
+        """
+        The style of the cell with its protection resolved
+        """
+        style = StyleArray() if self._style is None else StyleArray(self._style)
+        style.protectionId = self._protection_id()
+        return style
+
+
+    @property
+    def style_id(self):
+        return self.parent.parent._cell_styles.add(self._resolved_style())
+
+
+    @property
+    def has_style(self):
+        return any(self._resolved_style())
+
     coordinate = Cell.coordinate
     _comment = comment
+    _hyperlink = hyperlink
     value = _value
 
 
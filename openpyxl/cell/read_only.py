@@ -9,9 +9,11 @@ from openpyxl.styles.numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_MAX_SIZE
 
 class ReadOnlyCell(object):
 
-    __slots__ =  ('parent', 'row', 'column', '_value', 'data_type', '_style_id')
+    __slots__ =  ('parent', 'row', 'column', '_value', 'data_type', '_style_id',
+                  'cached_value')
 
-    def __init__(self, sheet, row, column, value, data_type='n', style_id=0):
+    def __init__(self, sheet, row, column, value, data_type='n', style_id=0,
+                 cached_value=None):
         self.parent = sheet
         self._value = None
         self.row = row
@@ -19,6 +21,7 @@ class ReadOnlyCell(object):
         self.data_type = data_type
         self.value = value
         self._style_id = style_id
+        self.cached_value = cached_value
 
 
     def __eq__(self, other):
@@ -53,7 +56,8 @@ class ReadOnlyCell(object):
 
     @property
     def style_array(self):
-        return self.parent.parent._cell_styles[self._style_id]
+        wb = self.parent.parent
+        return (wb._style_remap or wb._cell_styles)[self._style_id]
 
 
     @property
@@ -121,6 +125,7 @@ class EmptyCell(object):
     __slots__ = ()
 
     value = None
+    cached_value = None
     is_date = False
     font = None
     border = None
@@ -20,6 +20,7 @@ def dummy_sheet():
         _number_formats = IndexedList()
         _fonts = IndexedList()
         _fonts.add(None)
+        _style_remap = None
 
 
     class DummySheet(object):
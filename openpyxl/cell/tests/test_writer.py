@@ -69,6 +69,31 @@ def test_write_cell(worksheet, write_cell_implementation, value, expected):
     assert diff is None, diff
 
 
+@pytest.mark.parametrize("cached, expected",
+                         [
+                             (None, """<c r="A1"><f>B1*2</f><v></v></c>"""),
+                             (42, """<c r="A1"><f>B1*2</f><v>42</v></c>"""),
+                             (True, """<c r="A1" t="b"><f>B1*2</f><v>1</v></c>"""),
+                             ("text", """<c r="A1" t="str"><f>B1*2</f><v>text</v></c>"""),
+                             ("#DIV/0!", """<c r="A1" t="e"><f>B1*2</f><v>#DIV/0!</v></c>"""),
+                         ])
+def test_write_cached_value(worksheet, write_cell_implementation, cached, expected):
+    write_cell = write_cell_implementation
+
+    ws = worksheet
+    cell = ws['A1']
+    cell.value = "=B1*2"
+    cell.cached_value = cached
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, cell, cell.has_style)
+
+    xml = out.getvalue()
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
 @pytest.mark.parametrize("value, iso_dates, expected,",
                          [
                              (datetime.date(2011, 12, 25), False, """<c r="A1" t="n" s="1"><v>40902</v></c>"""),
@@ -196,3 +221,19 @@ def test_whitespace(worksheet, write_cell_implementation):
     xml = out.getvalue()
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+def test_cached_value_round_trip():
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = 21
+    ws["A2"] = "=A1*2"
+    ws["A2"].cached_value = 42
+    out = BytesIO()
+    wb.save(out)
+
+    ws = load_workbook(out).active
+    assert ws["A2"].value == "=A1*2"
+    assert ws["A2"].cached_value == 42
+    ws = load_workbook(out, data_only=True).active
+    assert ws["A2"].value == 42
@@ -5,10 +5,6 @@ from weakref import ref
 from openpyxl.descriptors import Typed, Set, Alias
 from openpyxl.descriptors.excel import ExtensionList
 from openpyxl.descriptors.serialisable import Serialisable
-from openpyxl.drawing.spreadsheet_drawing import (
-    AbsoluteAnchor,
-    SpreadsheetDrawing,
-)
 from openpyxl.worksheet.page import (
     PageMargins,
     PrintPageSetup
@@ -94,11 +90,13 @@ class Chartsheet(_WorkbookChild, Serialisable):
 
 
     def add_chart(self, chart):
+        from openpyxl.drawing.spreadsheet_drawing import AbsoluteAnchor
         chart.anchor = AbsoluteAnchor()
         self._charts.append(chart)
 
 
     def to_tree(self):
+        from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
         self._drawing = SpreadsheetDrawing()
         self._drawing.charts = self._charts
         tree = super(Chartsheet, self).to_tree()
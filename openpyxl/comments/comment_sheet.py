@@ -167,10 +167,10 @@ class CommentSheet(Serialisable):
         self.commentList = commentList
 
 
-    def to_tree(self):
-        tree = super(CommentSheet, self).to_tree()
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
+    def _element(self, tagname=None, namespace=None):
+        el, namespace = super(CommentSheet, self)._element(tagname, namespace)
+        el.set("xmlns", SHEET_MAIN_NS)
+        return el, namespace
 
 
     @property
@@ -59,8 +59,10 @@ class ShapeWriter(object):
         root.append(shape)
 
 
-    def write(self, root):
-
+    def _prepare(self, root):
+        """
+        Drawing without any comment shapes
+        """
         if not hasattr(root, "findall"):
             root = Element("xml")
 
@@ -73,6 +75,12 @@ class ShapeWriter(object):
         shape_types = root.find("{%s}shapetype[@id='_x0000_t202']" % vmlns)
         if not shape_types:
             self.add_comment_shapetype(root)
+        return root
+
+
+    def write(self, root):
+
+        root = self._prepare(root)
 
         for idx, (coord, comment) in enumerate(self.comments, 1026):
             self.add_comment_shape(root, idx, coord, comment.height, comment.width)
@@ -80,6 +88,26 @@ class ShapeWriter(object):
         return tostring(root)
 
 
+    def to_stream(self, xf, root=None):
+        """
+        Write the drawing to an xmlfile one shape at a time
+        """
+        root = self._prepare(root)
+
+        # keep any namespaces declared on an existing drawing
+        nsmap = getattr(root, "nsmap", None)
+        with xf.element(root.tag, root.attrib, nsmap=nsmap or None):
+            if root.text:
+                xf.write(root.text)
+            for el in root:
+                xf.write(el)
+            for idx, (coord, comment) in enumerate(self.comments, 1026):
+                row, col = coordinate_to_tuple(coord)
+                shape = _shape_factory(row - 1, col - 1, comment.height, comment.width)
+                shape.set('id', "_x0000_s%04d" % idx)
+                xf.write(shape)
+
+
 def _shape_factory(row, column, height, width):
     style = ("position:absolute; "
              "margin-left:59.25pt;"
@@ -115,3 +115,20 @@ def test_shape_with_custom_size(datadir):
 
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+def test_stream_comments_vml(datadir):
+    from io import BytesIO
+    from openpyxl.xml.functions import xmlfile
+    datadir.chdir()
+    cw = ShapeWriter(create_comments())
+
+    with open('control+comments.vml', 'rb') as existing:
+        src = existing.read()
+    expected = cw.write(fromstring(src))
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        cw.to_stream(xf, fromstring(src))
+    diff = compare_xml(out.getvalue(), expected)
+    assert diff is None, diff
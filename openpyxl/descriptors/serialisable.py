@@ -1,6 +1,7 @@
 # copyright openpyxl 2010-2015
 
 from copy import copy
+import datetime
 from keyword import kwlist
 KEYWORDS = frozenset(kwlist)
 
@@ -12,8 +13,10 @@ from .sequence import (
     MultiSequencePart,
 )
 from .namespace import namespaced
+from .trusted import validating, trusted_class
 
 from openpyxl.compat import safe_string
+from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.xml.functions import (
     Element,
     localname,
@@ -21,6 +24,166 @@ from openpyxl.xml.functions import (
 
 seq_types = (list, tuple)
 
+# values that can be shared between copies
+_IMMUTABLE = frozenset([str, int, float, bool, bytes, type(None),
+                        datetime.datetime, datetime.date, datetime.time,
+                        datetime.timedelta])
+
+# how child elements are stored or serialised
+_ASSIGN = "assign"
+_APPEND = "append"
+_NESTED = "nested"
+_SEQUENCE = "sequence"
+_NESTED_SEQUENCE = "nested sequence"
+
+# plans for each class are created when they are first needed
+_parsers = {}
+_serialisers = {}
+_iterators = {}
+
+
+def _parser(cls):
+    """
+    Known attribute names, child elements and whether the class uses the
+    text of the node
+    """
+    plan = _parsers.get(cls)
+    if plan is None:
+        plan = _parsers[cls] = ({}, {}, "attr_text" in cls.__attrs__)
+    return plan
+
+
+def _attribute_name(cls, key):
+    """
+    Python name for an XML attribute or None if it should be ignored
+    """
+    for name, ns in cls.__namespaced__:
+        if key == ns:
+            key = name
+            break
+    # strip attributes with unknown namespaces
+    if key.startswith('{'):
+        return
+    if key in KEYWORDS:
+        return "_" + key
+    if "-" in key:
+        return key.replace("-", "_")
+    return key
+
+
+def _child_parser(cls, el):
+    """
+    Keyword, conversion and storage for a child element or None if it should
+    be ignored
+    """
+    tag = localname(el)
+    if tag in KEYWORDS:
+        tag = "_" + tag
+    desc = getattr(cls, tag, None)
+    if desc is None or isinstance(desc, property):
+        return
+
+    if hasattr(desc, 'from_tree'):
+        #descriptor manages conversion
+        convert = desc.from_tree
+    elif hasattr(desc.expected_type, "from_tree"):
+        #complex type
+        convert = desc.expected_type.from_tree
+    else:
+        #primitive
+        convert = None
+
+    if isinstance(desc, NestedSequence):
+        return tag, convert, _ASSIGN
+    elif isinstance(desc, Sequence):
+        return tag, convert, _APPEND
+    elif isinstance(desc, MultiSequencePart):
+        return desc.store, convert, _APPEND
+    return tag, convert, _ASSIGN
+
+
+def _serialiser(obj):
+    """
+    Child elements with their descriptors and how to serialise them
+    Some objects have their own elements.
+    """
+    cls = obj.__class__
+    elements = obj.__elements__
+    plan = _serialisers.get(cls)
+    if plan is not None and plan[0] is elements:
+        return plan[1]
+
+    children = []
+    for child_tag in elements:
+        desc = getattr(cls, child_tag, None)
+        if isinstance(desc, NestedSequence):
+            kind = _NESTED_SEQUENCE
+        elif isinstance(desc, Sequence):
+            kind = _SEQUENCE
+        elif child_tag in obj.__nested__:
+            kind = _NESTED
+        else:
+            kind = None
+        children.append((child_tag, desc, kind, hasattr(desc, "namespace")))
+    children = tuple(children)
+    if elements is cls.__elements__:
+        _serialisers[cls] = elements, children
+    return children
+
+
+def _attribute_names(cls):
+    """
+    Attributes and their XML names
+    """
+    names = _iterators.get(cls)
+    if names is None:
+        names = []
+        for attr in cls.__attrs__:
+            if attr == "attr_text":
+                continue
+            name = attr
+            if attr.startswith("_"):
+                name = attr[1:]
+            elif "_" in attr:
+                desc = getattr(cls, attr)
+                if getattr(desc, "hyphenated", False):
+                    name = attr.replace("_", "-")
+            names.append((attr, name))
+        names = _iterators[cls] = tuple(names)
+    return names
+
+
+def _copy_value(value):
+    """
+    Copy child objects and sequences, share immutable values
+    """
+    kind = type(value)
+    if kind in _IMMUTABLE:
+        return value
+    if kind is tuple or kind is IndexedList:
+        return kind([_copy_value(v) for v in value])
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    return copy(value)
+
+
+def _stream_container(xf, desc, tagname, obj, namespace=None):
+    """
+    Write a nested sequence item by item
+    """
+    if type(desc).to_tree is not NestedSequence.to_tree:
+        xf.write(desc.to_tree(tagname, obj, namespace))
+        return
+
+    tagname = namespaced(desc, tagname, namespace)
+    attrs = {}
+    if desc.count:
+        attrs['count'] = str(len(obj))
+    with xf.element(tagname, attrs):
+        for v in obj:
+            xf.write(v.to_tree())
+
+
 class Serialisable(_Serialiasable):
     """
     Objects can serialise to XML their attributes and child objects.
@@ -48,63 +211,55 @@ class Serialisable(_Serialiasable):
         """
         Create object from XML
         """
-        # strip known namespaces from attributes
-        attrib = dict(node.attrib)
-        for key, ns in cls.__namespaced__:
-            if ns in attrib:
-                attrib[key] = attrib[ns]
-                del attrib[ns]
-
-        # strip attributes with unknown namespaces
-        for key in list(attrib):
-            if key.startswith('{'):
-                del attrib[key]
-            elif key in KEYWORDS:
-                attrib["_" + key] = attrib[key]
-                del attrib[key]
-            elif "-" in key:
-                n = key.replace("-", "_")
-                attrib[n] = attrib[key]
-                del attrib[key]
-
-        if node.text and "attr_text" in cls.__attrs__:
+        names, children, text = _parser(cls)
+
+        attrib = {}
+        for key, value in node.attrib.items():
+            try:
+                name = names[key]
+            except KeyError:
+                name = names[key] = _attribute_name(cls, key)
+            if name is None:
+                continue
+            # converted names take precedence
+            if name != key or name not in attrib:
+                attrib[name] = value
+
+        if text and node.text:
             attrib["attr_text"] = node.text
 
         for el in node:
-            tag = localname(el)
-            if tag in KEYWORDS:
-                tag = "_" + tag
-            desc = getattr(cls, tag, None)
-            if desc is None or isinstance(desc, property):
+            try:
+                child = children[el.tag]
+            except KeyError:
+                child = children[el.tag] = _child_parser(cls, el)
+            if child is None:
                 continue
 
-            if hasattr(desc, 'from_tree'):
-                #descriptor manages conversion
-                obj = desc.from_tree(el)
+            tag, convert, kind = child
+            if convert is None:
+                obj = el.text
             else:
-                if hasattr(desc.expected_type, "from_tree"):
-                    #complex type
-                    obj = desc.expected_type.from_tree(el)
-                else:
-                    #primitive
-                    obj = el.text
+                obj = convert(el)
 
-            if isinstance(desc, NestedSequence):
-                attrib[tag] = obj
-            elif isinstance(desc, Sequence):
-                attrib.setdefault(tag, [])
-                attrib[tag].append(obj)
-            elif isinstance(desc, MultiSequencePart):
-                attrib.setdefault(desc.store, [])
-                attrib[desc.store].append(obj)
+            if kind is _APPEND:
+                attrib.setdefault(tag, []).append(obj)
             else:
                 attrib[tag] = obj
 
-        return cls(**attrib)
-
+        if validating():
+            return cls(**attrib)
+        # skip validation but behave normally afterwards
+        obj = trusted_class(cls)(**attrib)
+        obj.__class__ = cls
+        return obj
 
-    def to_tree(self, tagname=None, idx=None, namespace=None):
 
+    def _element(self, tagname=None, namespace=None):
+        """
+        Element for the object without any children and the namespace to use
+        for them
+        """
         if tagname is None:
             tagname = self.tagname
 
@@ -124,50 +279,75 @@ class Serialisable(_Serialiasable):
         el = Element(tagname, attrs)
         if "attr_text" in self.__attrs__:
             el.text = safe_string(getattr(self, "attr_text"))
+        return el, namespace
+
 
-        for child_tag in self.__elements__:
-            desc = getattr(self.__class__, child_tag, None)
+    def _children(self, namespace, xf=None):
+        """
+        Child elements of the object in order. When an xmlfile is given,
+        nested sequences are written to it item by item instead.
+        """
+        for child_tag, desc, kind, set_namespace in _serialiser(self):
             obj = getattr(self, child_tag)
-            if hasattr(desc, "namespace") and hasattr(obj, 'namespace'):
+            if set_namespace and hasattr(obj, 'namespace'):
                 obj.namespace = desc.namespace
 
             if isinstance(obj, seq_types):
-                if isinstance(desc, NestedSequence):
+                if kind is _NESTED_SEQUENCE:
                     # wrap sequence in container
                     if not obj:
                         continue
+                    if xf is not None:
+                        _stream_container(xf, desc, child_tag, obj, namespace)
+                        continue
                     nodes = [desc.to_tree(child_tag, obj, namespace)]
-                elif isinstance(desc, Sequence):
+                elif kind is _SEQUENCE:
                     # sequence
                     desc.idx_base = self.idx_base
                     nodes = (desc.to_tree(child_tag, obj, namespace))
                 else: # property
                     nodes = (v.to_tree(child_tag, namespace) for v in obj)
                 for node in nodes:
-                    el.append(node)
+                    yield node
             else:
-                if child_tag in self.__nested__:
+                if kind is _NESTED:
                     node = desc.to_tree(child_tag, obj, namespace)
                 elif obj is None:
                     continue
                 else:
                     node = obj.to_tree(child_tag)
                 if node is not None:
-                    el.append(node)
+                    yield node
+
+
+    def to_tree(self, tagname=None, idx=None, namespace=None):
+
+        el, namespace = self._element(tagname, namespace)
+        for node in self._children(namespace):
+            el.append(node)
         return el
 
 
+    def to_stream(self, xf, tagname=None, idx=None, namespace=None):
+        """
+        Write the object to an xmlfile. Child elements are serialised and
+        written one at a time so that large sequences are never held in
+        memory as a single tree.
+        """
+        el, namespace = self._element(tagname, namespace)
+
+        with xf.element(el.tag, el.attrib):
+            if el.text is not None:
+                xf.write(el.text)
+            for node in self._children(namespace, xf):
+                xf.write(node)
+
+
     def __iter__(self):
-        for attr in self.__attrs__:
+        for attr, name in _attribute_names(self.__class__):
             value = getattr(self, attr)
-            if attr.startswith("_"):
-                attr = attr[1:]
-            elif attr != "attr_text" and "_" in attr:
-                desc = getattr(self.__class__, attr)
-                if getattr(desc, "hyphenated", False):
-                    attr = attr.replace("_", "-")
-            if attr != "attr_text" and value is not None:
-                yield attr, safe_string(value)
+            if value is not None:
+                yield name, safe_string(value)
 
 
     def __eq__(self, other):
@@ -229,12 +409,13 @@ class Serialisable(_Serialiasable):
 
 
     def __copy__(self):
-        # serialise to xml and back to avoid shallow copies
-        xml = self.to_tree(tagname="dummy")
-        cp = self.__class__.from_tree(xml)
-        # copy any non-persisted attributed
-        for k in self.__dict__:
-            if k not in self.__attrs__ + self.__elements__:
-                v = copy(getattr(self, k))
-                setattr(cp, k, v)
+        # copy field by field, child objects are copied as well
+        # private attributes, such as caches, are left out
+        cls = self.__class__
+        cp = cls.__new__(cls)
+        cp.__dict__.update(
+            (k, _copy_value(v)) for k, v in self.__dict__.items()
+            if not k.startswith("_")
+            or isinstance(getattr(cls, k, None), Descriptor)
+        )
         return cp
@@ -248,3 +248,138 @@ class TestHyphenatedAttribute:
         dummy = HyphenatedAttribute.from_tree(el)
         assert dummy.z_order is True
         assert dummy.a_order is True
+
+
+@pytest.fixture
+def Parent(Serialisable):
+    from ..base import String, Typed
+
+    class Child(Serialisable):
+
+        tagname = "child"
+        val = String(allow_none=True)
+
+        def __init__(self, val=None):
+            self.val = val
+
+
+    class Parent(Serialisable):
+
+        tagname = "parent"
+        name = String(allow_none=True)
+        first = Typed(expected_type=Child, allow_none=True)
+        second = Typed(expected_type=Child, allow_none=True)
+
+        def __init__(self, name=None, first=None, second=None):
+            self.name = name
+            self.first = first
+            self.second = second
+
+    return Parent
+
+
+class TestCachedPlans:
+
+
+    def test_from_tree_twice(self, Parent):
+        src = """
+        <parent xmlns:x="http://example.com" name="a" x:name="b">
+          <first val="1" />
+          <third val="3" />
+        </parent>
+        """
+        for i in range(2):
+            obj = Parent.from_tree(fromstring(src))
+            assert obj.name == "a"
+            assert obj.first.val == "1"
+            assert obj.second is None
+
+
+    def test_subclass(self, Parent):
+        from ..base import Typed
+
+        class Other(Parent):
+
+            third = Typed(expected_type=Parent.first.expected_type, allow_none=True)
+
+            def __init__(self, third=None, **kw):
+                super(Other, self).__init__(**kw)
+                self.third = third
+
+        src = """<parent><first val="1" /><third val="3" /></parent>"""
+        assert Parent.from_tree(fromstring(src)).first.val == "1"
+        obj = Other.from_tree(fromstring(src))
+        assert obj.third.val == "3"
+
+
+    def test_instance_elements(self, Parent):
+        Child = Parent.first.expected_type
+        obj = Parent(first=Child("1"), second=Child("2"))
+        expected = """<parent><first val="1" /><second val="2" /></parent>"""
+        diff = compare_xml(tostring(obj.to_tree()), expected)
+        assert diff is None, diff
+
+        obj.__elements__ = ("second",)
+        expected = """<parent><second val="2" /></parent>"""
+        diff = compare_xml(tostring(obj.to_tree()), expected)
+        assert diff is None, diff
+        other = Parent(first=Child("1"))
+        expected = """<parent><first val="1" /></parent>"""
+        diff = compare_xml(tostring(other.to_tree()), expected)
+        assert diff is None, diff
+
+
+    def test_copy(self, Parent):
+        from copy import copy
+        Child = Parent.first.expected_type
+        obj = Parent(name="a", first=Child("1"))
+        obj.extra = [Child("2")]
+        cp = copy(obj)
+        assert cp == obj
+        assert cp.first is not obj.first
+        assert cp.extra == obj.extra
+        assert cp.extra[0] is not obj.extra[0]
+        cp.first.val = "3"
+        assert obj.first.val == "1"
+
+
+    def test_copy_list_subclass(self, Parent):
+        from copy import copy
+        Child = Parent.first.expected_type
+
+        class Children(list):
+            pass
+
+        obj = Parent(name="a")
+        obj.extra = Children([Child("2")])
+        obj._cache = {}
+        cp = copy(obj)
+        assert type(cp.extra) is list
+        assert cp.extra[0] is not obj.extra[0]
+        assert "_cache" not in cp.__dict__
+
+
+    def test_to_stream(self, Parent):
+        from io import BytesIO
+        from openpyxl.xml.functions import xmlfile
+        from ..sequence import Sequence, NestedSequence
+        Child = Parent.first.expected_type
+
+        class Family(Parent):
+
+            tagname = "family"
+            children = Sequence(expected_type=Child)
+            others = NestedSequence(expected_type=Child, count=True)
+
+            def __init__(self, children=(), others=(), **kw):
+                super(Family, self).__init__(**kw)
+                self.children = children
+                self.others = others
+
+        obj = Family(name="a", first=Child("1"), children=[Child("2"), Child("3")],
+                     others=[Child("4")])
+        out = BytesIO()
+        with xmlfile(out) as xf:
+            obj.to_stream(xf)
+        diff = compare_xml(out.getvalue(), tostring(obj.to_tree()))
+        assert diff is None, diff
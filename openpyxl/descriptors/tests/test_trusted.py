@@ -0,0 +1,95 @@
+# Copyright (c) 2010-2021 openpyxl
+
+import pytest
+
+from openpyxl.xml.functions import fromstring
+
+
+@pytest.fixture
+def Dummy():
+    from ..serialisable import Serialisable
+    from ..base import Bool, Integer, NoneSet, Alias
+    from ..sequence import ValueSequence
+
+    class Dummy(Serialisable):
+
+        tagname = "dummy"
+
+        size = Integer()
+        hidden = Bool(allow_none=True)
+        visible = Bool()
+        style = NoneSet(values=(["solid", "dashed"]))
+        sz = Alias("size")
+        vals = ValueSequence(expected_type=float)
+
+        def __init__(self, size=0, hidden=None, visible=None, style=None,
+                     sz=None, vals=()):
+            self.size = size
+            if sz is not None:
+                self.sz = sz
+            self.hidden = hidden
+            self.visible = visible
+            self.style = style
+            self.vals = vals
+
+    return Dummy
+
+
+@pytest.fixture
+def validation():
+    from ..trusted import validation
+    return validation
+
+
+class TestTrusted:
+
+
+    @pytest.mark.parametrize("src",
+        [
+            """<dummy size="4" hidden="0" style="none"><vals val="1.5"/></dummy>""",
+            """<dummy sz="12" visible="1" style="dashed" />""",
+        ]
+    )
+    def test_same_as_validated(self, Dummy, validation, src):
+        node = fromstring(src)
+        expected = Dummy.from_tree(node)
+        with validation(False):
+            obj = Dummy.from_tree(node)
+        assert type(obj) is Dummy
+        assert obj == expected
+        assert obj.__dict__ == expected.__dict__
+
+
+    def test_no_validation(self, Dummy, validation):
+        node = fromstring("""<dummy style="dotted" />""")
+        with validation(False):
+            obj = Dummy.from_tree(node)
+        assert obj.style == "dotted"
+        with pytest.raises(ValueError):
+            Dummy.from_tree(node)
+
+
+    def test_assign(self, Dummy, validation):
+        node = fromstring("""<dummy size="4" />""")
+        with validation(False):
+            obj = Dummy.from_tree(node)
+        with pytest.raises(ValueError):
+            obj.style = "dotted"
+        with pytest.raises(TypeError):
+            obj.size = "four"
+
+
+    def test_restore(self, validation):
+        from ..trusted import validating
+        with pytest.raises(ValueError):
+            with validation(False):
+                assert validating() is False
+                raise ValueError
+        assert validating() is True
+
+
+def test_unknown_descriptor():
+    from ..base import Alias
+    from ..trusted import _converter
+    with pytest.raises(TypeError):
+        _converter(Alias("size"))
@@ -0,0 +1,179 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Creating objects from trusted XML without validation.
+
+Descriptors check every value assigned to them. When the source is known to be
+valid this is wasted effort, so objects can be created using a subclass whose
+descriptors only perform the conversions needed to turn XML strings into
+Python values. The instance is then given its real class so that later
+assignments are validated as usual.
+"""
+
+from contextlib import contextmanager
+import threading
+
+from openpyxl.utils.datetime import from_ISO8601
+from openpyxl.utils.indexed_list import IndexedList
+
+from .base import (
+    Descriptor,
+    Typed,
+    Convertible,
+    Max,
+    Min,
+    Set,
+    NoneSet,
+    Bool,
+    Length,
+    MatchPattern,
+    DateTime,
+)
+from .nested import Nested
+from .sequence import Sequence
+
+
+class _Validation(threading.local):
+
+    enabled = True
+
+
+_validation = _Validation()
+
+
+@contextmanager
+def validation(enabled=True):
+    """
+    Switch validation of objects created from XML on or off for the current
+    thread
+    """
+    previous = _validation.enabled
+    _validation.enabled = enabled
+    try:
+        yield
+    finally:
+        _validation.enabled = previous
+
+
+def validating():
+    return _validation.enabled
+
+
+# descriptors whose __set__ is understood
+_KNOWN = frozenset([Descriptor, Typed, Convertible, Max, Min, Set, NoneSet,
+                    Bool, Length, MatchPattern, DateTime, Nested, Sequence])
+
+
+def _converter(desc):
+    """
+    Conversion performed by a descriptor, None if the value is stored as is.
+    Raises TypeError if the descriptor has its own behaviour.
+    """
+    for klass in type(desc).__mro__:
+        if "__set__" in vars(klass) and klass not in _KNOWN:
+            raise TypeError("Unknown descriptor {0}".format(klass.__name__))
+
+    if isinstance(desc, Sequence):
+        expected_type = desc.expected_type
+        unique = desc.unique
+
+        def convert(seq):
+            seq = [v if isinstance(v, expected_type) else expected_type(v)
+                   for v in seq]
+            if unique:
+                seq = IndexedList(seq)
+            return seq
+
+    elif isinstance(desc, Bool):
+        allow_none = desc.allow_none
+
+        def convert(value):
+            if value is None and allow_none:
+                return value
+            if value in ('false', 'f', '0'):
+                return False
+            return bool(value)
+
+    elif isinstance(desc, NoneSet):
+
+        def convert(value):
+            if value == 'none':
+                return None
+            return value
+
+    elif isinstance(desc, DateTime):
+
+        def convert(value):
+            if isinstance(value, str):
+                return from_ISO8601(value)
+            return value
+
+    elif isinstance(desc, Convertible):
+        expected_type = desc.expected_type
+        allow_none = desc.allow_none
+
+        def convert(value):
+            if isinstance(value, expected_type) or (value is None and allow_none):
+                return value
+            return expected_type(value)
+
+    else:
+        convert = None
+
+    return convert
+
+
+class TrustedDescriptor(object):
+    """
+    Store values without validation
+    """
+
+    __slots__ = ("name", "convert")
+
+    def __init__(self, name, convert=None):
+        self.name = name
+        self.convert = convert
+
+    def __set__(self, instance, value):
+        if self.convert is not None:
+            value = self.convert(value)
+        instance.__dict__[self.name] = value
+
+
+_trusted = {}
+
+
+def trusted_class(cls):
+    """
+    Subclass of a serialisable class with trusted descriptors
+    """
+    twin = _trusted.get(cls)
+    if twin is not None:
+        return twin
+
+    methods = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__attrs__": cls.__attrs__,
+        "__nested__": cls.__nested__,
+        "__elements__": cls.__elements__,
+    }
+    seen = set()
+    for klass in cls.__mro__:
+        for key, desc in vars(klass).items():
+            if key in seen:
+                continue
+            seen.add(key)
+            if not isinstance(desc, Descriptor):
+                continue
+            try:
+                convert = _converter(desc)
+            except TypeError:
+                continue
+            methods[key] = TrustedDescriptor(desc.name, convert)
+
+    twin = type(cls)(cls.__name__, (cls,), methods)
+    twin.__namespaced__ = cls.__namespaced__
+    _trusted[cls] = twin
+    return twin
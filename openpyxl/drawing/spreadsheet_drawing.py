@@ -24,11 +24,9 @@ from openpyxl.utils.units import (
     cm_to_EMU,
     pixels_to_EMU,
 )
-from openpyxl.drawing.image import Image
 
 from openpyxl.xml.constants import SHEET_DRAWING_NS
 
-from openpyxl.chart._chart import ChartBase
 from .xdr import (
     XDRPoint2D,
     XDRPositiveSize2D,
@@ -218,6 +216,9 @@ def _check_anchor(obj):
     Check whether an object has an existing Anchor object
     If not create a OneCellAnchor using the provided coordinate
     """
+    from openpyxl.chart._chart import ChartBase
+    from openpyxl.drawing.image import Image
+
     anchor = obj.anchor
     if not isinstance(anchor, _AnchorBase):
         row, col = coordinate_to_tuple(anchor.upper())
@@ -276,6 +277,9 @@ class SpreadsheetDrawing(Serialisable):
         """
         create required structure and the serialise
         """
+        from openpyxl.chart._chart import ChartBase
+        from openpyxl.drawing.image import Image
+
         anchors = []
         for idx, obj in enumerate(self.charts + self.images, 1):
             anchor = _check_anchor(obj)
@@ -14,7 +14,8 @@ from openpyxl.descriptors.serialisable import Serialisable
 
 from .rule import Rule
 
-from openpyxl.worksheet.cell_range import MultiCellRange
+from openpyxl.utils.range_index import RangeIndex
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
 
 class ConditionalFormatting(Serialisable):
 
@@ -60,6 +61,7 @@ class ConditionalFormattingList(object):
 
     def __init__(self):
         self._cf_rules = OrderedDict()
+        self._index = RangeIndex()
         self.max_priority = 0
 
 
@@ -78,6 +80,9 @@ class ConditionalFormattingList(object):
         if not rule.priority:
             rule.priority = self.max_priority
 
+        if cf not in self._cf_rules:
+            for cr in cf.sqref:
+                self._index.add(cf, cr.bounds)
         self._cf_rules.setdefault(cf, []).append(rule)
 
 
@@ -109,6 +114,23 @@ class ConditionalFormattingList(object):
     def __delitem__(self, key):
         key = ConditionalFormatting(sqref=key)
         del self._cf_rules[key]
+        for cf in self._index:
+            if cf == key:
+                self._index.remove(cf)
+                break
+
+
+    def find(self, coord):
+        """
+        Return the formats that apply to any part of a cell coordinate or
+        range
+        """
+        if not isinstance(coord, CellRange):
+            coord = CellRange(coord)
+        formats = self._index.overlapping(coord.bounds)
+        for cf in formats:
+            cf.rules = self._cf_rules[cf]
+        return formats
 
 
     def __setitem__(self, key, rule):
@@ -200,3 +200,26 @@ class TestConditionalFormatting:
     def test_contains(self, ConditionalFormatting):
         c2 = ConditionalFormatting("A1:A5 B1:B5")
         assert "B2" in c2
+
+
+class TestConditionalFormattingList:
+
+
+    def test_find(self):
+        cfs = ConditionalFormattingList()
+        r1 = Rule(type="expression", formula=["TRUE"])
+        r2 = Rule(type="expression", formula=["FALSE"])
+        cfs.add("A1:A10 C1", r1)
+        cfs.add("A5:C5", r2)
+        found = cfs.find("A5")
+        assert [str(cf.sqref) for cf in found] == ["A1:A10 C1", "A5:C5"]
+        assert found[1].rules == [r2]
+        assert [str(cf.sqref) for cf in cfs.find("C1:D1")] == ["A1:A10 C1"]
+        assert cfs.find("D1") == []
+
+
+    def test_find_after_delete(self):
+        cfs = ConditionalFormattingList()
+        cfs.add("A1:A10", Rule(type="expression", formula=["TRUE"]))
+        del cfs["A1:A10"]
+        assert cfs.find("A1") == []
@@ -1,3 +1,7 @@
 # Copyright (c) 2010-2021 openpyxl
 
 from .tokenizer import Tokenizer
+from .evaluator import Evaluator
+from .graph import DependencyGraph
+from .rewrite import ReferenceRewriter
+from .index import FormulaIndex
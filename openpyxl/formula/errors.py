@@ -0,0 +1,34 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Excel error values
+"""
+
+NULL = "#NULL!"
+DIV0 = "#DIV/0!"
+VALUE = "#VALUE!"
+REF = "#REF!"
+NAME = "#NAME?"
+NUM = "#NUM!"
+NA = "#N/A"
+
+
+class ExcelError(str):
+    """
+    An error value such as #DIV/0! that is the result of a calculation
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "ExcelError({0})".format(str.__repr__(self))
+
+
+class FormulaError(Exception):
+    """
+    Raised to abandon the calculation of a formula with an error value
+    """
+
+    def __init__(self, error):
+        super(FormulaError, self).__init__(error)
+        self.error = ExcelError(error)
@@ -0,0 +1,460 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Calculate the values of formulae in a workbook.
+
+    >>> evaluator = Evaluator(wb)
+    >>> evaluator.evaluate(ws["C1"])
+    42
+    >>> evaluator.calculate() # store the value of every formula in its cell
+
+With vectorise=True, calculate() evaluates formulae filled down columns, such
+as shared formulae, as NumPy expressions over whole columns where possible.
+
+Values are remembered by the evaluator, so a new one should be used after
+the workbook has been changed.
+
+The intersection operator (a space between two references) is not supported:
+formulae that use it cannot be parsed and evaluate to #NAME?.
+"""
+
+from bisect import bisect_left, bisect_right
+import datetime
+import warnings
+
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import to_excel
+
+from .errors import ExcelError, FormulaError, NAME, REF, VALUE, DIV0
+from .functions import (
+    FUNCTIONS,
+    RangeValue,
+    check,
+    compare,
+    power_,
+    to_number,
+    to_text,
+)
+from .parser import (
+    parse,
+    ParseError,
+    Literal,
+    Reference,
+    Name,
+    UnaryOp,
+    BinaryOp,
+    Function,
+    Array,
+)
+
+
+DATE_TYPES = (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)
+
+
+COMPARISONS = {
+    "=": lambda c: c == 0,
+    "<>": lambda c: c != 0,
+    "<": lambda c: c < 0,
+    "<=": lambda c: c <= 0,
+    ">": lambda c: c > 0,
+    ">=": lambda c: c >= 0,
+}
+
+
+class Evaluator(object):
+    """
+    Evaluate the formulae of a workbook, each one at most once
+    """
+
+    def __init__(self, workbook, vectorise=False):
+        self.workbook = workbook
+        self.vectorise = vectorise
+        self.epoch = workbook.epoch
+        self.values = {}
+        self._trees = {}
+        self._sheets = None
+        self._names = None
+        self._formulae = {}
+        self._dimensions = {}
+        self._active = set()
+
+
+    def reset(self):
+        """
+        Forget all calculated values
+        """
+        self.values.clear()
+        self._sheets = None
+        self._names = None
+        self._formulae.clear()
+        self._dimensions.clear()
+
+
+    def parse(self, formula):
+        """
+        The tree of a formula, which may be shared by many cells
+        """
+        tree = self._trees.get(formula)
+        if tree is None:
+            try:
+                tree = parse(formula)
+            except ParseError as e:
+                warnings.warn("Cannot parse formula {0}: {1}".format(formula, e))
+                tree = Literal(ExcelError(NAME))
+            self._trees[formula] = tree
+        return tree
+
+
+    def evaluate(self, cell):
+        """
+        The value of a cell, calculating any formulae it depends upon first
+        """
+        ws = cell.parent
+        if cell.data_type != "f":
+            return self._constant(cell)
+        key = (ws, cell.row, cell.column)
+        if key not in self.values:
+            for dep in self._schedule(key):
+                if dep not in self.values:
+                    self._calculate(*dep)
+        return self.values[key]
+
+
+    def evaluate_formula(self, formula, ws, row=1, column=1):
+        """
+        The value of a formula as if it were in a cell of a worksheet
+        """
+        return self._result(self.parse(formula), ws, row, column)
+
+
+    def calculate(self):
+        """
+        Calculate every formula in the workbook and store the results as the
+        cached values of the cells
+        """
+        self.reset()
+        if self.vectorise:
+            from .vector import VectorEvaluator
+            VectorEvaluator(self).run()
+        for ws in self.workbook.worksheets:
+            for cell in list(ws._cells.values()):
+                if cell.data_type == "f":
+                    cell.cached_value = self.evaluate(cell)
+
+
+    # values of cells
+
+    def _constant(self, cell):
+        value = cell._value
+        if cell.data_type == "e":
+            return ExcelError(value)
+        if isinstance(value, DATE_TYPES):
+            return to_excel(value, self.epoch)
+        return value
+
+
+    def _cell_value(self, ws, row, col):
+        key = (ws, row, col)
+        value = self.values.get(key)
+        if value is not None:
+            return value
+        cell = ws._cells.get((row, col))
+        if cell is None:
+            return None
+        if cell.data_type != "f":
+            return self._constant(cell)
+        return self._calculate(ws, row, col)
+
+
+    def _calculate(self, ws, row, col):
+        key = (ws, row, col)
+        if key in self._active:
+            warnings.warn("Circular reference in {0}!{1}{2}".format(
+                ws.title, get_column_letter(col), row))
+            return 0
+        self._active.add(key)
+        try:
+            cell = ws._cells[(row, col)]
+            value = self._result(self.parse(cell.value), ws, row, col)
+        finally:
+            self._active.discard(key)
+        self.values[key] = value
+        return value
+
+
+    def _result(self, tree, ws, row, col):
+        value = self._value(tree, ws, row, col, True)
+        if value is None:
+            return 0
+        return value
+
+
+    # dependency order
+
+    def _formula_rows(self, ws):
+        """
+        Rows containing formulae, by column
+        """
+        index = self._formulae.get(ws)
+        if index is None:
+            index = {}
+            for (row, col), cell in ws._cells.items():
+                if cell.data_type == "f":
+                    index.setdefault(col, []).append(row)
+            for rows in index.values():
+                rows.sort()
+            self._formulae[ws] = index
+        return index
+
+
+    def references(self, tree, ws, seen=None):
+        """
+        The worksheet and reference nodes in a tree, including those of
+        defined names
+        """
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Reference):
+                sheet = self._sheet(node.sheet, ws)
+                if sheet is not None:
+                    yield sheet, node
+            elif isinstance(node, Name):
+                seen = seen or set()
+                defn = self._defined_name(node, ws)
+                if defn is not None and defn not in seen:
+                    seen.add(defn)
+                    for ref in self.references(self.parse(defn), ws, seen):
+                        yield ref
+            elif isinstance(node, UnaryOp):
+                stack.append(node.operand)
+            elif isinstance(node, BinaryOp):
+                stack.append(node.right)
+                stack.append(node.left)
+            elif isinstance(node, Function):
+                stack.extend(reversed(node.args))
+            elif isinstance(node, Array):
+                for r in node.rows:
+                    stack.extend(r)
+
+
+    def precedents(self, ws, row, col):
+        """
+        Formula cells referred to by the formula in a cell
+        """
+        tree = self.parse(ws._cells[(row, col)].value)
+        for sheet, node in self.references(tree, ws):
+            min_col, min_row, max_col, max_row = self._bounds(node, sheet)
+            index = self._formula_rows(sheet)
+            for c, rows in index.items():
+                if not min_col <= c <= max_col:
+                    continue
+                lo = bisect_left(rows, min_row)
+                hi = bisect_right(rows, max_row)
+                for r in rows[lo:hi]:
+                    yield sheet, r, c
+
+
+    def _schedule(self, key):
+        """
+        Formula cells in the order they must be calculated for the formula
+        in a cell: depth first without recursion, so that long chains of
+        formulae can be calculated
+        """
+        order = []
+        visited = set([key])
+        stack = [(key, self.precedents(*key))]
+        while stack:
+            current, remaining = stack[-1]
+            for dep in remaining:
+                if dep in visited or dep in self.values:
+                    continue
+                visited.add(dep)
+                stack.append((dep, self.precedents(*dep)))
+                break
+            else:
+                stack.pop()
+                order.append(current)
+        return order
+
+
+    # names and worksheets
+
+    def _sheet(self, title, ws):
+        if title is None:
+            return ws
+        if self._sheets is None:
+            self._sheets = dict((s.title.upper(), s) for s in self.workbook.worksheets)
+        return self._sheets.get(title.upper())
+
+
+    def _defined_name(self, node, ws):
+        """
+        The formula of a defined name, local names first
+        """
+        if self._names is None:
+            self._names = dict(
+                ((defn.name.upper(), defn.localSheetId), defn)
+                for defn in self.workbook.defined_names.definedName)
+        name = node.name.upper()
+        scope = self._sheet(node.sheet, ws)
+        if scope is None:
+            return
+        idx = self.workbook.index(scope)
+        defn = self._names.get((name, idx))
+        if defn is None and node.sheet is None:
+            defn = self._names.get((name, None))
+        if defn is not None and defn.attr_text:
+            return "=" + defn.attr_text
+
+
+    def _bounds(self, node, ws):
+        """
+        Boundaries of a reference with open ranges limited to the cells
+        of the worksheet
+        """
+        max_col, max_row = node.max_col, node.max_row
+        if max_col is None or max_row is None:
+            size = self._dimensions.get(ws)
+            if size is None:
+                size = self._dimensions[ws] = (ws.max_column, ws.max_row)
+            max_col = max_col or size[0]
+            max_row = max_row or size[1]
+        return node.min_col or 1, node.min_row or 1, max_col, max_row
+
+
+    # evaluation
+
+    def _value(self, node, ws, row, col, single=False):
+        """
+        Evaluate a node, with errors as values
+        """
+        try:
+            value = self._eval(node, ws, row, col)
+            if single:
+                value = self._single(value, node, ws, row, col)
+            return value
+        except FormulaError as e:
+            return e.error
+
+
+    def _single(self, value, node, ws, row, col):
+        """
+        Reduce a range to one value using implicit intersection with the
+        row or column of the formula
+        """
+        if not isinstance(value, RangeValue):
+            return value
+        if value.height == 1 and value.width == 1:
+            return value.rows[0][0]
+        if isinstance(node, Reference):
+            sheet = self._sheet(node.sheet, ws)
+            min_col, min_row, max_col, max_row = self._bounds(node, sheet)
+            if min_col == max_col and min_row <= row <= max_row:
+                return value.rows[row - min_row][0]
+            if min_row == max_row and min_col <= col <= max_col:
+                return value.rows[0][col - min_col]
+        raise FormulaError(VALUE)
+
+
+    def _operand(self, node, ws, row, col):
+        return check(self._single(self._eval(node, ws, row, col), node, ws, row, col))
+
+
+    def _eval(self, node, ws, row, col):
+        if isinstance(node, Literal):
+            return node.value
+
+        if isinstance(node, Reference):
+            sheet = self._sheet(node.sheet, ws)
+            if sheet is None:
+                raise FormulaError(REF)
+            min_col, min_row, max_col, max_row = self._bounds(node, sheet)
+            return RangeValue([
+                [self._cell_value(sheet, r, c) for c in range(min_col, max_col + 1)]
+                for r in range(min_row, max_row + 1)
+            ])
+
+        if isinstance(node, Function):
+            return self._call(node, ws, row, col)
+
+        if isinstance(node, BinaryOp):
+            return self._binary(node, ws, row, col)
+
+        if isinstance(node, UnaryOp):
+            value = to_number(self._operand(node.operand, ws, row, col))
+            if node.op == "-":
+                return -value
+            if node.op == "%":
+                return value / 100
+            return value
+
+        if isinstance(node, Name):
+            formula = self._defined_name(node, ws)
+            if formula is None:
+                raise FormulaError(NAME)
+            return self._eval(self.parse(formula), ws, row, col)
+
+        if isinstance(node, Array):
+            return RangeValue([
+                [self._value(n, ws, row, col, True) for n in r]
+                for r in node.rows
+            ])
+
+        raise FormulaError(VALUE)
+
+
+    def _binary(self, node, ws, row, col):
+        op = node.op
+        if op == ",":
+            values = []
+            for side in (node.left, node.right):
+                value = self._eval(side, ws, row, col)
+                if isinstance(value, RangeValue):
+                    values.extend(value)
+                else:
+                    values.append(value)
+            return RangeValue([values])
+
+        left = self._operand(node.left, ws, row, col)
+        right = self._operand(node.right, ws, row, col)
+
+        if op in COMPARISONS:
+            return COMPARISONS[op](compare(left, right))
+        if op == "&":
+            return to_text(left) + to_text(right)
+
+        left, right = to_number(left), to_number(right)
+        if op == "+":
+            return left + right
+        if op == "-":
+            return left - right
+        if op == "*":
+            return left * right
+        if op == "/":
+            if right == 0:
+                raise FormulaError(DIV0)
+            return left / right
+        if op == "^":
+            return power_(left, right)
+        raise FormulaError(VALUE)
+
+
+    def _call(self, node, ws, row, col):
+        func = FUNCTIONS.get(node.name)
+        if func is None:
+            raise FormulaError(NAME)
+        if not func.min_args <= len(node.args) <= func.max_args:
+            raise FormulaError(VALUE)
+
+        if func.lazy:
+            args = [self._thunk(arg, ws, row, col) for arg in node.args]
+        else:
+            args = [self._value(arg, ws, row, col) for arg in node.args]
+        if func.context:
+            args.insert(0, self)
+        return func(*args)
+
+
+    def _thunk(self, node, ws, row, col):
+        return lambda: self._value(node, ws, row, col)
@@ -0,0 +1,1406 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Worksheet functions available to the evaluator.
+
+Functions receive their arguments already evaluated: numbers, strings,
+booleans, None for empty cells or arguments, ExcelError values and
+RangeValue objects for references and arrays. They return a value of the
+same kinds or raise FormulaError.
+"""
+
+import datetime
+from decimal import Decimal, ROUND_HALF_UP, ROUND_UP, ROUND_DOWN
+import inspect
+import math
+import re
+
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.utils.datetime import from_excel, to_excel
+
+from .errors import (
+    ExcelError,
+    FormulaError,
+    DIV0,
+    VALUE,
+    REF,
+    NUM,
+    NA,
+)
+
+
+FUNCTIONS = {}
+
+# the most arguments a function can have
+MAX_ARGS = 255
+
+
+def _arity(func, context):
+    """
+    The least and greatest number of arguments of a worksheet function
+    """
+    least = most = 0
+    for param in inspect.signature(func).parameters.values():
+        if param.kind == param.VAR_POSITIONAL:
+            most = MAX_ARGS + context
+        else:
+            most += 1
+            if param.default is param.empty:
+                least += 1
+    return least - context, most - context
+
+
+def function(*names, **options):
+    """
+    Register a worksheet function.
+
+    lazy: arguments are passed unevaluated as callables
+    context: the evaluator is passed as the first argument
+    """
+    lazy = options.get("lazy", False)
+    context = options.get("context", False)
+
+    def register(func):
+        func.lazy = lazy
+        func.context = context
+        func.min_args, func.max_args = _arity(func, context)
+        for name in names:
+            FUNCTIONS[name] = func
+        return func
+    return register
+
+
+class RangeValue(object):
+    """
+    The values of a reference or array, row by row
+    """
+
+    __slots__ = ("rows",)
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @property
+    def height(self):
+        return len(self.rows)
+
+    @property
+    def width(self):
+        return self.rows and len(self.rows[0]) or 0
+
+    def __iter__(self):
+        for row in self.rows:
+            for value in row:
+                yield value
+
+    def __eq__(self, other):
+        return isinstance(other, RangeValue) and self.rows == other.rows
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return "RangeValue({0!r})".format(self.rows)
+
+
+# coercion
+
+def check(value):
+    """
+    Propagate errors
+    """
+    if isinstance(value, ExcelError):
+        raise FormulaError(value)
+    return value
+
+
+def scalar(value):
+    """
+    Reduce a single cell range to its value
+    """
+    if isinstance(value, RangeValue):
+        if value.height == 1 and value.width == 1:
+            return value.rows[0][0]
+        raise FormulaError(VALUE)
+    return value
+
+
+def to_number(value):
+    value = check(scalar(value))
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    if not isinstance(value, str):
+        raise FormulaError(VALUE)
+    try:
+        return float(value.strip().replace(",", ""))
+    except ValueError:
+        raise FormulaError(VALUE)
+
+
+def to_int(value):
+    return int(math.floor(to_number(value)))
+
+
+def to_text(value):
+    value = check(scalar(value))
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return value and "TRUE" or "FALSE"
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return "{0:.15g}".format(value).upper()
+    return str(value)
+
+
+def to_bool(value):
+    value = check(scalar(value))
+    if value is None:
+        return False
+    if isinstance(value, str):
+        if value.upper() == "TRUE":
+            return True
+        if value.upper() == "FALSE":
+            return False
+        raise FormulaError(VALUE)
+    return bool(value)
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def numbers(args):
+    """
+    Numbers in the arguments of an aggregate function. Text and booleans
+    in references are ignored, while arguments given directly are converted.
+    """
+    for arg in args:
+        if isinstance(arg, RangeValue):
+            for value in arg:
+                check(value)
+                if is_number(value):
+                    yield value
+        else:
+            yield to_number(arg)
+
+
+def values(args):
+    """
+    Flatten the arguments of a function
+    """
+    for arg in args:
+        if isinstance(arg, RangeValue):
+            for value in arg:
+                yield value
+        else:
+            yield arg
+
+
+def to_range(value):
+    if isinstance(value, RangeValue):
+        return value
+    return RangeValue([[value]])
+
+
+# comparison
+
+def _rank(value):
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return 3
+    if isinstance(value, str):
+        return 2
+    return 1
+
+
+def _significant(value):
+    """
+    A number rounded to the 15 significant digits that Excel keeps
+    """
+    if isinstance(value, float):
+        return float("%.15g" % value)
+    return value
+
+
+def compare(left, right):
+    """
+    Compare two values as Excel does: numbers before text before booleans,
+    numbers to 15 significant digits, text without regard to case and empty
+    cells as 0 or an empty string.
+    Returns -1, 0 or 1
+    """
+    if left is None:
+        left = "" if isinstance(right, str) else (False if isinstance(right, bool) else 0)
+    if right is None:
+        right = "" if isinstance(left, str) else (False if isinstance(left, bool) else 0)
+    lr, rr = _rank(left), _rank(right)
+    if lr != rr:
+        return -1 if lr < rr else 1
+    if lr == 2:
+        left, right = left.lower(), right.lower()
+    elif lr == 1:
+        left, right = _significant(left), _significant(right)
+    return (left > right) - (left < right)
+
+
+def _wildcard(pattern):
+    """
+    Regular expression for a text pattern using * ? and ~
+    """
+    out = []
+    escape = False
+    for ch in pattern:
+        if escape:
+            out.append(re.escape(ch))
+            escape = False
+        elif ch == "~":
+            escape = True
+        elif ch == "*":
+            out.append(".*")
+        elif ch == "?":
+            out.append(".")
+        else:
+            out.append(re.escape(ch))
+    return re.compile("".join(out) + r"\Z", re.IGNORECASE | re.DOTALL)
+
+
+def _equal(pattern):
+    """
+    Predicate for exact matches, with wildcards for text
+    """
+    if isinstance(pattern, str) and not isinstance(pattern, ExcelError):
+        if any(ch in pattern for ch in "*?~"):
+            regex = _wildcard(pattern)
+            return lambda v: isinstance(v, str) and regex.match(v) is not None
+        lowered = pattern.lower()
+        return lambda v: isinstance(v, str) and v.lower() == lowered
+    if isinstance(pattern, bool):
+        return lambda v: v is pattern
+    return lambda v: is_number(v) and v == pattern
+
+
+ERRORS = frozenset(["#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"])
+CRITERIA_RE = re.compile(r"(<=|>=|<>|<|>|=)?(.*)\Z", re.DOTALL)
+
+
+def criterion(value):
+    """
+    Predicate for the criteria of COUNTIF and friends
+    """
+    value = check(scalar(value))
+    if not isinstance(value, str):
+        return _equal(value)
+
+    op, operand = CRITERIA_RE.match(value).groups()
+    try:
+        operand = float(operand)
+        if operand.is_integer():
+            operand = int(operand)
+    except ValueError:
+        if operand.upper() in ("TRUE", "FALSE"):
+            operand = operand.upper() == "TRUE"
+        elif operand in ERRORS:
+            operand = ExcelError(operand)
+
+    if op is None or op == "=":
+        if operand == "":
+            return lambda v: v is None or v == ""
+        if isinstance(operand, ExcelError):
+            return lambda v: v == operand
+        return _equal(operand)
+    if op == "<>":
+        if operand == "":
+            return lambda v: v is not None and v != ""
+        match = _equal(operand)
+        return lambda v: not match(v)
+
+    tests = {
+        "<": lambda c: c < 0,
+        "<=": lambda c: c <= 0,
+        ">": lambda c: c > 0,
+        ">=": lambda c: c >= 0,
+    }[op]
+    rank = _rank(operand)
+    return lambda v: (v is not None and _rank(v) == rank
+                      and not isinstance(v, ExcelError)
+                      and tests(compare(v, operand)))
+
+
+# aggregates
+
+@function("SUM")
+def SUM(*args):
+    return sum(numbers(args))
+
+
+@function("PRODUCT")
+def PRODUCT(*args):
+    result = 1
+    for value in numbers(args):
+        result *= value
+    return result
+
+
+@function("AVERAGE")
+def AVERAGE(*args):
+    values = list(numbers(args))
+    if not values:
+        raise FormulaError(DIV0)
+    return sum(values) / len(values)
+
+
+@function("MIN")
+def MIN(*args):
+    return min(numbers(args), default=0)
+
+
+@function("MAX")
+def MAX(*args):
+    return max(numbers(args), default=0)
+
+
+@function("MEDIAN")
+def MEDIAN(*args):
+    values = sorted(numbers(args))
+    if not values:
+        raise FormulaError(NUM)
+    mid, odd = divmod(len(values), 2)
+    if odd:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+
+def _variance(args, sample):
+    values = list(numbers(args))
+    n = len(values) - sample
+    if n < 1:
+        raise FormulaError(DIV0)
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values) / n
+
+
+@function("VAR", "VAR.S")
+def VAR(*args):
+    return _variance(args, True)
+
+
+@function("VARP", "VAR.P")
+def VARP(*args):
+    return _variance(args, False)
+
+
+@function("STDEV", "STDEV.S")
+def STDEV(*args):
+    return math.sqrt(_variance(args, True))
+
+
+@function("STDEVP", "STDEV.P")
+def STDEVP(*args):
+    return math.sqrt(_variance(args, False))
+
+
+@function("COUNT")
+def COUNT(*args):
+    count = 0
+    for arg in args:
+        if isinstance(arg, RangeValue):
+            count += sum(1 for v in arg if is_number(v))
+        else:
+            try:
+                to_number(arg)
+                count += 1
+            except FormulaError:
+                pass
+    return count
+
+
+@function("COUNTA")
+def COUNTA(*args):
+    return sum(1 for v in values(args) if v is not None)
+
+
+@function("COUNTBLANK")
+def COUNTBLANK(rng):
+    return sum(1 for v in to_range(rng) if v is None or v == "")
+
+
+def _matching(pairs):
+    """
+    Positions of the cells matching all range/criteria pairs
+    """
+    ranges = []
+    for rng, crit in pairs:
+        rng = to_range(rng)
+        ranges.append((list(rng), criterion(crit), rng.height, rng.width))
+    shape = ranges[0][2:]
+    for r in ranges[1:]:
+        if r[2:] != shape:
+            raise FormulaError(VALUE)
+    size = len(ranges[0][0])
+    return [i for i in range(size) if all(match(cells[i]) for cells, match, _, _ in ranges)]
+
+
+def _pairs(args):
+    if not args or len(args) % 2:
+        raise FormulaError(VALUE)
+    return list(zip(args[::2], args[1::2]))
+
+
+def _selected(rng, positions):
+    cells = list(to_range(rng))
+    for i in positions:
+        if i < len(cells):
+            value = check(cells[i])
+            if is_number(value):
+                yield value
+
+
+@function("COUNTIF")
+def COUNTIF(rng, crit):
+    return len(_matching([(rng, crit)]))
+
+
+@function("COUNTIFS")
+def COUNTIFS(*args):
+    return len(_matching(_pairs(args)))
+
+
+@function("SUMIF")
+def SUMIF(rng, crit, sum_range=None):
+    if sum_range is None:
+        sum_range = rng
+    return sum(_selected(sum_range, _matching([(rng, crit)])))
+
+
+@function("SUMIFS")
+def SUMIFS(sum_range, *args):
+    return sum(_selected(sum_range, _matching(_pairs(args))))
+
+
+@function("AVERAGEIF")
+def AVERAGEIF(rng, crit, average_range=None):
+    if average_range is None:
+        average_range = rng
+    values = list(_selected(average_range, _matching([(rng, crit)])))
+    if not values:
+        raise FormulaError(DIV0)
+    return sum(values) / len(values)
+
+
+@function("AVERAGEIFS")
+def AVERAGEIFS(average_range, *args):
+    values = list(_selected(average_range, _matching(_pairs(args))))
+    if not values:
+        raise FormulaError(DIV0)
+    return sum(values) / len(values)
+
+
+@function("SUMPRODUCT")
+def SUMPRODUCT(*args):
+    ranges = [list(to_range(arg)) for arg in args]
+    if any(len(r) != len(ranges[0]) for r in ranges):
+        raise FormulaError(VALUE)
+    total = 0
+    for values in zip(*ranges):
+        product = 1
+        for value in values:
+            check(value)
+            product *= value if is_number(value) else 0
+        total += product
+    return total
+
+
+# maths
+
+def _round(number, digits, rounding):
+    number = to_number(number)
+    digits = to_int(digits)
+    exp = Decimal(1).scaleb(-digits)
+    result = Decimal(repr(number)).quantize(exp, rounding=rounding)
+    if digits <= 0:
+        return int(result)
+    return float(result)
+
+
+@function("ROUND")
+def ROUND(number, digits=0):
+    return _round(number, digits, ROUND_HALF_UP)
+
+
+@function("ROUNDUP")
+def ROUNDUP(number, digits=0):
+    return _round(number, digits, ROUND_UP)
+
+
+@function("ROUNDDOWN")
+def ROUNDDOWN(number, digits=0):
+    return _round(number, digits, ROUND_DOWN)
+
+
+@function("TRUNC")
+def TRUNC(number, digits=0):
+    return _round(number, digits, ROUND_DOWN)
+
+
+@function("INT")
+def INT(number):
+    return to_int(number)
+
+
+@function("ABS")
+def ABS(number):
+    return abs(to_number(number))
+
+
+@function("SIGN")
+def SIGN(number):
+    number = to_number(number)
+    return (number > 0) - (number < 0)
+
+
+@function("MOD")
+def MOD(number, divisor):
+    number, divisor = to_number(number), to_number(divisor)
+    if divisor == 0:
+        raise FormulaError(DIV0)
+    return number - divisor * math.floor(number / divisor)
+
+
+@function("POWER")
+def POWER(number, power):
+    return power_(to_number(number), to_number(power))
+
+
+def power_(number, power):
+    if number == 0 and power < 0:
+        raise FormulaError(DIV0)
+    try:
+        result = number ** power
+    except OverflowError:
+        raise FormulaError(NUM)
+    if isinstance(result, complex):
+        raise FormulaError(NUM)
+    return result
+
+
+@function("SQRT")
+def SQRT(number):
+    number = to_number(number)
+    if number < 0:
+        raise FormulaError(NUM)
+    return math.sqrt(number)
+
+
+@function("EXP")
+def EXP(number):
+    return math.exp(to_number(number))
+
+
+@function("LN")
+def LN(number):
+    number = to_number(number)
+    if number <= 0:
+        raise FormulaError(NUM)
+    return math.log(number)
+
+
+@function("LOG")
+def LOG(number, base=10):
+    number, base = to_number(number), to_number(base)
+    if number <= 0 or base <= 0:
+        raise FormulaError(NUM)
+    if base == 1:
+        raise FormulaError(DIV0)
+    return math.log(number, base)
+
+
+@function("LOG10")
+def LOG10(number):
+    return LOG(number)
+
+
+@function("PI")
+def PI():
+    return math.pi
+
+
+@function("CEILING", "CEILING.MATH")
+def CEILING(number, significance=1):
+    number, significance = to_number(number), to_number(significance)
+    if significance == 0:
+        return 0
+    return math.ceil(number / significance) * significance
+
+
+@function("FLOOR", "FLOOR.MATH")
+def FLOOR(number, significance=1):
+    number, significance = to_number(number), to_number(significance)
+    if significance == 0:
+        raise FormulaError(DIV0)
+    return math.floor(number / significance) * significance
+
+
+# logical
+
+@function("IF", lazy=True)
+def IF(condition, true=None, false=None):
+    if to_bool(condition()):
+        result = true() if true is not None else True
+    else:
+        result = false() if false is not None else False
+    return result
+
+
+def _error(value):
+    """
+    The error resulting from a value, if any
+    """
+    if isinstance(value, RangeValue) and value.height == 1 and value.width == 1:
+        value = value.rows[0][0]
+    if isinstance(value, ExcelError):
+        return value
+
+
+@function("IFERROR", lazy=True)
+def IFERROR(value, alternative):
+    result = value()
+    if _error(result) is not None:
+        return alternative()
+    return result
+
+
+@function("IFNA", lazy=True)
+def IFNA(value, alternative):
+    result = value()
+    if _error(result) == NA:
+        return alternative()
+    return result
+
+
+@function("CHOOSE", lazy=True)
+def CHOOSE(index, *choices):
+    index = to_int(index())
+    if not 1 <= index <= len(choices):
+        raise FormulaError(VALUE)
+    return choices[index - 1]()
+
+
+def _logicals(args):
+    for arg in args:
+        if isinstance(arg, RangeValue):
+            for value in arg:
+                check(value)
+                if isinstance(value, (bool, int, float)):
+                    yield bool(value)
+        else:
+            yield to_bool(arg)
+
+
+@function("AND")
+def AND(*args):
+    values = list(_logicals(args))
+    if not values:
+        raise FormulaError(VALUE)
+    return all(values)
+
+
+@function("OR")
+def OR(*args):
+    values = list(_logicals(args))
+    if not values:
+        raise FormulaError(VALUE)
+    return any(values)
+
+
+@function("XOR")
+def XOR(*args):
+    values = list(_logicals(args))
+    if not values:
+        raise FormulaError(VALUE)
+    return sum(values) % 2 == 1
+
+
+@function("NOT")
+def NOT(value):
+    return not to_bool(value)
+
+
+@function("TRUE")
+def TRUE():
+    return True
+
+
+@function("FALSE")
+def FALSE():
+    return False
+
+
+# information
+
+@function("ISBLANK")
+def ISBLANK(value):
+    return scalar(value) is None
+
+
+@function("ISNUMBER")
+def ISNUMBER(value):
+    return is_number(scalar(value))
+
+
+@function("ISTEXT")
+def ISTEXT(value):
+    value = scalar(value)
+    return isinstance(value, str) and not isinstance(value, ExcelError)
+
+
+@function("ISLOGICAL")
+def ISLOGICAL(value):
+    return isinstance(scalar(value), bool)
+
+
+@function("ISERROR")
+def ISERROR(value):
+    return isinstance(scalar(value), ExcelError)
+
+
+@function("ISNA")
+def ISNA(value):
+    value = scalar(value)
+    return isinstance(value, ExcelError) and value == NA
+
+
+@function("NA")
+def NA_():
+    return ExcelError(NA)
+
+
+# lookup
+
+def _lookup(value, cells, approximate, descending=False):
+    """
+    Index of the matching value in a list of cells
+    """
+    value = check(scalar(value))
+    if not approximate:
+        match = _equal(value)
+        for idx, cell in enumerate(cells):
+            if match(cell):
+                return idx
+        raise FormulaError(NA)
+
+    found = None
+    rank = _rank(value)
+    for idx, cell in enumerate(cells):
+        if cell is None or _rank(cell) != rank:
+            continue
+        c = compare(cell, value)
+        if descending:
+            c = -c
+        if c > 0:
+            break
+        found = idx
+    if found is None:
+        raise FormulaError(NA)
+    return found
+
+
+@function("VLOOKUP")
+def VLOOKUP(value, table, col, approximate=True):
+    table = to_range(table)
+    col = to_int(col)
+    if col < 1:
+        raise FormulaError(VALUE)
+    if col > table.width:
+        raise FormulaError(REF)
+    approximate = approximate is None or to_bool(approximate)
+    idx = _lookup(value, [row[0] for row in table.rows], approximate)
+    return table.rows[idx][col - 1]
+
+
+@function("HLOOKUP")
+def HLOOKUP(value, table, row, approximate=True):
+    table = to_range(table)
+    row = to_int(row)
+    if row < 1:
+        raise FormulaError(VALUE)
+    if row > table.height:
+        raise FormulaError(REF)
+    approximate = approximate is None or to_bool(approximate)
+    idx = _lookup(value, table.rows[0], approximate)
+    return table.rows[row - 1][idx]
+
+
+@function("MATCH")
+def MATCH(value, array, match_type=1):
+    array = to_range(array)
+    if array.height != 1 and array.width != 1:
+        raise FormulaError(NA)
+    match_type = 1 if match_type is None else to_number(match_type)
+    cells = list(array)
+    if match_type == 0:
+        return _lookup(value, cells, False) + 1
+    return _lookup(value, cells, True, descending=match_type < 0) + 1
+
+
+@function("INDEX")
+def INDEX(array, row=None, col=None):
+    array = to_range(array)
+    row = 0 if row is None else to_int(row)
+    col = 0 if col is None else to_int(col)
+    if array.height == 1 and col == 0 and row:
+        # one dimensional horizontal array
+        row, col = 1, row
+    if row < 0 or col < 0 or row > array.height or col > array.width:
+        raise FormulaError(REF)
+    rows = array.rows if row == 0 else [array.rows[row - 1]]
+    if col == 0:
+        if len(rows) == 1 and array.width == 1:
+            return rows[0][0]
+        return RangeValue(rows)
+    if len(rows) == 1:
+        return rows[0][col - 1]
+    return RangeValue([[r[col - 1]] for r in rows])
+
+
+@function("ROWS")
+def ROWS(array):
+    return to_range(array).height
+
+
+@function("COLUMNS")
+def COLUMNS(array):
+    return to_range(array).width
+
+
+# dates
+
+def to_date(evaluator, value):
+    """
+    The date of a serial number
+    """
+    serial = to_number(value)
+    if serial < 0:
+        raise FormulaError(NUM)
+    dt = from_excel(serial, evaluator.epoch)
+    if not isinstance(dt, datetime.datetime):
+        dt = datetime.datetime.combine(evaluator.epoch.date(), dt)
+    return dt
+
+
+def _serial(evaluator, dt):
+    serial = to_excel(dt, evaluator.epoch)
+    if serial.is_integer():
+        return int(serial)
+    return serial
+
+
+@function("DATE", context=True)
+def DATE(evaluator, year, month, day):
+    year, month, day = to_int(year), to_int(month), to_int(day)
+    if year < 1900:
+        year += 1900
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    try:
+        dt = datetime.datetime(year, month, 1) + datetime.timedelta(days=day - 1)
+    except (ValueError, OverflowError):
+        raise FormulaError(NUM)
+    return _serial(evaluator, dt)
+
+
+@function("TIME")
+def TIME(hour, minute, second):
+    seconds = to_int(hour) * 3600 + to_int(minute) * 60 + to_int(second)
+    if seconds < 0:
+        raise FormulaError(NUM)
+    return (seconds % 86400) / 86400
+
+
+@function("YEAR", context=True)
+def YEAR(evaluator, value):
+    return to_date(evaluator, value).year
+
+
+@function("MONTH", context=True)
+def MONTH(evaluator, value):
+    return to_date(evaluator, value).month
+
+
+@function("DAY", context=True)
+def DAY(evaluator, value):
+    return to_date(evaluator, value).day
+
+
+@function("HOUR", context=True)
+def HOUR(evaluator, value):
+    return to_date(evaluator, value).hour
+
+
+@function("MINUTE", context=True)
+def MINUTE(evaluator, value):
+    return to_date(evaluator, value).minute
+
+
+@function("SECOND", context=True)
+def SECOND(evaluator, value):
+    return to_date(evaluator, value).second
+
+
+@function("WEEKDAY", context=True)
+def WEEKDAY(evaluator, value, return_type=1):
+    weekday = to_date(evaluator, value).weekday() # Monday is 0
+    return_type = 1 if return_type is None else to_int(return_type)
+    if return_type == 1:
+        return (weekday + 1) % 7 + 1
+    if return_type == 2:
+        return weekday + 1
+    if return_type == 3:
+        return weekday
+    raise FormulaError(NUM)
+
+
+@function("TODAY", context=True)
+def TODAY(evaluator):
+    return _serial(evaluator, datetime.date.today())
+
+
+@function("NOW", context=True)
+def NOW(evaluator):
+    return _serial(evaluator, datetime.datetime.now())
+
+
+def _add_months(dt, months):
+    month = dt.month - 1 + months
+    year = dt.year + month // 12
+    month = month % 12 + 1
+    return year, month
+
+
+def _month_end(year, month):
+    if month == 12:
+        return datetime.datetime(year, 12, 31)
+    return datetime.datetime(year, month + 1, 1) - datetime.timedelta(days=1)
+
+
+@function("EDATE", context=True)
+def EDATE(evaluator, start, months):
+    dt = to_date(evaluator, start)
+    year, month = _add_months(dt, to_int(months))
+    day = min(dt.day, _month_end(year, month).day)
+    return _serial(evaluator, datetime.datetime(year, month, day))
+
+
+@function("EOMONTH", context=True)
+def EOMONTH(evaluator, start, months):
+    dt = to_date(evaluator, start)
+    year, month = _add_months(dt, to_int(months))
+    return _serial(evaluator, _month_end(year, month))
+
+
+@function("DAYS")
+def DAYS(end, start):
+    return int(to_number(end)) - int(to_number(start))
+
+
+@function("DATEDIF", context=True)
+def DATEDIF(evaluator, start, end, unit):
+    start = to_date(evaluator, start).date()
+    end = to_date(evaluator, end).date()
+    if start > end:
+        raise FormulaError(NUM)
+    unit = to_text(unit).upper()
+    months = (end.year - start.year) * 12 + end.month - start.month
+    if end.day < start.day:
+        months -= 1
+    if unit == "Y":
+        return months // 12
+    if unit == "M":
+        return months
+    if unit == "D":
+        return (end - start).days
+    if unit == "YM":
+        return months % 12
+    if unit == "MD":
+        if end.day >= start.day:
+            return end.day - start.day
+        year, month = _add_months(end, -1)
+        return _month_end(year, month).day - start.day + end.day
+    if unit == "YD":
+        year = end.year
+        if (start.month, start.day) > (end.month, end.day):
+            year -= 1
+        day = min(start.day, _month_end(year, start.month).day)
+        return (end - datetime.date(year, start.month, day)).days
+    raise FormulaError(NUM)
+
+
+# text
+
+@function("CONCATENATE", "CONCAT")
+def CONCATENATE(*args):
+    return "".join(to_text(v) for v in values(args))
+
+
+@function("LEN")
+def LEN(text):
+    return len(to_text(text))
+
+
+@function("LEFT")
+def LEFT(text, count=1):
+    count = 1 if count is None else to_int(count)
+    if count < 0:
+        raise FormulaError(VALUE)
+    return to_text(text)[:count]
+
+
+@function("RIGHT")
+def RIGHT(text, count=1):
+    count = 1 if count is None else to_int(count)
+    if count < 0:
+        raise FormulaError(VALUE)
+    text = to_text(text)
+    return count and text[-count:] or ""
+
+
+@function("MID")
+def MID(text, start, count):
+    start, count = to_int(start), to_int(count)
+    if start < 1 or count < 0:
+        raise FormulaError(VALUE)
+    return to_text(text)[start - 1:start - 1 + count]
+
+
+@function("UPPER")
+def UPPER(text):
+    return to_text(text).upper()
+
+
+@function("LOWER")
+def LOWER(text):
+    return to_text(text).lower()
+
+
+@function("PROPER")
+def PROPER(text):
+    return to_text(text).title()
+
+
+@function("TRIM")
+def TRIM(text):
+    return " ".join(part for part in to_text(text).split(" ") if part)
+
+
+@function("EXACT")
+def EXACT(left, right):
+    return to_text(left) == to_text(right)
+
+
+@function("REPT")
+def REPT(text, count):
+    count = to_int(count)
+    if count < 0:
+        raise FormulaError(VALUE)
+    return to_text(text) * count
+
+
+@function("SUBSTITUTE")
+def SUBSTITUTE(text, old, new, instance=None):
+    text, old, new = to_text(text), to_text(old), to_text(new)
+    if not old:
+        return text
+    if instance is None:
+        return text.replace(old, new)
+    instance = to_int(instance)
+    if instance < 1:
+        raise FormulaError(VALUE)
+    pos = -1
+    for _ in range(instance):
+        pos = text.find(old, pos + 1)
+        if pos == -1:
+            return text
+    return text[:pos] + new + text[pos + len(old):]
+
+
+@function("FIND")
+def FIND(needle, haystack, start=1):
+    start = 1 if start is None else to_int(start)
+    haystack = to_text(haystack)
+    if start < 1 or start > len(haystack) + 1:
+        raise FormulaError(VALUE)
+    pos = haystack.find(to_text(needle), start - 1)
+    if pos == -1:
+        raise FormulaError(VALUE)
+    return pos + 1
+
+
+@function("SEARCH")
+def SEARCH(needle, haystack, start=1):
+    start = 1 if start is None else to_int(start)
+    haystack = to_text(haystack)
+    if start < 1 or start > len(haystack) + 1:
+        raise FormulaError(VALUE)
+    regex = _wildcard(to_text(needle))
+    pattern = re.compile(regex.pattern[:-2], re.IGNORECASE | re.DOTALL)
+    match = pattern.search(haystack, start - 1)
+    if match is None:
+        raise FormulaError(VALUE)
+    return match.start() + 1
+
+
+FORMAT_RE = re.compile(
+    r'"(?P<quoted>[^"]*)"?|\\(?P<escaped>.)|_(?P<space>.)|\*.|\[[^\]]*\]'
+    r'|(?P<ampm>(?i:AM/PM|A/P))|(?P<exp>[Ee][+-])|(?P<char>.)', re.DOTALL)
+DIGITS = ("0", "#", "?")
+
+
+def _sections(fmt):
+    """
+    The sections of a number format: positive;negative;zero;text
+    """
+    sections = [[]]
+    quoted = escaped = False
+    for ch in fmt:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == '"':
+            quoted = not quoted
+        elif ch == ";" and not quoted:
+            sections.append([])
+            continue
+        sections[-1].append(ch)
+    return ["".join(section) for section in sections]
+
+
+def _format_tokens(section):
+    """
+    Codes and text of a section of a number format. Literals have no code,
+    and colours, conditions and fills are left out.
+    """
+    tokens = []
+    for match in FORMAT_RE.finditer(section):
+        kind = match.lastgroup
+        if kind is None:
+            continue
+        text = match.group(kind)
+        if kind in ("quoted", "escaped"):
+            tokens.append(("", text))
+        elif kind == "space":
+            tokens.append(("", " "))
+        elif kind == "ampm":
+            tokens.append(("ampm", text))
+        elif kind == "exp":
+            tokens.append((text.upper(), text))
+        elif text.lower() in "ymdhs":
+            code = text.lower()
+            if tokens and tokens[-1][0][:1] == code:
+                code = tokens.pop()[0] + code
+            tokens.append((code, code))
+        elif text in DIGITS or text in ".,%":
+            tokens.append((text, text))
+        else:
+            tokens.append(("", text))
+    return tokens
+
+
+def _digits(number, decimals):
+    """
+    The integer and fractional digits of a number rounded as Excel does
+    """
+    exp = Decimal(1).scaleb(-decimals)
+    text = format(Decimal(repr(number)).quantize(exp, rounding=ROUND_HALF_UP), "f")
+    whole, _, fraction = text.partition(".")
+    return whole.lstrip("0"), fraction
+
+
+def _group(text):
+    head = len(text) % 3 or 3
+    return ",".join([text[:head]] + [text[i:i + 3] for i in range(head, len(text), 3)])
+
+
+def _format_number(number, tokens):
+    codes = [code for code, _ in tokens]
+    negative = number < 0
+    number = abs(number) * 100 ** codes.count("%")
+    end = len(tokens)
+    for idx, code in enumerate(codes):
+        if code in ("E+", "E-"):
+            end = idx
+            break
+    point = codes.index(".") if "." in codes[:end] else end
+    whole = tokens[:point]
+    fraction = tokens[point + 1:end]
+    places = [idx for idx, (code, _) in enumerate(whole) if code in DIGITS]
+    decimals = sum(1 for code, _ in fraction if code in DIGITS)
+
+    grouped = False
+    for idx, (code, _) in enumerate(whole):
+        if code == "," and places:
+            if idx > places[-1]:
+                number /= 1000 # scaled by thousands
+            elif idx > places[0]:
+                grouped = True
+
+    exp = None
+    if end < len(tokens):
+        width = max(len(places), 1)
+        exp = 0
+        if number:
+            exp = math.floor(math.log10(number)) - width + 1
+            number /= 10 ** exp
+            if round(number, decimals) >= 10 ** width:
+                number /= 10
+                exp += 1
+
+    int_text, frac_text = _digits(number, decimals)
+    fill = []
+    for idx, pos in enumerate(reversed(places)):
+        if idx < len(int_text):
+            fill.append(int_text[-idx - 1])
+        else:
+            fill.append({"0": "0", "?": " ", "#": ""}[whole[pos][0]])
+    fill.reverse()
+    if fill:
+        fill[0] = int_text[:-len(fill)] + fill[0]
+        if grouped:
+            fill = [_group("".join(fill))] + [""] * (len(fill) - 1)
+
+    frac = list(frac_text)
+    frac_codes = [code for code, _ in fraction if code in DIGITS]
+    for idx in reversed(range(len(frac))):
+        if frac_codes[idx] == "0" or frac[idx] != "0":
+            break
+        frac[idx] = " " if frac_codes[idx] == "?" else ""
+
+    out = []
+    if negative and (int_text or frac_text.strip("0")):
+        out.append("-")
+    if not places:
+        out.append(int_text)
+    fill = iter(fill)
+    for code, text in whole:
+        if code in DIGITS:
+            out.append(next(fill))
+        elif code != ",":
+            out.append(text)
+    if point < end:
+        out.append(".")
+        frac = iter(frac)
+        for code, text in fraction:
+            if code in DIGITS:
+                out.append(next(frac))
+            elif code != ",":
+                out.append(text)
+    if exp is not None:
+        code, text = tokens[end]
+        sign = "-" if exp < 0 else ("+" if code == "E+" else "")
+        zeros = sum(1 for c, _ in tokens[end + 1:] if c == "0")
+        out.append(text[0] + sign)
+        exp_text = str(abs(exp)).rjust(zeros, "0")
+        for c, text in tokens[end + 1:]:
+            if c in DIGITS:
+                out.append(exp_text)
+                exp_text = ""
+            else:
+                out.append(text)
+    return "".join(out)
+
+
+def _format_date(dt, tokens):
+    if dt.microsecond >= 500000:
+        dt += datetime.timedelta(seconds=1)
+    twelve = any(code == "ampm" for code, _ in tokens)
+    dated = [idx for idx, (code, _) in enumerate(tokens) if code[:1] in "ymdhs" and code]
+
+    # m and mm are minutes after hours or before seconds
+    minutes = set()
+    for pos, idx in enumerate(dated):
+        code = tokens[idx][0]
+        if code in ("m", "mm"):
+            if (pos and tokens[dated[pos - 1]][0][0] == "h"
+                or pos + 1 < len(dated) and tokens[dated[pos + 1]][0][0] == "s"):
+                minutes.add(idx)
+
+    out = []
+    for idx, (code, text) in enumerate(tokens):
+        kind, size = code[:1], len(code)
+        if idx in minutes:
+            value = dt.minute
+        elif kind == "y":
+            out.append("%02d" % (dt.year % 100) if size <= 2 else "%04d" % dt.year)
+            continue
+        elif kind == "m":
+            if size > 2:
+                name = dt.strftime("%b" if size == 3 else "%B")
+                out.append(name[0] if size == 5 else name)
+                continue
+            value = dt.month
+        elif kind == "d":
+            if size > 2:
+                out.append(dt.strftime("%a" if size == 3 else "%A"))
+                continue
+            value = dt.day
+        elif kind == "h":
+            value = (dt.hour % 12 or 12) if twelve else dt.hour
+        elif kind == "s":
+            value = dt.second
+        elif code == "ampm":
+            if len(text) > 3:
+                out.append("AM" if dt.hour < 12 else "PM")
+            else:
+                out.append(text[0] if dt.hour < 12 else text[2])
+            continue
+        else:
+            out.append(text)
+            continue
+        out.append(str(value) if size == 1 else "%02d" % value)
+    return "".join(out)
+
+
+@function("TEXT", context=True)
+def TEXT(evaluator, value, format_text):
+    value = check(scalar(value))
+    sections = _sections(to_text(format_text))
+    if isinstance(value, bool):
+        return to_text(value)
+    if isinstance(value, str):
+        try:
+            value = to_number(value)
+        except FormulaError:
+            if len(sections) < 4:
+                return value
+            return "".join(value if text == "@" else text
+                           for _, text in _format_tokens(sections[3]))
+
+    number = to_number(value)
+    section = sections[0]
+    if number < 0 and len(sections) > 1:
+        section = sections[1]
+        number = -number
+    elif number == 0 and len(sections) > 2:
+        section = sections[2]
+    if section.strip().upper() == "GENERAL":
+        return to_text(number)
+    tokens = _format_tokens(section)
+    if is_date_format(section):
+        return _format_date(to_date(evaluator, number), tokens)
+    return _format_number(number, tokens)
+
+
+@function("VALUE")
+def VALUE_(text):
+    value = check(scalar(text))
+    if isinstance(value, str):
+        try:
+            return float(value.strip().replace(",", ""))
+        except ValueError:
+            raise FormulaError(VALUE)
+    return to_number(value)
@@ -0,0 +1,171 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Dependencies between the formulae of a workbook, so that only the formulae
+affected by a change are calculated again.
+
+    >>> graph = DependencyGraph(wb)
+    >>> graph.value(ws["C1"])
+    42
+    >>> graph.set_value(ws["A1"], 10)
+    >>> graph.value(ws["C1"]) # only the dependents of A1 are recalculated
+    210
+"""
+
+from bisect import insort
+
+from .evaluator import Evaluator
+from .parser import MAX_COLUMN, MAX_ROW
+
+
+# ranges at least this wide are not indexed by column
+WIDE = 64
+
+
+class DependencyGraph(object):
+    """
+    Precedents and dependents of every formula in a workbook.
+
+    References to cells, ranges, other worksheets and defined names are
+    followed. The graph is built once from the formulae in the workbook and
+    kept up to date by set_value(). Changes to defined names are not tracked.
+    """
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.evaluator = Evaluator(workbook)
+        self.dirty = set()
+        self._precedents = {}
+        self._cells = {}
+        self._columns = {}
+        self._wide = {}
+        for ws in workbook.worksheets:
+            for cell in ws._cells.values():
+                if cell.data_type == "f":
+                    self._add((ws, cell.row, cell.column), cell.value)
+
+
+    def _add(self, key, formula):
+        evaluator = self.evaluator
+        ws = key[0]
+        refs = []
+        for sheet, node in evaluator.references(evaluator.parse(formula), ws):
+            ref = (sheet, node.min_col or 1, node.min_row or 1,
+                   node.max_col or MAX_COLUMN, node.max_row or MAX_ROW)
+            _, min_col, min_row, max_col, max_row = ref
+            if min_col == max_col and min_row == max_row:
+                self._cells.setdefault((sheet, min_row, min_col), set()).add(key)
+            elif max_col - min_col < WIDE:
+                for col in range(min_col, max_col + 1):
+                    self._columns.setdefault((sheet, col), []).append((min_row, max_row, key))
+            else:
+                self._wide.setdefault(sheet, []).append(ref[1:] + (key,))
+            refs.append(ref)
+        self._precedents[key] = refs
+
+
+    def _remove(self, key):
+        for sheet, min_col, min_row, max_col, max_row in self._precedents.pop(key, ()):
+            if min_col == max_col and min_row == max_row:
+                self._cells.get((sheet, min_row, min_col), set()).discard(key)
+            elif max_col - min_col < WIDE:
+                for col in range(min_col, max_col + 1):
+                    entries = self._columns.get((sheet, col), [])
+                    entries[:] = [e for e in entries if e[2] != key]
+            else:
+                entries = self._wide.get(sheet, [])
+                entries[:] = [e for e in entries if e[4] != key]
+
+
+    def _dependents(self, ws, row, col):
+        found = set(self._cells.get((ws, row, col), ()))
+        for min_row, max_row, key in self._columns.get((ws, col), ()):
+            if min_row <= row <= max_row:
+                found.add(key)
+        for min_col, min_row, max_col, max_row, key in self._wide.get(ws, ()):
+            if min_col <= col <= max_col and min_row <= row <= max_row:
+                found.add(key)
+        return found
+
+
+    def precedents(self, cell):
+        """
+        The references in the formula of a cell as tuples of worksheet,
+        min_col, min_row, max_col, max_row
+        """
+        return list(self._precedents.get((cell.parent, cell.row, cell.column), ()))
+
+
+    def dependents(self, cell):
+        """
+        Cells with formulae that refer directly to a cell
+        """
+        return [ws._cells[(row, col)]
+                for ws, row, col in self._dependents(cell.parent, cell.row, cell.column)]
+
+
+    def set_value(self, cell, value):
+        """
+        Change the value of a cell and mark the formulae that depend upon it
+        as needing to be calculated again
+        """
+        ws = cell.parent
+        key = (ws, cell.row, cell.column)
+        evaluator = self.evaluator
+
+        size = evaluator._dimensions.get(ws)
+        if size is not None and (cell.column > size[0] or cell.row > size[1]):
+            del evaluator._dimensions[ws]
+
+        rows = evaluator._formula_rows(ws)
+        if cell.data_type == "f":
+            self._remove(key)
+            rows[cell.column].remove(cell.row)
+
+        cell.value = value
+
+        if cell.data_type == "f":
+            self._add(key, cell.value)
+            insort(rows.setdefault(cell.column, []), cell.row)
+            self.dirty.add(key)
+        evaluator.values.pop(key, None)
+        self._invalidate(key)
+
+
+    def _invalidate(self, key):
+        """
+        Forget the values of everything that depends upon a cell
+        """
+        values = self.evaluator.values
+        stack = [key]
+        seen = set(stack)
+        while stack:
+            for dep in self._dependents(*stack.pop()):
+                if dep not in seen:
+                    seen.add(dep)
+                    values.pop(dep, None)
+                    self.dirty.add(dep)
+                    stack.append(dep)
+
+
+    def value(self, cell):
+        """
+        The value of a cell, calculating only formulae whose values are not
+        known
+        """
+        return self.evaluator.evaluate(cell)
+
+
+    def recalculate(self):
+        """
+        Calculate the formulae affected by changes and store their results as
+        cached values. Returns the number of formulae calculated.
+        """
+        count = 0
+        for ws, row, col in self.dirty:
+            cell = ws._cells.get((row, col))
+            if cell is not None and cell.data_type == "f":
+                cell.cached_value = self.evaluator.evaluate(cell)
+                count += 1
+        self.dirty.clear()
+        return count
@@ -0,0 +1,291 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Find the formulae that refer to a range of cells without tokenising every
+formula of the workbook for each query.
+
+    >>> wb.formula_index.referencing("Data!B2:B5000")
+    [<Cell 'Summary'.C3>, <Cell 'Summary'.C4>]
+    >>> wb.formula_index.precedents(wb["Summary"]["C3"])
+    [<CellRange 'Data'!B2:B5000>]
+
+The index is built from the references in the formulae of every worksheet the
+first time it is used and updated when the value of a formula cell changes.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
+
+from openpyxl.worksheet.cell_range import CellRange
+
+from .parser import Name, ParseError, parse_reference, MAX_COLUMN, MAX_ROW
+from .rewrite import references
+
+
+# ranges at least this wide are not indexed by column
+WIDE = 64
+
+
+@lru_cache(maxsize=4096)
+def _parse(text):
+    try:
+        return parse_reference(text)
+    except ParseError:
+        return
+
+
+class _Intervals(object):
+    """
+    The rows referred to in one column of a worksheet. Entries are sorted by
+    their first row, and entries of formulae that have changed removed, when
+    the column is next searched.
+    """
+
+    __slots__ = ("entries", "starts", "reach")
+
+    def __init__(self):
+        self.entries = []
+        self.starts = None
+        self.reach = None
+
+
+    def add(self, min_row, max_row, key, version):
+        self.entries.append((min_row, max_row, key, version))
+        self.starts = None
+
+
+    def _prepare(self, versions):
+        entries = [e for e in self.entries if versions.get(e[2]) == e[3]]
+        entries.sort(key=itemgetter(0))
+        reach = []
+        furthest = 0
+        for entry in entries:
+            if entry[1] > furthest:
+                furthest = entry[1]
+            reach.append(furthest)
+        self.entries = entries
+        self.starts = [e[0] for e in entries]
+        self.reach = reach
+
+
+    def find(self, min_row, max_row, versions):
+        """
+        Formula cells that refer to any of the rows min_row:max_row
+        """
+        if self.starts is None:
+            self._prepare(versions)
+        entries = self.entries
+        reach = self.reach
+        idx = bisect_right(self.starts, max_row) - 1
+        # no earlier entry reaches min_row once the furthest end is before it
+        while idx >= 0 and reach[idx] >= min_row:
+            _, end, key, version = entries[idx]
+            if end >= min_row and versions.get(key) == version:
+                yield key
+            idx -= 1
+
+
+class FormulaIndex(object):
+    """
+    The ranges referred to by the formulae of a workbook, indexed by worksheet
+    and column.
+
+    References to cells, ranges, other worksheets and defined names are
+    included. Formulae are only tokenised when the index is built and when the
+    value of a formula cell is changed. Inserting, deleting or moving cells,
+    and adding, renaming or removing worksheets, resets the index, which is
+    then built again when it is next used. Changes to defined names require
+    :meth:`reset`.
+    """
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._built = False
+
+
+    def reset(self):
+        """
+        Forget everything, so that the index is built again when it is next
+        used
+        """
+        self._built = False
+        self._columns = None
+        self._wide = None
+        self._precedents = None
+        self._versions = None
+
+
+    def _build(self):
+        wb = self.workbook
+        self._sheets = dict((ws.title.upper(), ws) for ws in wb.worksheets)
+        self._names = dict(
+            ((defn.name.upper(), defn.localSheetId), defn.attr_text)
+            for defn in wb.defined_names.definedName if defn.attr_text)
+        self._columns = {}
+        self._wide = {}
+        self._precedents = {}
+        self._versions = {}
+        self._version = 0
+        self._built = True
+        for ws in wb.worksheets:
+            cells = getattr(ws, "_cells", None)
+            if not cells:
+                continue
+            for cell in cells.values():
+                if cell.data_type == "f":
+                    self._add((ws, cell.row, cell.column), cell.value)
+
+
+    def _references(self, formula, ws, seen=None):
+        """
+        Worksheet and bounds of every reference in a formula, including those
+        of defined names. Unqualified references are to ws.
+        """
+        spans = references(formula)
+        if not spans:
+            return
+        for start, end in spans:
+            node = _parse(formula[start:end])
+            if node is None:
+                continue
+            if node.sheet is None:
+                sheet = ws
+            else:
+                sheet = self._sheets.get(node.sheet.upper())
+                if sheet is None:
+                    continue
+            if node.__class__ is Name:
+                seen = seen or set()
+                text = self._defined_name(node, sheet)
+                if text is not None and text not in seen:
+                    seen.add(text)
+                    for ref in self._references("=" + text, None, seen):
+                        yield ref
+                continue
+            if sheet is None:
+                continue
+            yield (sheet, node.min_col or 1, node.min_row or 1,
+                   node.max_col or MAX_COLUMN, node.max_row or MAX_ROW)
+
+
+    def _defined_name(self, node, scope):
+        """
+        The text of a defined name, names local to the scope first
+        """
+        name = node.name.upper()
+        text = None
+        if scope is not None:
+            text = self._names.get((name, self.workbook.index(scope)))
+        if text is None and node.sheet is None:
+            text = self._names.get((name, None))
+        return text
+
+
+    def _add(self, key, formula):
+        self._version += 1
+        version = self._versions[key] = self._version
+        refs = []
+        for ref in self._references(formula, key[0]):
+            sheet, min_col, min_row, max_col, max_row = ref
+            if max_col - min_col < WIDE:
+                columns = self._columns.setdefault(sheet, {})
+                for col in range(min_col, max_col + 1):
+                    intervals = columns.get(col)
+                    if intervals is None:
+                        intervals = columns[col] = _Intervals()
+                    intervals.add(min_row, max_row, key, version)
+            else:
+                self._wide.setdefault(sheet, []).append(ref[1:] + (key, version))
+            if ref not in refs:
+                refs.append(ref)
+        self._precedents[key] = refs
+
+
+    def _remove(self, key):
+        if self._versions.pop(key, None) is None:
+            return
+        # entries in columns are dropped when the column is next searched
+        for sheet, min_col, _, max_col, _ in self._precedents.pop(key):
+            if max_col - min_col >= WIDE:
+                entries = self._wide[sheet]
+                entries[:] = [e for e in entries if e[4] != key]
+
+
+    def update(self, cell):
+        """
+        The value of a cell has changed. Cells keep their index up to date
+        when their value is set, so this is only needed after changing their
+        value by other means.
+        """
+        if not self._built:
+            return
+        key = (cell.parent, cell.row, cell.column)
+        self._remove(key)
+        if cell.data_type == "f":
+            self._add(key, cell.value)
+
+
+    def _range(self, ref, ws):
+        if isinstance(ref, CellRange):
+            title = ref.title
+            bounds = ref.bounds
+        else:
+            node = _parse(ref)
+            if node is None or node.__class__ is Name:
+                raise ValueError("{0} is not a range of cells".format(ref))
+            title = node.sheet
+            bounds = (node.min_col or 1, node.min_row or 1,
+                      node.max_col or MAX_COLUMN, node.max_row or MAX_ROW)
+        if title is not None:
+            ws = self._sheets.get(title.upper())
+            if ws is None:
+                raise KeyError("Worksheet {0} does not exist.".format(title))
+        elif ws is None:
+            raise ValueError("{0} does not include a worksheet".format(ref))
+        return ws, bounds
+
+
+    def referencing(self, ref, ws=None):
+        """
+        Cells with formulae that refer directly to any cell of a range such as
+        "Sheet1!B2:B5000", in the order of the worksheets and their rows.
+        Ranges without a worksheet are on ws.
+        """
+        if not self._built:
+            self._build()
+        ws, (min_col, min_row, max_col, max_row) = self._range(ref, ws)
+        versions = self._versions
+
+        found = set()
+        columns = self._columns.get(ws, {})
+        if max_col - min_col + 1 > len(columns):
+            indexed = [(col, intervals) for col, intervals in columns.items()
+                       if min_col <= col <= max_col]
+        else:
+            indexed = [(col, columns[col]) for col in range(min_col, max_col + 1)
+                       if col in columns]
+        for col, intervals in indexed:
+            found.update(intervals.find(min_row, max_row, versions))
+        for lo_col, lo_row, hi_col, hi_row, key, version in self._wide.get(ws, ()):
+            if (lo_col <= max_col and hi_col >= min_col and lo_row <= max_row
+                and hi_row >= min_row and versions.get(key) == version):
+                found.add(key)
+
+        order = dict((sheet, idx) for idx, sheet in enumerate(self.workbook.worksheets))
+        keys = sorted(found, key=lambda k: (order.get(k[0], -1), k[1], k[2]))
+        cells = (sheet._cells.get((row, col)) for sheet, row, col in keys)
+        return [cell for cell in cells if cell is not None]
+
+
+    def precedents(self, cell):
+        """
+        The ranges referred to by the formula of a cell, including those of
+        defined names
+        """
+        if not self._built:
+            self._build()
+        refs = self._precedents.get((cell.parent, cell.row, cell.column), ())
+        return [CellRange(min_col=min_col, min_row=min_row, max_col=max_col,
+                          max_row=max_row, title=sheet.title)
+                for sheet, min_col, min_row, max_col, max_row in refs]
@@ -0,0 +1,375 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Parse the tokens of a formula into a tree of nodes that can be evaluated.
+
+    >>> parse("=SUM(A1:A3)*2")
+    BinaryOp('*', Function('SUM', [Reference(None, 'A1:A3')]), Literal(2))
+"""
+
+import re
+
+from openpyxl.utils import column_index_from_string
+
+from .errors import ExcelError
+from .tokenizer import Token, tokenize
+
+
+class ParseError(Exception):
+    """
+    Raised when the tokens of a formula do not form a valid expression
+    """
+
+
+class Node(object):
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return (type(self) is type(other)
+                and all(getattr(self, k) == getattr(other, k) for k in self.__slots__))
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        args = ", ".join(repr(getattr(self, k)) for k in self.__slots__)
+        return "{0}({1})".format(self.__class__.__name__, args)
+
+
+class Literal(Node):
+    """
+    A number, string, boolean or error
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Reference(Node):
+    """
+    A cell or range of cells, optionally on another worksheet. Open ranges
+    such as A:A or 1:1 have None for their missing boundaries.
+    """
+
+    __slots__ = ("sheet", "ref", "min_col", "min_row", "max_col", "max_row")
+
+    def __init__(self, sheet, ref, min_col=None, min_row=None, max_col=None,
+                 max_row=None):
+        self.sheet = sheet
+        self.ref = ref
+        self.min_col = min_col
+        self.min_row = min_row
+        self.max_col = max_col
+        self.max_row = max_row
+
+    def __repr__(self):
+        return "Reference({0!r}, {1!r})".format(self.sheet, self.ref)
+
+
+class Name(Node):
+    """
+    A defined name, optionally qualified by a worksheet
+    """
+
+    __slots__ = ("sheet", "name")
+
+    def __init__(self, sheet, name):
+        self.sheet = sheet
+        self.name = name
+
+
+class UnaryOp(Node):
+    """
+    Prefix + and - and postfix %
+    """
+
+    __slots__ = ("op", "operand")
+
+    def __init__(self, op, operand):
+        self.op = op
+        self.operand = operand
+
+
+class BinaryOp(Node):
+
+    __slots__ = ("op", "left", "right")
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+
+class Function(Node):
+
+    __slots__ = ("name", "args")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+
+class Array(Node):
+    """
+    An array constant such as {1,2;3,4}
+    """
+
+    __slots__ = ("rows",)
+
+    def __init__(self, rows):
+        self.rows = rows
+
+
+# binding of infix operators
+PRECEDENCE = {
+    ",": 6, # union
+    "^": 5,
+    "*": 4, "/": 4,
+    "+": 3, "-": 3,
+    "&": 2,
+    "=": 1, "<>": 1, "<": 1, ">": 1, "<=": 1, ">=": 1,
+}
+
+CELL_RE = re.compile(r"\$?([A-Za-z]{1,3})\$?([0-9]+)$")
+COL_RE = re.compile(r"\$?([A-Za-z]{1,3})$")
+ROW_RE = re.compile(r"\$?([0-9]+)$")
+
+MAX_COLUMN = 16384
+MAX_ROW = 1048576
+
+
+def split_sheet(value):
+    """
+    Separate any worksheet from a reference, removing quotes
+    """
+    if "!" not in value:
+        return None, value
+    sheet, ref = value.rsplit("!", 1)
+    if sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, ref
+
+
+def _boundary(part):
+    """
+    Column and row of one end of a range, either may be None
+    """
+    m = CELL_RE.match(part)
+    if m is not None:
+        col = column_index_from_string(m.group(1))
+        row = int(m.group(2))
+        if col <= MAX_COLUMN and 0 < row <= MAX_ROW:
+            return col, row
+        return
+    m = COL_RE.match(part)
+    if m is not None:
+        col = column_index_from_string(m.group(1))
+        if col <= MAX_COLUMN:
+            return col, None
+        return
+    m = ROW_RE.match(part)
+    if m is not None:
+        row = int(m.group(1))
+        if 0 < row <= MAX_ROW:
+            return None, row
+
+
+def parse_reference(value):
+    """
+    Convert the value of a range operand into a Reference or a Name
+    """
+    sheet, ref = split_sheet(value)
+    parts = ref.split(":")
+    if len(parts) == 1:
+        bounds = _boundary(ref)
+        if bounds is None or None in bounds:
+            return Name(sheet, ref)
+        col, row = bounds
+        return Reference(sheet, ref, col, row, col, row)
+
+    if len(parts) == 2:
+        start = _boundary(parts[0])
+        end = _boundary(parts[1])
+        if start is not None and end is not None:
+            kinds = (start[0] is None, start[1] is None)
+            if kinds == (end[0] is None, end[1] is None) and kinds != (True, True):
+                (min_col, max_col), (min_row, max_row) = (
+                    sorted((start[0], end[0]), key=lambda v: v or 0),
+                    sorted((start[1], end[1]), key=lambda v: v or 0),
+                )
+                return Reference(sheet, ref, min_col, min_row, max_col, max_row)
+    raise ParseError("Unsupported reference {0}".format(value))
+
+
+def _literal(token):
+    value = token.value
+    subtype = token.subtype
+    if subtype == Token.NUMBER:
+        if "." in value or "e" in value or "E" in value:
+            return Literal(float(value))
+        return Literal(int(value))
+    if subtype == Token.TEXT:
+        return Literal(value[1:-1].replace('""', '"'))
+    if subtype == Token.LOGICAL:
+        return Literal(value == "TRUE")
+    if subtype == Token.ERROR:
+        return Literal(ExcelError(value[value.index("#"):]))
+    return parse_reference(value)
+
+
+class Parser(object):
+    """
+    Precedence climbing parser for the tokens of a formula
+    """
+
+    def __init__(self, tokens):
+        self.tokens = []
+        self.spaced = set() # positions of tokens that follow white space
+        for t in tokens:
+            if t.type == Token.WSPACE:
+                self.spaced.add(len(self.tokens))
+            else:
+                self.tokens.append(t)
+        self.pos = 0
+
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+
+
+    def next(self):
+        token = self.peek()
+        if token is None:
+            raise ParseError("Unexpected end of formula")
+        self.pos += 1
+        return token
+
+
+    def parse(self):
+        node = self.expression()
+        if self.peek() is not None:
+            raise self.unexpected()
+        return node
+
+
+    def unexpected(self):
+        """
+        Error for an operand that follows another one. Separated by white
+        space it is the intersection operator, which is not supported.
+        """
+        token = self.peek()
+        if self.pos in self.spaced and (token.type == Token.OPERAND
+                                        or token.subtype == Token.OPEN):
+            return ParseError("The intersection operator is not supported")
+        return ParseError("Unexpected token {0!r}".format(token.value))
+
+
+    def expression(self, min_precedence=0):
+        left = self.unary()
+        while True:
+            token = self.peek()
+            if token is None or token.type != Token.OP_IN:
+                return left
+            precedence = PRECEDENCE[token.value]
+            if precedence < min_precedence:
+                return left
+            self.pos += 1
+            right = self.expression(precedence + 1)
+            left = BinaryOp(token.value, left, right)
+
+
+    def unary(self):
+        token = self.peek()
+        if token is not None and token.type == Token.OP_PRE:
+            self.pos += 1
+            return UnaryOp(token.value, self.unary())
+        node = self.primary()
+        while True:
+            token = self.peek()
+            if token is None or token.type != Token.OP_POST:
+                return node
+            self.pos += 1
+            node = UnaryOp(token.value, node)
+
+
+    def primary(self):
+        token = self.next()
+        if token.type == Token.OPERAND:
+            return _literal(token)
+
+        if token.subtype == Token.OPEN:
+            if token.type == Token.PAREN:
+                node = self.expression()
+                self.closer(Token.PAREN)
+                return node
+            if token.type == Token.FUNC:
+                name = token.value[:-1].upper()
+                for prefix in ("_XLFN.", "_XLWS."):
+                    if name.startswith(prefix):
+                        name = name[len(prefix):]
+                return Function(name, self.arguments())
+            if token.type == Token.ARRAY:
+                return self.array()
+
+        raise ParseError("Unexpected token {0!r}".format(token.value))
+
+
+    def closer(self, kind):
+        token = self.next()
+        if token.type != kind or token.subtype != Token.CLOSE:
+            raise ParseError("Unexpected token {0!r}".format(token.value))
+
+
+    def arguments(self):
+        args = []
+        expect_arg = True
+        while True:
+            token = self.peek()
+            if token is None:
+                raise ParseError("Unexpected end of formula")
+            if token.type == Token.FUNC and token.subtype == Token.CLOSE:
+                self.pos += 1
+                if args and expect_arg:
+                    args.append(Literal(None)) # trailing empty argument
+                return args
+            if token.type == Token.SEP and token.subtype == Token.ARG:
+                self.pos += 1
+                if expect_arg:
+                    args.append(Literal(None)) # empty argument
+                expect_arg = True
+                continue
+            if not expect_arg:
+                raise self.unexpected()
+            args.append(self.expression())
+            expect_arg = False
+
+
+    def array(self):
+        rows = [[]]
+        while True:
+            rows[-1].append(self.expression())
+            token = self.next()
+            if token.type == Token.ARRAY and token.subtype == Token.CLOSE:
+                return Array(rows)
+            if token.type != Token.SEP:
+                raise ParseError("Unexpected token {0!r}".format(token.value))
+            if token.subtype == Token.ROW:
+                rows.append([])
+
+
+def parse(formula):
+    """
+    Parse a formula beginning with "=" into a tree of nodes
+    """
+    if not formula.startswith("="):
+        raise ParseError("Formulae must begin with '='")
+    tokens = tokenize(formula)
+    if not tokens:
+        raise ParseError("Empty formula")
+    return Parser(tokens).parse()
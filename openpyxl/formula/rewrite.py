@@ -0,0 +1,422 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Update the references in the formulae of a workbook after rows or columns
+have been inserted or deleted, or worksheets renamed.
+
+    >>> ws.insert_rows(5, 2)
+    >>> rewriter = ReferenceRewriter(wb)
+    >>> rewriter.insert_rows(ws, 5, 2)
+    >>> rewriter.rename_sheet("Data", "Inputs")
+    >>> rewriter.apply() # number of formulae changed
+    12
+
+Changes are collected and applied together, in the order they were made, to
+the formulae of every worksheet and to defined names. Each formula is only
+tokenised once.
+"""
+
+from functools import lru_cache
+import re
+
+from openpyxl.utils import get_column_letter, column_index_from_string, quote_sheetname
+
+from .parser import split_sheet, MAX_COLUMN, MAX_ROW
+from .tokenizer import Token, TokenizerError, tokenize
+
+
+CELL_RE = re.compile(r"(\$?)([A-Za-z]{1,3})(\$?)([0-9]+)$")
+COL_RE = re.compile(r"(\$?)([A-Za-z]{1,3})$")
+ROW_RE = re.compile(r"(\$?)([0-9]+)$")
+
+# worksheet names that do not need quotes
+PLAIN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_.]*$")
+LIKE_CELL_RE = re.compile(r"([A-Za-z]{1,3}[0-9]+|[Rr][0-9]*[Cc][0-9]*)$")
+
+ROWS = "row"
+COLS = "col"
+RENAME = "rename"
+
+REF_ERROR = "#REF!"
+
+
+def _piece(text, single):
+    """
+    Column and row of one end of a range as absolute markers and numbers,
+    either of which may be None
+    """
+    m = CELL_RE.match(text)
+    if m is not None:
+        col_abs, col, row_abs, row = m.groups()
+        col = column_index_from_string(col)
+        row = int(row)
+        if col <= MAX_COLUMN and 0 < row <= MAX_ROW:
+            return col_abs, col, row_abs, row
+        return
+    if single:
+        return
+    m = COL_RE.match(text)
+    if m is not None:
+        col = column_index_from_string(m.group(2))
+        if col <= MAX_COLUMN:
+            return m.group(1), col, "", None
+        return
+    m = ROW_RE.match(text)
+    if m is not None:
+        row = int(m.group(2))
+        if 0 < row <= MAX_ROW:
+            return "", None, m.group(1), row
+
+
+def _piece_text(piece):
+    col_abs, col, row_abs, row = piece
+    text = ""
+    if col is not None:
+        text = col_abs + get_column_letter(col)
+    if row is not None:
+        text += row_abs + str(row)
+    return text
+
+
+def _qualifier(sheets, quoted):
+    name = ":".join(sheets)
+    if quoted or not PLAIN_RE.match(name) or any(LIKE_CELL_RE.match(s) for s in sheets):
+        return quote_sheetname(name)
+    return name
+
+
+def _shift(lo, hi, idx, amount, limit):
+    """
+    The new bounds lo:hi of rows or columns after amount have been inserted,
+    or deleted if negative, at idx. None if they have all been deleted.
+    """
+    if amount > 0:
+        if lo >= idx:
+            lo += amount
+        if hi >= idx:
+            hi += amount
+        if hi > limit:
+            return
+        return lo, hi
+    end = idx - amount
+    if lo >= end:
+        lo += amount
+    elif lo >= idx:
+        lo = idx
+    if hi >= end:
+        hi += amount
+    elif hi >= idx:
+        hi = idx - 1
+    if hi < lo:
+        return
+    return lo, hi
+
+
+class _Reference(object):
+    """
+    A reference in a formula, split into worksheets and the ends of a range
+    """
+
+    __slots__ = ("text", "quoted", "sheets", "ref", "pieces")
+
+    def __init__(self, text):
+        self.text = text
+        sheet, ref = split_sheet(text)
+        self.quoted = sheet is not None and text.startswith("'")
+        self.sheets = None if sheet is None else tuple(sheet.split(":"))
+        self.ref = ref
+        parts = ref.split(":")
+        pieces = [_piece(part, len(parts) == 1) for part in parts]
+        if None in pieces:
+            pieces = None # a defined name or a table
+        self.pieces = pieces
+
+
+    def rewrite(self, host, changes):
+        sheets = self.sheets
+        current = sheets or (host,)
+        pieces = self.pieces
+        for change in changes:
+            kind = change[0]
+            if kind == RENAME:
+                _, old, new = change
+                current = tuple(new if s is not None and s.lower() == old else s
+                                for s in current)
+                continue
+            if (pieces is None or len(current) != 1 or current[0] is None
+                or current[0].lower() != change[1]):
+                continue
+            # once deleted, only renames apply
+            pieces = self._shift(pieces, change)
+
+        if sheets is None:
+            qualifier = ""
+        elif current == sheets:
+            qualifier = self.text[:len(self.text) - len(self.ref)]
+        else:
+            qualifier = _qualifier(current, self.quoted) + "!"
+        if pieces is None:
+            if self.pieces is not None:
+                return qualifier + REF_ERROR
+            return qualifier + self.ref
+        if pieces is self.pieces:
+            return qualifier + self.ref
+        return qualifier + ":".join(_piece_text(p) for p in pieces)
+
+
+    @staticmethod
+    def _shift(pieces, change):
+        kind, _, idx, amount = change
+        if kind == ROWS:
+            axis, limit = 3, MAX_ROW
+        else:
+            axis, limit = 1, MAX_COLUMN
+
+        if len(pieces) == 2:
+            ranges = [pieces]
+        else:
+            ranges = [[p, p] for p in pieces]
+        shifted = []
+        for start, end in ranges:
+            lo, hi = start[axis], end[axis]
+            if lo is None or hi is None: # whole rows or columns
+                shifted.append((start, end))
+                continue
+            reverse = lo > hi
+            if reverse:
+                lo, hi = hi, lo
+            bounds = _shift(lo, hi, idx, amount, limit)
+            if bounds is None:
+                return
+            if reverse:
+                bounds = bounds[::-1]
+            start, end = list(start), list(end)
+            start[axis], end[axis] = bounds
+            shifted.append((tuple(start), tuple(end)))
+
+        if len(pieces) == 2:
+            return list(shifted[0])
+        return [start for start, end in shifted]
+
+
+# digits only change the values of tokens, not where they are, as long as
+# leading zeros are kept for scientific notation
+SHAPE = str.maketrans("23456789", "11111111")
+
+
+@lru_cache(maxsize=4096)
+def _layout(shape):
+    """
+    Start and end of each reference in formulae of the same shape, None if
+    they cannot be tokenised
+    """
+    try:
+        tokens = tokenize(shape)
+    except TokenizerError:
+        return
+    if not tokens or tokens[0].type == Token.LITERAL:
+        return ()
+    spans = []
+    pos = 1
+    size = len(shape)
+    for token in tokens:
+        value = token.value
+        if token.type == Token.WSPACE:
+            while pos < size and shape[pos] in " \n":
+                pos += 1
+            continue
+        end = pos + len(value)
+        if shape[pos:end] != value:
+            return
+        if (token.type == Token.OPERAND and token.subtype == Token.RANGE
+            and not value.startswith("[")): # not in other workbooks
+            spans.append((pos, end))
+        pos = end
+    return tuple(spans)
+
+
+def references(formula):
+    """
+    Start and end of each reference in a formula, None if it cannot be
+    tokenised. Formulae differing only in numbers are only tokenised once.
+    """
+    return _layout(formula.translate(SHAPE))
+
+
+@lru_cache(maxsize=4096)
+def _reference(text):
+    return _Reference(text)
+
+
+class ReferenceRewriter(object):
+    """
+    Change the references in the formulae of every worksheet and in defined
+    names of a workbook.
+
+    References to the rows and columns of a worksheet are updated the way
+    Excel updates them when rows or columns are inserted or deleted,
+    including absolute references. References to cells that have been
+    deleted become #REF!. Unqualified references in defined names and the
+    formulae of conditional formats and data validations are not changed.
+    """
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.changes = []
+
+
+    @staticmethod
+    def _title(sheet):
+        if not isinstance(sheet, str):
+            sheet = sheet.title
+        return sheet.lower()
+
+
+    def insert_rows(self, sheet, idx, amount=1):
+        """
+        Rows have been inserted before row idx of a worksheet
+        """
+        self.changes.append((ROWS, self._title(sheet), idx, amount))
+
+
+    def delete_rows(self, sheet, idx, amount=1):
+        """
+        Rows have been deleted from row idx of a worksheet
+        """
+        self.changes.append((ROWS, self._title(sheet), idx, -amount))
+
+
+    def insert_cols(self, sheet, idx, amount=1):
+        """
+        Columns have been inserted before column idx of a worksheet
+        """
+        self.changes.append((COLS, self._title(sheet), idx, amount))
+
+
+    def delete_cols(self, sheet, idx, amount=1):
+        """
+        Columns have been deleted from column idx of a worksheet
+        """
+        self.changes.append((COLS, self._title(sheet), idx, -amount))
+
+
+    def rename_sheet(self, old, new):
+        """
+        A worksheet has been renamed
+        """
+        self.changes.append((RENAME, self._title(old), new))
+
+
+    def _host(self, ws):
+        """
+        The title of a worksheet before any of the changes
+        """
+        title = ws.title
+        for change in reversed(self.changes):
+            if change[0] == RENAME and change[2].lower() == title.lower():
+                title = change[1]
+        return title
+
+
+    def _shifted(self, host):
+        """
+        Whether rows or columns of a worksheet have been changed
+        """
+        if host is None:
+            return False
+        title = host.lower()
+        for change in self.changes:
+            if change[0] == RENAME:
+                if change[1] == title:
+                    title = change[2].lower()
+            elif change[1] == title:
+                return True
+        return False
+
+
+    def rewrite(self, formula, host=None):
+        """
+        A formula with the changes applied to its references. Unqualified
+        references are to the host worksheet, if there is one.
+        """
+        names = set(c[1] for c in self.changes) | set(
+            c[2].lower() for c in self.changes if c[0] == RENAME)
+        return self._rewrite(formula, host, self._shifted(host), names)
+
+
+    def _rewrite(self, formula, host, shifted, names, memo=None):
+        if not shifted:
+            lower = formula.lower()
+            if not any(name in lower for name in names):
+                return formula
+        spans = references(formula)
+        if not spans:
+            return formula
+
+        if memo is None:
+            memo = {}
+        changes = self.changes
+        out = []
+        pos = 0
+        changed = False
+        for start, end in spans:
+            text = formula[start:end]
+            value = memo.get(text)
+            if value is None:
+                value = memo[text] = _reference(text).rewrite(host, changes)
+            if value != text:
+                out.append(formula[pos:start])
+                out.append(value)
+                pos = end
+                changed = True
+        if not changed:
+            return formula
+        out.append(formula[pos:])
+        return "".join(out)
+
+
+    def apply(self):
+        """
+        Change the formulae of the workbook. Returns the number of formulae
+        changed.
+        """
+        changes = self.changes
+        if not changes:
+            return 0
+        names = set(c[1] for c in changes) | set(
+            c[2].lower() for c in changes if c[0] == RENAME)
+
+        index = getattr(self.workbook, "_formula_index", None)
+        count = 0
+        for ws in self.workbook.worksheets:
+            cells = getattr(ws, "_cells", None)
+            if not cells:
+                continue
+            host = self._host(ws)
+            shifted = self._shifted(host)
+            memo = {}
+            for cell in cells.values():
+                if cell.data_type != "f":
+                    continue
+                formula = cell.value
+                value = self._rewrite(formula, host, shifted, names, memo)
+                if value is not formula:
+                    cell._value = value
+                    count += 1
+                    if index is not None:
+                        index.update(cell)
+
+        renamed = False
+        for defn in self.workbook.defined_names.definedName:
+            text = defn.attr_text
+            if text:
+                value = self._rewrite("=" + text, None, False, names)[1:]
+                if value != text:
+                    defn.attr_text = value
+                    count += 1
+                    renamed = True
+        if renamed and index is not None:
+            index.reset()
+
+        self.changes = []
+        return count
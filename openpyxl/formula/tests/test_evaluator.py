@@ -0,0 +1,135 @@
+# Copyright (c) 2010-2021 openpyxl
+
+import datetime
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from ..errors import ExcelError
+
+
+@pytest.fixture
+def Evaluator():
+    from ..evaluator import Evaluator
+    return Evaluator
+
+
+@pytest.fixture
+def Workbook_():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for row in range(1, 6):
+        ws.cell(row, 1, row)
+        ws.cell(row, 2, "abcde"[row - 1])
+    return wb
+
+
+class TestEvaluator:
+
+    @pytest.mark.parametrize("formula, expected", [
+        ("=1+2*3", 7),
+        ("=-2^2", 4),
+        ("=10%", 0.1),
+        ('="a"&1', "a1"),
+        ('="A"="a"', True),
+        ("=0.1+0.2=0.3", True),
+        ("=0.1+0.2>0.3", False),
+        ("=1/0", ExcelError("#DIV/0!")),
+        ("=SUM(A1:A5)", 15),
+        ("=SUM(A:A)", 15),
+        ("=A1:B2", ExcelError("#VALUE!")),
+        ("=VLOOKUP(3,A1:B5,2,FALSE)", "c"),
+        ("=INDEX(B1:B5,MATCH(4,A1:A5,0))", "d"),
+        ('=IF(A1>0,"yes",1/0)', "yes"),
+        ("=IFERROR(1/0,-1)", -1),
+        ("=UNKNOWN(1)", ExcelError("#NAME?")),
+        ("=ABS(1,2)", ExcelError("#VALUE!")),
+        ("=PI(1)", ExcelError("#VALUE!")),
+        ('=TEXT(1234.5,"#,##0.00")', "1,234.50"),
+        ('=DATEDIF(DATE(2020,1,31),DATE(2021,3,1),"M")', 13),
+        ("=Missing!A1", ExcelError("#REF!")),
+        ("=B1", "a"),
+        ("=C1", 0),
+    ])
+    def test_evaluate_formula(self, Evaluator, Workbook_, formula, expected):
+        ev = Evaluator(Workbook_)
+        assert ev.evaluate_formula(formula, Workbook_.active) == expected
+
+
+    def test_implicit_intersection(self, Evaluator, Workbook_):
+        ws = Workbook_.active
+        ev = Evaluator(Workbook_)
+        assert ev.evaluate_formula("=A1:A5*2", ws, row=3, column=3) == 6
+
+
+    def test_dates(self, Evaluator, Workbook_):
+        ws = Workbook_.active
+        ws["C1"] = datetime.date(2020, 1, 31)
+        ws["C2"] = "=EDATE(C1,1)"
+        ws["C3"] = "=DAY(C2)"
+        ev = Evaluator(Workbook_)
+        assert ev.evaluate(ws["C2"]) == 43890
+        assert ev.evaluate(ws["C3"]) == 29
+
+
+    def test_function_error(self, Evaluator, Workbook_, monkeypatch):
+        from ..functions import FUNCTIONS, function
+        monkeypatch.setitem(FUNCTIONS, "BROKEN", None)
+
+        @function("BROKEN")
+        def BROKEN(value):
+            return value + "a"
+
+        ev = Evaluator(Workbook_)
+        with pytest.raises(TypeError):
+            ev.evaluate_formula("=BROKEN(1)", Workbook_.active)
+
+
+    def test_defined_names(self, Evaluator, Workbook_):
+        ws = Workbook_.active
+        Workbook_.defined_names.append(DefinedName("rate", attr_text="0.5"))
+        Workbook_.defined_names.append(DefinedName("values", attr_text="Data!$A$1:$A$5"))
+        Workbook_.defined_names.append(DefinedName("rate", attr_text="2", localSheetId=0))
+        ev = Evaluator(Workbook_)
+        assert ev.evaluate_formula("=SUM(Values)*RATE", ws) == 30
+
+
+    def test_other_sheet(self, Evaluator, Workbook_):
+        other = Workbook_.create_sheet("Other Sheet")
+        other["A1"] = "=SUM(Data!A1:A2)"
+        ws = Workbook_.active
+        ws["C1"] = "='Other Sheet'!A1*10"
+        ev = Evaluator(Workbook_)
+        assert ev.evaluate(ws["C1"]) == 30
+
+
+    def test_long_chain(self, Evaluator, Workbook_):
+        ws = Workbook_.create_sheet()
+        ws["A1"] = 1
+        for row in range(2, 5001):
+            ws.cell(row, 1, "=A{0}+1".format(row - 1))
+        ev = Evaluator(Workbook_)
+        assert ev.evaluate(ws["A5000"]) == 5000
+
+
+    def test_circular(self, Evaluator, Workbook_):
+        ws = Workbook_.active
+        ws["C1"] = "=C2+1"
+        ws["C2"] = "=C1+1"
+        ev = Evaluator(Workbook_)
+        with pytest.warns(UserWarning):
+            assert ev.evaluate(ws["C1"]) == 1
+
+
+    def test_calculate(self, Evaluator, Workbook_):
+        ws = Workbook_.active
+        ws["C1"] = "=C2*2"
+        ws["C2"] = "=SUM(A1:A5)"
+        Evaluator(Workbook_).calculate()
+        assert ws["C1"].cached_value == 30
+        assert ws["C2"].cached_value == 15
+        ws["C1"] = "=1"
+        assert ws["C1"].cached_value is None
@@ -0,0 +1,161 @@
+# Copyright (c) 2010-2021 openpyxl
+
+import pytest
+
+from ..errors import ExcelError, FormulaError
+
+
+@pytest.fixture
+def RangeValue():
+    from ..functions import RangeValue
+    return RangeValue
+
+
+@pytest.fixture
+def FUNCTIONS():
+    from ..functions import FUNCTIONS
+    return FUNCTIONS
+
+
+@pytest.fixture
+def evaluator():
+    from openpyxl import Workbook
+    from ..evaluator import Evaluator
+    return Evaluator(Workbook())
+
+
+class TestAggregates:
+
+    def test_sum(self, FUNCTIONS, RangeValue):
+        rng = RangeValue([[1, "a"], [True, 2.5], [None, 3]])
+        assert FUNCTIONS["SUM"](rng, "2", True) == 9.5
+
+
+    def test_error(self, FUNCTIONS, RangeValue):
+        rng = RangeValue([[1], [ExcelError("#N/A")]])
+        with pytest.raises(FormulaError):
+            FUNCTIONS["SUM"](rng)
+
+
+    @pytest.mark.parametrize("criteria, expected", [
+        (">2", 2),
+        ("<>3", 4),
+        ("b*", 1),
+        ("", 1),
+        (3, 1),
+    ])
+    def test_countif(self, FUNCTIONS, RangeValue, criteria, expected):
+        rng = RangeValue([[1, 3, 4, "Bob", None]])
+        assert FUNCTIONS["COUNTIF"](rng, criteria) == expected
+
+
+    def test_sumifs(self, FUNCTIONS, RangeValue):
+        amounts = RangeValue([[10], [20], [30]])
+        names = RangeValue([["a"], ["b"], ["a"]])
+        sizes = RangeValue([[1], [2], [3]])
+        assert FUNCTIONS["SUMIFS"](amounts, names, "A", sizes, ">1") == 30
+
+
+class TestMaths:
+
+    @pytest.mark.parametrize("number, digits, expected", [
+        (2.5, 0, 3),
+        (-2.5, 0, -3),
+        (1.005, 2, 1.01),
+        (1234, -2, 1200),
+    ])
+    def test_round(self, FUNCTIONS, number, digits, expected):
+        assert FUNCTIONS["ROUND"](number, digits) == expected
+
+
+    def test_mod(self, FUNCTIONS):
+        assert FUNCTIONS["MOD"](-3, 2) == 1
+
+
+class TestLookup:
+
+    def test_vlookup(self, FUNCTIONS, RangeValue):
+        table = RangeValue([[1, "a"], [5, "b"], [10, "c"]])
+        assert FUNCTIONS["VLOOKUP"](7, table, 2) == "b"
+        assert FUNCTIONS["VLOOKUP"](10, table, 2, False) == "c"
+        with pytest.raises(FormulaError):
+            FUNCTIONS["VLOOKUP"](7, table, 2, False)
+
+
+    def test_match(self, FUNCTIONS, RangeValue):
+        rng = RangeValue([["apple", "Banana", "cherry"]])
+        assert FUNCTIONS["MATCH"]("banana", rng, 0) == 2
+        assert FUNCTIONS["MATCH"]("c*", rng, 0) == 3
+
+
+    def test_index(self, FUNCTIONS, RangeValue):
+        rng = RangeValue([[1, 2], [3, 4]])
+        assert FUNCTIONS["INDEX"](rng, 2, 1) == 3
+        assert FUNCTIONS["INDEX"](rng, 0, 2) == RangeValue([[2], [4]])
+
+
+class TestText:
+
+    @pytest.mark.parametrize("value, expected", [
+        (1.0, "1"),
+        (0.1, "0.1"),
+        (True, "TRUE"),
+        (None, ""),
+    ])
+    def test_concatenate(self, FUNCTIONS, value, expected):
+        assert FUNCTIONS["CONCATENATE"](value) == expected
+
+
+    def test_substitute(self, FUNCTIONS):
+        assert FUNCTIONS["SUBSTITUTE"]("a-b-c", "-", "+", 2) == "a-b+c"
+
+
+    def test_search(self, FUNCTIONS):
+        assert FUNCTIONS["SEARCH"]("B?D", "abcde") == 2
+
+
+    @pytest.mark.parametrize("value, fmt, expected", [
+        (1234567.891, "#,##0.00", "1,234,567.89"),
+        (0.256, "0.0%", "25.6%"),
+        (-5, "0", "-5"),
+        (-5, "0;(0)", "(5)"),
+        (0, '0;-0;"zero"', "zero"),
+        (5, "000", "005"),
+        (0.5, "#.##", ".5"),
+        (1.005, "0.00", "1.01"),
+        (12345, "0.00E+00", "1.23E+04"),
+        (1234567, '#,##0,"K"', "1,235K"),
+        (5551234, "000-0000", "555-1234"),
+        (1.5, "General", "1.5"),
+        ("12", "0.0", "12.0"),
+        ("abc", "0.00", "abc"),
+        ("abc", '0;0;0;"<"@">"', "<abc>"),
+        (44197.75, "yyyy-mm-dd hh:mm", "2021-01-01 18:00"),
+        (44197.75, "d mmm yy h:mm AM/PM", "1 Jan 21 6:00 PM"),
+        (44197, "dddd, mmmm d", "Friday, January 1"),
+        (0.99999, "mm:ss", "59:59"),
+    ])
+    def test_text(self, FUNCTIONS, evaluator, value, fmt, expected):
+        assert FUNCTIONS["TEXT"](evaluator, value, fmt) == expected
+
+
+class TestDates:
+
+    @pytest.mark.parametrize("unit, expected", [
+        ("Y", 1),
+        ("M", 13),
+        ("D", 395),
+        ("YM", 1),
+        ("MD", -2),
+        ("YD", 29),
+    ])
+    def test_datedif(self, FUNCTIONS, evaluator, unit, expected):
+        # 2020-01-31 and 2021-03-01
+        assert FUNCTIONS["DATEDIF"](evaluator, 43861, 44256, unit) == expected
+
+
+    def test_datedif_invalid(self, FUNCTIONS, evaluator):
+        with pytest.raises(FormulaError):
+            FUNCTIONS["DATEDIF"](evaluator, 44256, 43861, "D")
+        with pytest.raises(FormulaError):
+            FUNCTIONS["DATEDIF"](evaluator, 43861, 44256, "W")
@@ -0,0 +1,79 @@
+# Copyright (c) 2010-2021 openpyxl
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+
+@pytest.fixture
+def DependencyGraph():
+    from ..graph import DependencyGraph
+    return DependencyGraph
+
+
+@pytest.fixture
+def Workbook_():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Inputs"
+    for row in range(1, 4):
+        ws.cell(row, 1, row)
+    ws["B1"] = "=A1*2"
+    ws["B2"] = "=SUM(A1:A3)"
+    ws["B3"] = "=B2+rate"
+    ws["B4"] = "=SUM(1:1)"
+    other = wb.create_sheet("Outputs")
+    other["A1"] = "=Inputs!B3*10"
+    other["A2"] = "=Inputs!A3"
+    wb.defined_names.append(DefinedName("rate", attr_text="Inputs!$C$1"))
+    return wb
+
+
+class TestDependencyGraph:
+
+    def test_dependents(self, DependencyGraph, Workbook_):
+        ws = Workbook_["Inputs"]
+        graph = DependencyGraph(Workbook_)
+        cells = sorted(c.coordinate for c in graph.dependents(ws["A1"]))
+        assert cells == ["B1", "B2", "B4"]
+        assert sorted(c.coordinate for c in graph.dependents(ws["C1"])) == ["B3", "B4"]
+        assert graph.precedents(ws["B2"]) == [(ws, 1, 1, 1, 3)]
+
+
+    def test_set_value(self, DependencyGraph, Workbook_):
+        ws = Workbook_["Inputs"]
+        out = Workbook_["Outputs"]
+        graph = DependencyGraph(Workbook_)
+        assert graph.value(out["A1"]) == 60
+        assert graph.value(out["A2"]) == 3
+
+        graph.set_value(ws["A2"], 12)
+        keys = set((s.title, r, c) for s, r, c in graph.dirty)
+        assert keys == set([("Inputs", 2, 2), ("Inputs", 3, 2), ("Outputs", 1, 1)])
+        assert graph.value(out["A1"]) == 160
+        assert graph.recalculate() == 3
+        assert out["A1"].cached_value == 160
+        assert out["A2"].cached_value is None
+
+
+    def test_defined_name(self, DependencyGraph, Workbook_):
+        ws = Workbook_["Inputs"]
+        out = Workbook_["Outputs"]
+        graph = DependencyGraph(Workbook_)
+        graph.set_value(ws["C1"], 4)
+        assert graph.value(out["A1"]) == 100
+
+
+    def test_change_formula(self, DependencyGraph, Workbook_):
+        ws = Workbook_["Inputs"]
+        graph = DependencyGraph(Workbook_)
+        graph.set_value(ws["B1"], "=A3*2")
+        assert graph.value(ws["B1"]) == 6
+        assert graph.value(ws["B4"]) == 7
+        graph.set_value(ws["A3"], 5)
+        assert graph.value(ws["B1"]) == 10
+        assert graph.value(ws["B4"]) == 11
+        graph.set_value(ws["A1"], 2)
+        assert ws.cell(1, 2) not in graph.dependents(ws["A1"])
+        assert graph.value(ws["B4"]) == 12
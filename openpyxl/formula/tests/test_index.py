@@ -0,0 +1,103 @@
+# Copyright (c) 2010-2021 openpyxl
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.cell_range import CellRange
+
+
+@pytest.fixture
+def Workbook_():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for row in range(1, 11):
+        ws.cell(row=row, column=2, value=row)
+    report = wb.create_sheet("Report")
+    report["A1"] = "=SUM(Data!B2:B5)"
+    report["A2"] = "=Data!B7*2"
+    report["A3"] = "=SUM('Data'!A:Z)+total"
+    report["A4"] = "=A1+A2"
+    report["A5"] = '="Data!B3"'
+    ws["C1"] = "=SUM(B1:B10)"
+    wb.defined_names.append(DefinedName("total", attr_text="Data!$B$10"))
+    return wb
+
+
+@pytest.mark.parametrize("ref, expected",
+                         [
+                             ("Data!B3", ["C1", "Report!A1", "Report!A3"]),
+                             ("Data!B7", ["C1", "Report!A2", "Report!A3"]),
+                             ("Data!B10", ["C1", "Report!A3"]),
+                             ("Data!B6:B20", ["C1", "Report!A2", "Report!A3"]),
+                             ("Data!AA1", []),
+                             ("Report!A1:A2", ["Report!A4"]),
+                             ("'Report'!1:1", ["Report!A4"]),
+                         ]
+                         )
+def test_referencing(Workbook_, ref, expected):
+    cells = Workbook_.formula_index.referencing(ref)
+    found = [c.coordinate if c.parent.title == "Data"
+             else "{0}!{1}".format(c.parent.title, c.coordinate) for c in cells]
+    assert found == expected
+
+
+def test_referencing_host(Workbook_):
+    wb = Workbook_
+    index = wb.formula_index
+    assert index.referencing("A1", wb["Report"]) == [wb["Report"]["A4"]]
+    assert index.referencing(CellRange("A1", title="Report")) == [wb["Report"]["A4"]]
+    with pytest.raises(ValueError):
+        index.referencing("A1")
+    with pytest.raises(ValueError):
+        index.referencing("Data!total")
+    with pytest.raises(KeyError):
+        index.referencing("Missing!A1")
+
+
+def test_precedents(Workbook_):
+    report = Workbook_["Report"]
+    index = Workbook_.formula_index
+    assert [r.coord for r in index.precedents(report["A3"])] == [
+        "A1:Z1048576", "B10"]
+    assert index.precedents(report["A4"]) == [
+        CellRange("A1", title="Report"), CellRange("A2", title="Report")]
+    assert index.precedents(report["A5"]) == []
+
+
+def test_set_value(Workbook_):
+    wb = Workbook_
+    ws, report = wb["Data"], wb["Report"]
+    index = wb.formula_index
+    assert index.referencing("Data!B7") == [ws["C1"], report["A2"], report["A3"]]
+    report["A2"] = "=Data!B8"
+    ws["C1"] = 42
+    assert index.referencing("Data!B7") == [report["A3"]]
+    assert index.referencing("Data!B8") == [report["A2"], report["A3"]]
+    assert index.precedents(ws["C1"]) == []
+    report["B1"] = "=Data!B7"
+    assert index.referencing("Data!B7") == [report["B1"], report["A3"]]
+
+
+def test_reset_on_move(Workbook_):
+    wb = Workbook_
+    report = wb["Report"]
+    index = wb.formula_index
+    assert index.referencing("Data!B3")[1:] == [report["A1"], report["A3"]]
+    report.insert_rows(1)
+    assert index.referencing("Data!B3")[1:] == [report["A2"], report["A4"]]
+    del report["A2"]
+    assert index.referencing("Data!B3")[1:] == [report["A4"]]
+
+
+def test_wide_ranges():
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = "=SUM(B1:ZZ5)"
+    ws["A2"] = "=SUM(B:XFD)"
+    index = wb.formula_index
+    assert index.referencing("Sheet!CC3") == [ws["A1"], ws["A2"]]
+    assert index.referencing("Sheet!CC30") == [ws["A2"]]
+    ws["A1"] = None
+    assert index.referencing("Sheet!CC3") == [ws["A2"]]
@@ -0,0 +1,85 @@
+# Copyright (c) 2010-2021 openpyxl
+
+import pytest
+
+from ..errors import ExcelError
+from ..parser import (
+    Literal,
+    Reference,
+    Name,
+    UnaryOp,
+    BinaryOp,
+    Function,
+    Array,
+)
+
+
+@pytest.fixture
+def parse():
+    from ..parser import parse
+    return parse
+
+
+class TestParser:
+
+    @pytest.mark.parametrize("formula, expected", [
+        ("=1", Literal(1)),
+        ("=1.5", Literal(1.5)),
+        ('="a""b"', Literal('a"b')),
+        ("=TRUE", Literal(True)),
+        ("=#N/A", Literal(ExcelError("#N/A"))),
+    ])
+    def test_literal(self, parse, formula, expected):
+        assert parse(formula) == expected
+
+
+    @pytest.mark.parametrize("formula, expected", [
+        ("=1+2*3", BinaryOp("+", Literal(1), BinaryOp("*", Literal(2), Literal(3)))),
+        ("=(1+2)*3", BinaryOp("*", BinaryOp("+", Literal(1), Literal(2)), Literal(3))),
+        ("=1-2-3", BinaryOp("-", BinaryOp("-", Literal(1), Literal(2)), Literal(3))),
+        ("=-2^2", BinaryOp("^", UnaryOp("-", Literal(2)), Literal(2))),
+        ("=50%", UnaryOp("%", Literal(50))),
+        ('=1&"a"=1', BinaryOp("=", BinaryOp("&", Literal(1), Literal("a")), Literal(1))),
+    ])
+    def test_operators(self, parse, formula, expected):
+        assert parse(formula) == expected
+
+
+    def test_reference(self, parse):
+        ref = parse("='My ''Sheet'''!$B$2:A10")
+        assert ref.sheet == "My 'Sheet'"
+        assert (ref.min_col, ref.min_row, ref.max_col, ref.max_row) == (1, 2, 2, 10)
+
+        col = parse("=C:A")
+        assert (col.min_col, col.min_row, col.max_col, col.max_row) == (1, None, 3, None)
+
+
+    def test_name(self, parse):
+        assert parse("=Sheet1!rate") == Name("Sheet1", "rate")
+        assert parse("=XFE1") == Name(None, "XFE1")
+
+
+    def test_function(self, parse):
+        tree = parse("=_xlfn.IFNA(SUM(A1, ,2),)")
+        assert tree == Function("IFNA", [
+            Function("SUM", [Reference(None, "A1", 1, 1, 1, 1), Literal(None), Literal(2)]),
+            Literal(None)
+        ])
+        assert parse("=PI()") == Function("PI", [])
+
+
+    def test_array(self, parse):
+        assert parse("={1,2;3,4}") == Array([[Literal(1), Literal(2)], [Literal(3), Literal(4)]])
+
+
+    @pytest.mark.parametrize("formula", ["1+2", "=1+", "=SUM(1 2)", "=(1"])
+    def test_invalid(self, parse, formula):
+        from ..parser import ParseError
+        with pytest.raises(ParseError):
+            parse(formula)
+
+
+    def test_intersection(self, parse):
+        from ..parser import ParseError
+        with pytest.raises(ParseError, match="intersection"):
+            parse("=SUM(A1:B2 B1:C3)")
@@ -0,0 +1,132 @@
+# Copyright (c) 2010-2021 openpyxl
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+
+@pytest.fixture
+def ReferenceRewriter():
+    from ..rewrite import ReferenceRewriter
+    return ReferenceRewriter
+
+
+@pytest.fixture
+def Workbook_():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws["A1"] = "=SUM(B2:B10)+$C$5+Data!D3+'Report'!A5"
+    ws["A2"] = "=B5"
+    ws["A3"] = '=IF(A1>0,"B5",SUM(A:A,3:7))'
+    other = wb.create_sheet("Report")
+    other["A1"] = "=Data!B7+A7+[1]Data!B7"
+    wb.defined_names.append(DefinedName("rng", attr_text="Data!$B$2:$B$10"))
+    return wb
+
+
+def test_references():
+    from ..rewrite import references
+    formula = '=SUM(A1:B2,  "C3")+Sheet1!C4*rate'
+    spans = references(formula)
+    assert [formula[start:end] for start, end in spans] == [
+        "A1:B2", "Sheet1!C4", "rate"]
+    assert references("=A11+B22") == ((1, 4), (5, 8))
+    assert references("text") == ()
+
+
+@pytest.mark.parametrize("change, formula, expected",
+                         [
+                             (("insert_rows", 5, 2), "=A4+A5", "=A4+A7"),
+                             (("insert_rows", 5, 2), "=SUM($A$1:$A$9)", "=SUM($A$1:$A$11)"),
+                             (("delete_rows", 5, 2), "=SUM(A1:A9)", "=SUM(A1:A7)"),
+                             (("delete_rows", 5, 2), "=SUM(A5:A9)", "=SUM(A5:A7)"),
+                             (("delete_rows", 5, 2), "=A5*2", "=#REF!*2"),
+                             (("delete_rows", 5, 2), "=SUM(A5:A6)", "=SUM(#REF!)"),
+                             (("insert_cols", 2, 1), "=A1+B1+1:1", "=A1+C1+1:1"),
+                             (("delete_cols", 2, 1), "=SUM(A:C)", "=SUM(A:B)"),
+                             (("insert_rows", 1, 1), "=Other!A1", "=Other!A1"),
+                             (("insert_rows", 1, 1), '="A1"&rate', '="A1"&rate'),
+                         ]
+                         )
+def test_rewrite(ReferenceRewriter, change, formula, expected):
+    rewriter = ReferenceRewriter(Workbook())
+    method, idx, amount = change
+    getattr(rewriter, method)("Data", idx, amount)
+    assert rewriter.rewrite(formula, "Data") == expected
+
+
+@pytest.mark.parametrize("new, expected",
+                         [
+                             ("Inputs", "=Inputs!A1+Inputs!rate"),
+                             ("My Data", "='My Data'!A1+'My Data'!rate"),
+                             ("A1", "='A1'!A1+'A1'!rate"),
+                         ]
+                         )
+def test_rename(ReferenceRewriter, new, expected):
+    rewriter = ReferenceRewriter(Workbook())
+    rewriter.rename_sheet("data", new)
+    assert rewriter.rewrite("=Data!A1+Data!rate", "Other") == expected
+
+
+@pytest.mark.parametrize("formula, expected",
+                         [
+                             ("=Data!B5*2", "='My Data'!#REF!*2"),
+                             ("=SUM(Data!B5)", "=SUM('My Data'!#REF!)"),
+                         ]
+                         )
+def test_delete_then_rename(ReferenceRewriter, formula, expected):
+    rewriter = ReferenceRewriter(Workbook())
+    rewriter.delete_rows("Data", 4, 3)
+    rewriter.rename_sheet("Data", "My Data")
+    assert rewriter.rewrite(formula, "Other") == expected
+
+
+class TestReferenceRewriter:
+
+    def test_apply(self, ReferenceRewriter, Workbook_):
+        wb = Workbook_
+        ws = wb["Data"]
+        rewriter = ReferenceRewriter(wb)
+        rewriter.delete_rows(ws, 5, 2)
+        rewriter.rename_sheet("Data", "My Data")
+        assert rewriter.apply() == 5
+
+        assert ws["A1"].value == "=SUM(B2:B8)+#REF!+'My Data'!D3+'Report'!A5"
+        assert ws["A2"].value == "=#REF!"
+        assert ws["A3"].value == '=IF(A1>0,"B5",SUM(A:A,3:5))'
+        assert wb["Report"]["A1"].value == "='My Data'!B5+A7+[1]Data!B7"
+        assert wb.defined_names.definedName[0].attr_text == "'My Data'!$B$2:$B$8"
+        assert rewriter.changes == []
+
+
+    def test_apply_index(self, ReferenceRewriter, Workbook_):
+        wb = Workbook_
+        ws = wb["Data"]
+        report = wb["Report"]
+        report["B1"] = "=rng"
+        ws.insert_rows(1, 2)
+        rewriter = ReferenceRewriter(wb)
+        rewriter.insert_rows(ws, 1, 2)
+        index = wb.formula_index
+        assert index.referencing("Data!B7:B9") == [ws["A3"], ws["A5"],
+                                                   report["A1"], report["B1"]]
+        assert index.referencing("Data!B11") == []
+        rewriter.apply()
+        assert index.referencing("Data!B7:B9") == [ws["A3"], ws["A4"], ws["A5"],
+                                                   report["A1"], report["B1"]]
+        assert index.referencing("Report!A1") == []
+        assert index.referencing("Data!B11") == [ws["A3"], report["B1"]]
+
+
+    def test_renamed_host(self, ReferenceRewriter, Workbook_):
+        wb = Workbook_
+        ws = wb["Data"]
+        ws.title = "Inputs"
+        rewriter = ReferenceRewriter(wb)
+        rewriter.rename_sheet("Data", "Inputs")
+        rewriter.insert_rows("Inputs", 1)
+        rewriter.apply()
+        assert ws["A2"].value == "=B6"
+        assert wb["Report"]["A1"].value == "=Inputs!B8+A7+[1]Data!B7"
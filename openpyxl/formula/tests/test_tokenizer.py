@@ -27,6 +27,147 @@ ARG = "ARG"
 ROW = "ROW"
 
 
+PARSE_CASES = [
+    ('=IF(A$3<40%,"",INDEX(Pipeline!B$4:B$138,#REF!))',
+     [('IF(', FUNC, OPEN),
+      ('A$3', OPERAND, RANGE),
+      ('<', OP_IN, ""),
+      ('40', OPERAND, NUMBER),
+      ('%', OP_POST, ""),
+      (',', SEP, ARG),
+      ('""', OPERAND, TEXT),
+      (',', SEP, ARG),
+      ('INDEX(', FUNC, OPEN),
+      ('Pipeline!B$4:B$138', OPERAND, RANGE),
+      (',', SEP, ARG),
+      ('#REF!', OPERAND, ERROR),
+      (')', FUNC, CLOSE),
+      (')', FUNC, CLOSE)]),
+
+    ("='Summary slices'!$C$3",
+     [("'Summary slices'!$C$3", OPERAND, RANGE)]),
+
+    ('=-MAX(Pipeline!AA4:AA138)',
+     [("-", OP_PRE, ""),
+      ('MAX(', FUNC, OPEN),
+      ('Pipeline!AA4:AA138', OPERAND, RANGE),
+      (')', FUNC, CLOSE)]),
+
+    ('=TEXT(-S7/1000,"$#,##0""M""")',
+     [('TEXT(', FUNC, OPEN),
+      ('-', OP_PRE, ""),
+      ('S7', OPERAND, RANGE),
+      ('/', OP_IN, ""),
+      ('1000', OPERAND, NUMBER),
+      (',', SEP, ARG),
+      ('"$#,##0""M"""', OPERAND, TEXT),
+      (')', FUNC, CLOSE)]),
+
+    ("=IF(A$3<1.3E-8,\"\",IF(ISNA('External Ref'!K7)," +
+     '"N/A",TEXT(K7*1E+12,"0")&"bp"',
+     [('IF(', FUNC, OPEN),
+      ('A$3', OPERAND, RANGE),
+      ('<', OP_IN, ""),
+      ('1.3E-8', OPERAND, NUMBER),
+      (',', SEP, ARG),
+      ('""', OPERAND, TEXT),
+      (',', SEP, ARG),
+      ('IF(', FUNC, OPEN),
+      ('ISNA(', FUNC, OPEN),
+      ("'External Ref'!K7", OPERAND, RANGE),
+      (')', FUNC, CLOSE),
+      (',', SEP, ARG),
+      ('"N/A"', OPERAND, TEXT),
+      (',', SEP, ARG),
+      ('TEXT(', FUNC, OPEN),
+      ('K7', OPERAND, RANGE),
+      ('*', OP_IN, ""),
+      ('1E+12', OPERAND, NUMBER),
+      (',', SEP, ARG),
+      ('"0"', OPERAND, TEXT),
+      (')', FUNC, CLOSE),
+      ('&', OP_IN, ""),
+      ('"bp"', OPERAND, TEXT)]),
+
+    ('=+IF(A$3<>$B7,"",(MIN(IF({TRUE, FALSE;1,2},A6:B6,$S7))>=' +
+     'LOWER_BOUND)*($BR6>$S72123))',
+     [("+", OP_PRE, ""),
+      ('IF(', FUNC, OPEN),
+      ('A$3', OPERAND, RANGE),
+      ('<>', OP_IN, ""),
+      ('$B7', OPERAND, RANGE),
+      (',', SEP, ARG),
+      ('""', OPERAND, TEXT),
+      (',', SEP, ARG),
+      ('(', PAREN, OPEN),
+      ('MIN(', FUNC, OPEN),
+      ('IF(', FUNC, OPEN),
+      ('{', ARRAY, OPEN),
+      ('TRUE', OPERAND, LOGICAL),
+      (',', SEP, ARG),
+      (' ', WSPACE, ''),
+      ('FALSE', OPERAND, LOGICAL),
+      (';', SEP, ROW),
+      ('1', OPERAND, NUMBER),
+      (',', SEP, ARG),
+      ('2', OPERAND, NUMBER),
+      ('}', ARRAY, CLOSE),
+      (',', SEP, ARG),
+      ('A6:B6', OPERAND, RANGE),
+      (',', SEP, ARG),
+      ('$S7', OPERAND, RANGE ),
+      (')', FUNC, CLOSE),
+      (')', FUNC, CLOSE),
+      ('>=', OP_IN, ''),
+      ('LOWER_BOUND', OPERAND, RANGE),
+      (')', PAREN, CLOSE),
+      ('*', OP_IN, ''),
+      ('(', PAREN, OPEN),
+      ('$BR6', OPERAND, RANGE),
+      ('>', OP_IN, ''),
+      ('$S72123', OPERAND, RANGE),
+      (')', PAREN, CLOSE),
+      (')', FUNC, CLOSE)]),
+
+    ('=(AW$4=$D7)+0%',
+     [('(', PAREN, OPEN),
+      ('AW$4', OPERAND, RANGE),
+      ('=', OP_IN, ''),
+      ('$D7', OPERAND, RANGE),
+      (')', PAREN, CLOSE),
+      ('+', OP_IN, ''),
+      ('0', OPERAND, NUMBER),
+      ('%', OP_POST, '')]),
+
+    ('=$A:$A,$C:$C',
+     [('$A:$A', OPERAND, RANGE),
+      (',', OP_IN, ""),
+      ('$C:$C', OPERAND, RANGE)]),
+
+    ('=3 +1-5',
+     [('3', 'OPERAND', 'NUMBER'),
+      (' ', 'WHITE-SPACE', ''),
+      ('+', 'OPERATOR-INFIX', ''),
+      ('1', 'OPERAND', 'NUMBER'),
+      ('-', 'OPERATOR-INFIX', ''),
+      ('5', 'OPERAND', 'NUMBER')]),
+
+    ("Just text", [("Just text", LITERAL, "")]),
+    ("123.456", [("123.456", LITERAL, "")]),
+    ("31/12/1999", [("31/12/1999", LITERAL, "")]),
+    ("", []),
+
+    ('=A1+\nA2',
+     [('A1', OPERAND, RANGE),
+      ('+', OP_IN, ''),
+      ('\n', WSPACE, ''),
+      ('A2', OPERAND, RANGE)]),
+
+    ('=R[41]C[2]',
+     [('R[41]C[2]', 'OPERAND', 'RANGE')]),
+]
+
+
 class TestTokenizerRegexes(object):
 
     @pytest.mark.parametrize("string, success", [
@@ -103,145 +244,7 @@ class TestTokenizer(object):
         tok = tokenizer.Tokenizer("=abcdefg")
         assert tok.formula == "=abcdefg"
 
-    @pytest.mark.parametrize('formula, tokens', [
-        ('=IF(A$3<40%,"",INDEX(Pipeline!B$4:B$138,#REF!))',
-         [('IF(', FUNC, OPEN),
-          ('A$3', OPERAND, RANGE),
-          ('<', OP_IN, ""),
-          ('40', OPERAND, NUMBER),
-          ('%', OP_POST, ""),
-          (',', SEP, ARG),
-          ('""', OPERAND, TEXT),
-          (',', SEP, ARG),
-          ('INDEX(', FUNC, OPEN),
-          ('Pipeline!B$4:B$138', OPERAND, RANGE),
-          (',', SEP, ARG),
-          ('#REF!', OPERAND, ERROR),
-          (')', FUNC, CLOSE),
-          (')', FUNC, CLOSE)]),
-
-        ("='Summary slices'!$C$3",
-         [("'Summary slices'!$C$3", OPERAND, RANGE)]),
-
-        ('=-MAX(Pipeline!AA4:AA138)',
-         [("-", OP_PRE, ""),
-          ('MAX(', FUNC, OPEN),
-          ('Pipeline!AA4:AA138', OPERAND, RANGE),
-          (')', FUNC, CLOSE)]),
-
-        ('=TEXT(-S7/1000,"$#,##0""M""")',
-         [('TEXT(', FUNC, OPEN),
-          ('-', OP_PRE, ""),
-          ('S7', OPERAND, RANGE),
-          ('/', OP_IN, ""),
-          ('1000', OPERAND, NUMBER),
-          (',', SEP, ARG),
-          ('"$#,##0""M"""', OPERAND, TEXT),
-          (')', FUNC, CLOSE)]),
-
-        ("=IF(A$3<1.3E-8,\"\",IF(ISNA('External Ref'!K7)," +
-         '"N/A",TEXT(K7*1E+12,"0")&"bp"',
-         [('IF(', FUNC, OPEN),
-          ('A$3', OPERAND, RANGE),
-          ('<', OP_IN, ""),
-          ('1.3E-8', OPERAND, NUMBER),
-          (',', SEP, ARG),
-          ('""', OPERAND, TEXT),
-          (',', SEP, ARG),
-          ('IF(', FUNC, OPEN),
-          ('ISNA(', FUNC, OPEN),
-          ("'External Ref'!K7", OPERAND, RANGE),
-          (')', FUNC, CLOSE),
-          (',', SEP, ARG),
-          ('"N/A"', OPERAND, TEXT),
-          (',', SEP, ARG),
-          ('TEXT(', FUNC, OPEN),
-          ('K7', OPERAND, RANGE),
-          ('*', OP_IN, ""),
-          ('1E+12', OPERAND, NUMBER),
-          (',', SEP, ARG),
-          ('"0"', OPERAND, TEXT),
-          (')', FUNC, CLOSE),
-          ('&', OP_IN, ""),
-          ('"bp"', OPERAND, TEXT)]),
-
-        ('=+IF(A$3<>$B7,"",(MIN(IF({TRUE, FALSE;1,2},A6:B6,$S7))>=' +
-         'LOWER_BOUND)*($BR6>$S72123))',
-         [("+", OP_PRE, ""),
-          ('IF(', FUNC, OPEN),
-          ('A$3', OPERAND, RANGE),
-          ('<>', OP_IN, ""),
-          ('$B7', OPERAND, RANGE),
-          (',', SEP, ARG),
-          ('""', OPERAND, TEXT),
-          (',', SEP, ARG),
-          ('(', PAREN, OPEN),
-          ('MIN(', FUNC, OPEN),
-          ('IF(', FUNC, OPEN),
-          ('{', ARRAY, OPEN),
-          ('TRUE', OPERAND, LOGICAL),
-          (',', SEP, ARG),
-          (' ', WSPACE, ''),
-          ('FALSE', OPERAND, LOGICAL),
-          (';', SEP, ROW),
-          ('1', OPERAND, NUMBER),
-          (',', SEP, ARG),
-          ('2', OPERAND, NUMBER),
-          ('}', ARRAY, CLOSE),
-          (',', SEP, ARG),
-          ('A6:B6', OPERAND, RANGE),
-          (',', SEP, ARG),
-          ('$S7', OPERAND, RANGE ),
-          (')', FUNC, CLOSE),
-          (')', FUNC, CLOSE),
-          ('>=', OP_IN, ''),
-          ('LOWER_BOUND', OPERAND, RANGE),
-          (')', PAREN, CLOSE),
-          ('*', OP_IN, ''),
-          ('(', PAREN, OPEN),
-          ('$BR6', OPERAND, RANGE),
-          ('>', OP_IN, ''),
-          ('$S72123', OPERAND, RANGE),
-          (')', PAREN, CLOSE),
-          (')', FUNC, CLOSE)]),
-
-        ('=(AW$4=$D7)+0%',
-         [('(', PAREN, OPEN),
-          ('AW$4', OPERAND, RANGE),
-          ('=', OP_IN, ''),
-          ('$D7', OPERAND, RANGE),
-          (')', PAREN, CLOSE),
-          ('+', OP_IN, ''),
-          ('0', OPERAND, NUMBER),
-          ('%', OP_POST, '')]),
-
-        ('=$A:$A,$C:$C',
-         [('$A:$A', OPERAND, RANGE),
-          (',', OP_IN, ""),
-          ('$C:$C', OPERAND, RANGE)]),
-
-        ('=3 +1-5',
-         [('3', 'OPERAND', 'NUMBER'),
-          (' ', 'WHITE-SPACE', ''),
-          ('+', 'OPERATOR-INFIX', ''),
-          ('1', 'OPERAND', 'NUMBER'),
-          ('-', 'OPERATOR-INFIX', ''),
-          ('5', 'OPERAND', 'NUMBER')]),
-
-        ("Just text", [("Just text", LITERAL, "")]),
-        ("123.456", [("123.456", LITERAL, "")]),
-        ("31/12/1999", [("31/12/1999", LITERAL, "")]),
-        ("", []),
-
-        ('=A1+\nA2',
-         [('A1', OPERAND, RANGE),
-          ('+', OP_IN, ''),
-          ('\n', WSPACE, ''),
-          ('A2', OPERAND, RANGE)]),
-
-        ('=R[41]C[2]',
-         [('R[41]C[2]', 'OPERAND', 'RANGE')]),
-    ])
+    @pytest.mark.parametrize('formula, tokens', PARSE_CASES)
     def test_parse(self, tokenizer, formula, tokens):
         tok = tokenizer.Tokenizer(formula)
         result = [(token.value, token.type, token.subtype)
@@ -684,3 +687,41 @@ class TestToken(object):
                   for token in tok.items]
         assert result == tokens
         assert tok.render() == formula
+
+
+FRAGMENTS = [
+    "A1", "$B$2", "Sheet1!", "'My Sheet'!", "C3:D4", "1:1", "A:A", "1.5E",
+    "2", "0.1", "TRUE", '"text"', '"a""b"', "#REF!", "#N/A", "SUM(", "IF(",
+    "(", ")", "{", "}", ",", ";", "+", "-", "*", "/", "^", "&", "=", "<",
+    ">", "<=", ">=", "<>", "%", " ", "  ", "\n", "[1]", "Table1[[#Data],[Col]]",
+    "name", ":", "'", '"', "[", "!", "#",
+]
+
+
+def _tokens(klass, formula):
+    try:
+        tok = klass(formula)
+    except Exception as e:
+        return type(e)
+    return [(t.value, t.type, t.subtype) for t in tok.items]
+
+
+class TestRegexTokenizer(object):
+
+    @pytest.mark.parametrize('formula, tokens', PARSE_CASES)
+    def test_parse(self, tokenizer, formula, tokens):
+        tok = tokenizer.RegexTokenizer(formula)
+        result = [(token.value, token.type, token.subtype)
+                  for token in tok.items]
+        assert result == tokens
+        assert tok.render() == formula
+
+
+    def test_fuzz(self, tokenizer):
+        import random
+        rand = random.Random(20211019)
+        for i in range(5000):
+            parts = rand.choices(FRAGMENTS, k=rand.randint(1, 12))
+            formula = "=" + "".join(parts)
+            expected = _tokens(tokenizer.Tokenizer, formula)
+            assert _tokens(tokenizer.RegexTokenizer, formula) == expected, formula
@@ -29,6 +29,14 @@ class TestTranslator(object):
         assert trans.row == row
         assert trans.col == col
         assert trans.tokenizer.formula == "=formula"
+        assert trans.tokenizer is trans.tokenizer
+
+
+    def test_get_tokens_copied(self, Translator):
+        tokens = Translator("=A1+1", "A1").get_tokens()
+        tokens[0].value = "B2"
+        assert Translator("=A1+1", "A1").get_tokens()[0].value == "A1"
+        assert Translator("=A1+1", "A1").translate_formula("A2") == "=A2+1"
 
     @pytest.mark.parametrize("formula", [
         '=IF(A$3<40%,"",INDEX(Pipeline!B$4:B$138,#REF!))',
@@ -194,6 +202,8 @@ class TestTranslator(object):
         ("$DEF:$FOV", 25, 25, "$DEF:$FOV"),
         ("HA:$JA", -5, -15, "GL:$JA"),
         ("named1", -33, 33, "named1"),
+        ("Sheet2!named1", 1, 1, "Sheet2!named1"),
+        ("'Sh 1'!A15", -3, 4, "'Sh 1'!E12"),
         ("A15", -3, 4, "E12"),
         ("$AB303", 3, 2, "$AB306"),
         ("YY$101", 4, 2, "ZA$101"),
@@ -222,6 +232,7 @@ class TestTranslator(object):
          '=TEXT(-\'External Ref\'!L8/DENOMINATOR,"$#,##0""M""")'),
         ("=ROWS('Sh 1'!$1:3)+COLUMNS('Sh 2'!$A:C)", "A1", "B2",
          "=ROWS('Sh 1'!$1:4)+COLUMNS('Sh 2'!$A:D)"),
+        ("=Sheet2!rate*A1", "A1", "B2", "=Sheet2!rate*B2"),
         ("Just text", "A1", "B2", "Just text"),
         ("123.456", "A1", "B2", "123.456"),
         ("31/12/1999", "A1", "B2", "31/12/1999"),
@@ -237,3 +248,28 @@ class TestTranslator(object):
         trans = Translator("='Summary slices'!C3", "A1")
         result = trans.translate_formula(row_delta=2, col_delta=3)
         assert result == "='Summary slices'!F5"
+
+
+    @pytest.mark.parametrize("range_str", [
+        "1:1", "$1234:78910", "A:A", "$ABC:AZZ", "named1",
+        "A15", "$AB303", "YY$101", "$ZZ$99", "B2:C3", "'Sh 1'!$ATV25:$BBC35",
+        "A1:named:B$3", "C2:C1",
+    ])
+    @pytest.mark.parametrize("rdelta, cdelta", [(0, 0), (3, 2), (-1, -1), (-100, 0)])
+    def test_template(self, Translator, TranslatorError, range_str, rdelta, cdelta):
+        from ..translate import Template
+        template = Template.from_tokens(Translator("=" + range_str, "A1").get_tokens())
+        try:
+            expected = "=" + Translator.translate_range(range_str, rdelta, cdelta)
+        except TranslatorError:
+            with pytest.raises(TranslatorError):
+                template.translate(rdelta, cdelta)
+        else:
+            assert template.translate(rdelta, cdelta) == expected
+
+
+    def test_shared_template(self, Translator):
+        from ..translate import compile_formula
+        t1 = Translator("=SUM(A1:A5)", "B1")
+        t2 = Translator("=SUM(A1:A5)", "C3")
+        assert t1.template is t2.template is compile_formula("=SUM(A1:A5)")
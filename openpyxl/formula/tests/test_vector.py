@@ -0,0 +1,104 @@
+# Copyright (c) 2010-2021 openpyxl
+
+import pytest
+
+from openpyxl import Workbook
+
+
+@pytest.mark.parametrize("formula, row, expected", [
+    ("=A1*2+$B$1", 1, "=AR[0]*2+$B$1"),
+    ("=A5*2+$B$1", 5, "=AR[0]*2+$B$1"),
+    ("=SUM(A$1:A5)&\"A1\"", 5, "=SUM(A$1:AR[0])&\"A1\""),
+    ("='Q1 2'!A3+LOG10(B2)", 3, "='Q1 2'!AR[0]+LOG10(BR[-1])"),
+])
+def test_template(formula, row, expected):
+    from ..vector import template
+    assert template(formula, row) == expected
+
+
+@pytest.fixture
+def Workbook_():
+    wb = Workbook()
+    ws = wb.active
+    ws["Z1"] = 0.5
+    for row in range(1, 21):
+        ws.cell(row, 1, row)
+        ws.cell(row, 2, row % 7)
+        ws.cell(row, 3, "=IF(A{0}>B{0}*3,A{0}*$Z$1,-B{0})+MAX(A{0},2)/4".format(row))
+        ws.cell(row, 4, "=C{0}^2-(A{0}>5)".format(row))
+        ws.cell(row, 5, "=A{0}/(B{0}-1)".format(row))
+    ws["F1"] = "=SUM(D1:D20)"
+    return wb
+
+
+@pytest.mark.numpy_required
+class TestVectorEvaluator:
+
+    def test_find_blocks(self, Workbook_):
+        from ..evaluator import Evaluator
+        from ..vector import find_blocks
+        ws = Workbook_.active
+        ws["C10"] = "=A10"
+        ev = Evaluator(Workbook_)
+        blocks = sorted((b.col, b.min_row, b.max_row) for b in
+                        find_blocks(ws, ev._formula_rows(ws)))
+        assert blocks == [(3, 1, 9), (3, 11, 20), (4, 1, 20), (5, 1, 20)]
+
+
+    def test_calculate(self, Workbook_):
+        from ..evaluator import Evaluator
+        from ..vector import VectorEvaluator
+        expected = Evaluator(Workbook_)
+        expected.calculate()
+
+        ev = Evaluator(Workbook_, vectorise=True)
+        vector = VectorEvaluator(ev)
+        vector.run()
+        ws = Workbook_.active
+        assert (ws, 20, 4) in ev.values
+        assert (ws, 20, 5) not in ev.values # division by zero
+        ev.calculate()
+        assert ev.values == expected.values
+
+
+    @pytest.mark.parametrize("formula",
+                             [
+                                 "=A{0}*4",
+                                 "=A{0}+A{0}",
+                                 "=-A{0}-A{0}",
+                                 "=SUM(A{0},A{0})",
+                                 "=A{0}^2",
+                                 "=INT(A{0}*1.5)",
+                             ]
+                             )
+    def test_overflow(self, formula):
+        from ..evaluator import Evaluator
+        wb = Workbook()
+        ws = wb.active
+        for row in range(1, 21):
+            ws.cell(row=row, column=1, value=2 ** 62 + row)
+            ws.cell(row=row, column=2, value=formula.format(row))
+        expected = Evaluator(wb)
+        expected.calculate()
+        ev = Evaluator(wb, vectorise=True)
+        ev.calculate()
+        assert ev.values == expected.values
+        assert ev.values[(ws, 1, 2)] == expected.values[(ws, 1, 2)]
+
+
+    def test_compare_significant(self):
+        from ..evaluator import Evaluator
+        from ..vector import VectorEvaluator
+        wb = Workbook()
+        ws = wb.active
+        for row in range(1, 21):
+            ws.cell(row=row, column=1, value=row / 10)
+            ws.cell(row=row, column=2, value="=A{0}+0.2=0.3".format(row))
+        ev = Evaluator(wb, vectorise=True)
+        VectorEvaluator(ev).run()
+        assert ev.values[(ws, 1, 2)]
+        assert not ev.values[(ws, 2, 2)]
+        expected = Evaluator(wb)
+        expected.calculate()
+        ev.calculate()
+        assert ev.values == expected.values
@@ -6,6 +6,8 @@ http://ewbi.blogs.com/develops/2004/12/excel_formula_p.html written by Eric
 Bachtal
 """
 
+from functools import lru_cache
+import os
 import re
 
 
@@ -444,3 +446,177 @@ class Token(object):
         assert value in (',', ';')
         subtype = cls.ARG if value == ',' else cls.ROW
         return cls(value, cls.SEP, subtype)
+
+
+class RegexTokenizer(Tokenizer):
+
+    """
+    A tokenizer that finds the parts of a formula with a single regular
+    expression instead of examining one character at a time.
+
+    Operands, operators, separators and subexpressions are handled as they
+    are matched, using the stack of open subexpressions to decide what
+    commas and closing brackets mean. Strings, brackets and errors use the
+    consumers of Tokenizer. The tokens are identical to those of Tokenizer.
+    """
+
+    TOKEN_RE = re.compile(r"""
+    (?P<plain>[^"'\[\#\ \n+\-*/^&=><%{}();,]+)
+    |(?P<comparison>>=|<=|<>)
+    |(?P<sign>[+\-])
+    |(?P<infix>[*/^&=><])
+    |(?P<percent>%)
+    |(?P<function>\()
+    |(?P<closer>[)}])
+    |(?P<comma>,)
+    |(?P<semicolon>;)
+    |(?P<space>\ [\ \n]*)
+    |(?P<newline>\n[\ \n]*)
+    |(?P<array>\{)
+    |(?P<string>["'])
+    |(?P<brackets>\[)
+    |(?P<error>\#)
+    """, re.VERBOSE)
+
+    # operands beginning with these characters cannot be numbers
+    RANGE_START = frozenset("$'!:[_" + "abcdefghjklmopqrstuvwxyz"
+                            "ABCDEFGHJKLMOPQRSTUVWXYZ")
+
+    def _parse(self):
+        """Populate self.items with the tokens from the formula."""
+        if self.offset:
+            return  # Already parsed!
+        if not self.formula:
+            return
+        elif self.formula[0] == '=':
+            self.offset += 1
+        else:
+            self.items.append(Token(self.formula, Token.LITERAL))
+            return
+
+        consumers = {
+            'string': self._parse_string,
+            'brackets': self._parse_brackets,
+            'error': self._parse_error,
+        }
+        formula = self.formula
+        items = self.items
+        token = self.token
+        stack = self.token_stack
+        match = self.TOKEN_RE.match
+        operand = self._make_operand
+        size = len(formula)
+        pos = self.offset
+
+        while pos < size:
+            m = match(formula, pos)
+            kind = m.lastgroup
+            value = m.group()
+
+            if kind == 'plain':
+                token.extend(value)
+                pos = m.end()
+                continue
+
+            if kind == 'sign':
+                if token and self.SN_RE.match("".join(token)):
+                    token.append(value)
+                    pos += 1
+                    continue
+                if token:
+                    items.append(operand("".join(token)))
+                    del token[:]
+                prev = next((i for i in reversed(items)
+                             if i.type != Token.WSPACE), None)
+                if prev is not None and (
+                    prev.subtype == Token.CLOSE
+                    or prev.type == Token.OP_POST
+                    or prev.type == Token.OPERAND):
+                    items.append(Token(value, Token.OP_IN))
+                else:
+                    items.append(Token(value, Token.OP_PRE))
+                pos += 1
+                continue
+
+            if kind in ('comparison', 'infix', 'percent', 'closer',
+                        'comma', 'semicolon', 'space'):
+                # these end the current operand
+                if token:
+                    items.append(operand("".join(token)))
+                    del token[:]
+                if kind == 'percent':
+                    items.append(Token(value, Token.OP_POST))
+                elif kind == 'closer':
+                    opener = stack.pop()
+                    if opener.type == Token.ARRAY:
+                        closer = Token("}", Token.ARRAY, Token.CLOSE)
+                    else:
+                        closer = Token(")", opener.type, Token.CLOSE)
+                    if closer.value != value:
+                        raise TokenizerError(
+                            "Mismatched ( and { pair in '%s'" % formula)
+                    items.append(closer)
+                elif kind == 'comma':
+                    if not stack or stack[-1].type == Token.PAREN:
+                        items.append(Token(",", Token.OP_IN))  # Range Union operator
+                    else:
+                        items.append(Token(",", Token.SEP, Token.ARG))
+                elif kind == 'semicolon':
+                    items.append(Token(";", Token.SEP, Token.ROW))
+                elif kind == 'space':
+                    items.append(Token(" ", Token.WSPACE))
+                else:
+                    items.append(Token(value, Token.OP_IN))
+                pos = m.end()
+                continue
+
+            if kind == 'newline':
+                items.append(Token("\n", Token.WSPACE))
+                pos = m.end()
+                continue
+
+            if kind == 'function':
+                if token:
+                    sub = Token("".join(token) + "(", Token.FUNC, Token.OPEN)
+                    del token[:]
+                else:
+                    sub = Token("(", Token.PAREN, Token.OPEN)
+                items.append(sub)
+                stack.append(sub)
+                pos += 1
+                continue
+
+            self.offset = pos
+            if kind == 'array':
+                self.assert_empty_token()
+                sub = Token("{", Token.ARRAY, Token.OPEN)
+                items.append(sub)
+                stack.append(sub)
+                pos += 1
+            else:
+                pos += consumers[kind]()
+
+        self.offset = pos
+        self.save_token()
+
+    def _make_operand(self, value):
+        if value[0] in self.RANGE_START and value not in ('TRUE', 'FALSE'):
+            return Token(value, Token.OPERAND, Token.RANGE)
+        return Token.make_operand(value)
+
+
+def regex_tokenizer_env_set():
+    return os.environ.get("OPENPYXL_REGEX_TOKENIZER", "False") == "True"
+
+
+# the tokenizer used by tokenize()
+TOKENIZER = RegexTokenizer if regex_tokenizer_env_set() else Tokenizer
+
+
+@lru_cache(maxsize=4096)
+def tokenize(formula):
+    """
+    The tokens of a formula, remembered for the most recently used formulae.
+    The tokens are shared and must not be modified.
+    """
+    return tuple(TOKENIZER(formula).items)
@@ -7,8 +7,9 @@ to identify the parts of the formula that need to change.
 
 """
 
+from functools import lru_cache
 import re
-from .tokenizer import Tokenizer, Token
+from .tokenizer import Tokenizer, Token, tokenize
 from openpyxl.utils import (
     coordinate_to_tuple,
     column_index_from_string,
@@ -47,11 +48,20 @@ class Translator(object):
         # regardless of the calcPr:refMode setting, so I'm assuming the
         # formulae stored in the workbook must be in A1 notation.
         self.row, self.col = coordinate_to_tuple(origin)
-        self.tokenizer = Tokenizer(formula)
+        self.formula = formula
+        self.template = compile_formula(formula)
+        self._tokenizer = None
+
+    @property
+    def tokenizer(self):
+        if self._tokenizer is None:
+            self._tokenizer = Tokenizer(self.formula)
+        return self._tokenizer
 
     def get_tokens(self):
         "Returns a list with the tokens comprising the formula."
-        return self.tokenizer.items
+        # copies, as the tokens of tokenize() are shared
+        return [Token(t.value, t.type, t.subtype) for t in tokenize(self.formula)]
 
     ROW_RANGE_RE = re.compile(r"(\$?[1-9][0-9]{0,6}):(\$?[1-9][0-9]{0,6})$")
     COL_RANGE_RE = re.compile(r"(\$?[A-Za-z]{1,3}):(\$?[A-Za-z]{1,3})$")
@@ -109,29 +119,7 @@ class Translator(object):
                      the worksheet reference. Could also be a named range.
 
         """
-        ws_part, range_str = cls.strip_ws_name(range_str)
-        match = cls.ROW_RANGE_RE.match(range_str)  # e.g. `3:4`
-        if match is not None:
-            return (ws_part + cls.translate_row(match.group(1), rdelta) + ":"
-                    + cls.translate_row(match.group(2), rdelta))
-        match = cls.COL_RANGE_RE.match(range_str)  # e.g. `A:BC`
-        if match is not None:
-            return (ws_part + cls.translate_col(match.group(1), cdelta) + ':'
-                    + cls.translate_col(match.group(2), cdelta))
-        if ':' in range_str: # e.g. `A1:B5`
-            # The check is necessarily general because range references can
-            # have one or both endpoints specified by named ranges. I.e.,
-            # `named_range:C2`, `C2:named_range`, and `name1:name2` are all
-            # valid references. Further, Excel allows chaining multiple
-            # colons together (with unclear meaning)
-            return ws_part + ":".join(
-                cls.translate_range(piece, rdelta, cdelta)
-                for piece in range_str.split(':'))
-        match = cls.CELL_REF_RE.match(range_str)
-        if match is None:  # Must be a named range
-            return range_str
-        return (ws_part + cls.translate_col(match.group(1), cdelta)
-                + cls.translate_row(match.group(2), rdelta))
+        return Template(Template.compile_range(range_str)).translate(rdelta, cdelta)
 
     def translate_formula(self, dest=None, row_delta=0, col_delta=0):
         """
@@ -141,26 +129,157 @@ class Translator(object):
         whose address is `dest` (no worksheet name).
 
         """
-        tokens = self.get_tokens()
+        if dest:
+            row, col = coordinate_to_tuple(dest)
+            row_delta = row - self.row
+            col_delta = col - self.col
+        return self.template.translate(row_delta, col_delta)
+
+
+class Template(object):
+
+    """
+    A formula compiled for translation.
+
+    The formula is split into literal text and the rows and columns of
+    relative references, so that translating it only requires arithmetic on
+    the references.
+    """
+
+    __slots__ = ("parts", "_rows")
+
+    ROW = 1
+    COL = 2
+
+    def __init__(self, parts):
+        self.parts = parts
+        self._rows = None
+
+    @classmethod
+    def from_tokens(cls, tokens):
         if not tokens:
-            return ""
+            return cls([])
         elif tokens[0].type == Token.LITERAL:
-            return tokens[0].value
-        out = ['=']
+            return cls([tokens[0].value])
+        parts = ['=']
         # per the spec:
         # A compliant producer or consumer considers a defined name in the
         # range A1-XFD1048576 to be an error. All other names outside this
         # range can be defined as names and overrides a cell reference if an
         # ambiguity exists. (I.18.2.5)
-        if dest:
-            row, col = coordinate_to_tuple(dest)
-            row_delta = row - self.row
-            col_delta = col - self.col
         for token in tokens:
             if (token.type == Token.OPERAND
                 and token.subtype == Token.RANGE):
-                out.append(self.translate_range(token.value, row_delta,
-                                                col_delta))
+                parts.extend(cls.compile_range(token.value))
+            else:
+                parts.append(token.value)
+
+        # merge consecutive text
+        merged = []
+        for part in parts:
+            if isinstance(part, str) and merged and isinstance(merged[-1], str):
+                merged[-1] += part
+            else:
+                merged.append(part)
+        return cls(merged)
+
+    @classmethod
+    def compile_row(cls, row_str):
+        if row_str.startswith('$'):
+            return row_str
+        return (cls.ROW, int(row_str))
+
+    @classmethod
+    def compile_col(cls, col_str):
+        if col_str.startswith('$'):
+            return col_str
+        return (cls.COL, column_index_from_string(col_str))
+
+    @classmethod
+    def compile_range(cls, range_str):
+        """
+        The parts of an A1-style range reference. Potentially includes the
+        worksheet reference. Could also be a named range.
+        """
+        ws_part, range_str = Translator.strip_ws_name(range_str)
+        match = Translator.ROW_RANGE_RE.match(range_str)  # e.g. `3:4`
+        if match is not None:
+            return [ws_part, cls.compile_row(match.group(1)), ":",
+                    cls.compile_row(match.group(2))]
+        match = Translator.COL_RANGE_RE.match(range_str)  # e.g. `A:BC`
+        if match is not None:
+            return [ws_part, cls.compile_col(match.group(1)), ":",
+                    cls.compile_col(match.group(2))]
+        if ':' in range_str: # e.g. `A1:B5`
+            # The check is necessarily general because range references can
+            # have one or both endpoints specified by named ranges. I.e.,
+            # `named_range:C2`, `C2:named_range`, and `name1:name2` are all
+            # valid references. Further, Excel allows chaining multiple
+            # colons together (with unclear meaning)
+            parts = [ws_part]
+            for idx, piece in enumerate(range_str.split(':')):
+                if idx:
+                    parts.append(":")
+                parts.extend(cls.compile_range(piece))
+            return parts
+        match = Translator.CELL_REF_RE.match(range_str)
+        if match is None:  # Must be a named range
+            return [ws_part + range_str]
+        return [ws_part, cls.compile_col(match.group(1)),
+                cls.compile_row(match.group(2))]
+
+    def translate(self, row_delta=0, col_delta=0):
+        """
+        The formula moved by a number of rows and columns
+        """
+        if not col_delta:
+            return self.translate_rows(row_delta)
+        out = []
+        for part in self.parts:
+            if part.__class__ is str:
+                out.append(part)
+            elif part[0] == self.ROW:
+                row = part[1] + row_delta
+                if row <= 0:
+                    raise TranslatorError("Formula out of range")
+                out.append(str(row))
             else:
-                out.append(token.value)
+                try:
+                    out.append(get_column_letter(part[1] + col_delta))
+                except ValueError:
+                    raise TranslatorError("Formula out of range")
         return "".join(out)
+
+
+    def translate_rows(self, row_delta):
+        """
+        The formula moved by a number of rows, such as when it is filled down
+        """
+        parts = self._rows
+        if parts is None:
+            text = []
+            rows = []
+            for part in self.parts:
+                if part.__class__ is str:
+                    text.append(part.replace("%", "%%"))
+                elif part[0] == self.COL:
+                    text.append(get_column_letter(part[1]))
+                else:
+                    rows.append(part[1])
+                    text.append("%d")
+            parts = self._rows = ("".join(text), tuple(rows))
+        text, rows = parts
+        if not rows:
+            return text % ()
+        if min(rows) + row_delta <= 0:
+            raise TranslatorError("Formula out of range")
+        return text % tuple([row + row_delta for row in rows])
+
+
+@lru_cache(maxsize=4096)
+def compile_formula(formula):
+    """
+    The translation template of a formula, remembered for the most recently
+    used formulae
+    """
+    return Template.from_tokens(tokenize(formula))
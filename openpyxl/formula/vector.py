@@ -0,0 +1,404 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Evaluate blocks of the same relative formula filled down a column, such as
+shared formulae, as NumPy expressions over whole columns instead of cell by
+cell.
+
+Only numeric formulae built from operators, references to single cells and a
+few functions are vectorised. Any block that cannot be is left to be
+evaluated one cell at a time, so results are always the same.
+"""
+
+from bisect import bisect_left, bisect_right
+import re
+
+import numpy
+
+from .errors import FormulaError
+from .functions import RangeValue, is_number, power_, _significant
+from .parser import (
+    Literal,
+    Reference,
+    Name,
+    UnaryOp,
+    BinaryOp,
+    Function,
+)
+
+
+# blocks shorter than this are not worth vectorising
+MIN_BLOCK = 8
+
+
+REF_RE = re.compile(r"""
+"(?:[^"]|"")*"                     # strings
+|'(?:[^']|'')*'                    # quoted worksheet names
+|(?<![\w.$])(\$?[A-Za-z]{1,3})(\$?)(\d+)(?![\w(!.])
+""", re.VERBOSE)
+
+
+def template(formula, row):
+    """
+    A formula with its relative row numbers replaced by offsets from a row.
+    Formulae filled down a column have the same template.
+    """
+    def offset(m):
+        if m.group(1) is None or m.group(2):
+            return m.group(0)
+        return "{0}R[{1}]".format(m.group(1), int(m.group(3)) - row)
+    return REF_RE.sub(offset, formula)
+
+
+class Block(object):
+    """
+    Consecutive cells in a column with the same relative formula
+    """
+
+    __slots__ = ("ws", "col", "min_row", "max_row", "formula")
+
+    def __init__(self, ws, col, min_row, max_row, formula):
+        self.ws = ws
+        self.col = col
+        self.min_row = min_row
+        self.max_row = max_row
+        self.formula = formula
+
+
+    def __len__(self):
+        return self.max_row - self.min_row + 1
+
+
+def find_blocks(ws, rows_by_column, size=MIN_BLOCK):
+    """
+    Blocks of formulae in a worksheet from the rows with formulae in each
+    column
+    """
+    cells = ws._cells
+    for col, rows in rows_by_column.items():
+        start = previous = key = None
+        for row in rows:
+            formula = cells[(row, col)].value
+            current = template(formula, row)
+            if current == key and row == previous + 1:
+                previous = row
+                continue
+            if key is not None and previous - start + 1 >= size:
+                yield Block(ws, col, start, previous, cells[(start, col)].value)
+            start = previous = row
+            key = current
+        if key is not None and previous - start + 1 >= size:
+            yield Block(ws, col, start, previous, cells[(start, col)].value)
+
+
+class Unsupported(Exception):
+    """
+    A block that cannot be vectorised
+    """
+
+
+ARITHMETIC = {
+    "+": numpy.add,
+    "-": numpy.subtract,
+    "*": numpy.multiply,
+}
+
+COMPARISONS = {
+    "=": numpy.equal,
+    "<>": numpy.not_equal,
+    "<": numpy.less,
+    "<=": numpy.less_equal,
+    ">": numpy.greater,
+    ">=": numpy.greater_equal,
+}
+
+
+def _item(value):
+    if isinstance(value, numpy.generic):
+        return value.item()
+    return value
+
+
+def _compare(op, left, right):
+    """
+    Compare numbers to 15 significant digits, as the scalar evaluator does.
+    Only values close enough to be equal once rounded need to be rounded.
+    """
+    compare = COMPARISONS[op]
+    result = compare(left, right)
+    if not isinstance(result, numpy.ndarray):
+        return compare(_significant(_item(left)), _significant(_item(right)))
+    left, right = numpy.broadcast_arrays(left, right)
+    if left.dtype.kind != "f" and right.dtype.kind != "f":
+        return result
+    with numpy.errstate(invalid="ignore", over="ignore"):
+        close = numpy.abs(left - right) <= 1e-14 * numpy.maximum(
+            numpy.abs(left), numpy.abs(right))
+    for idx in numpy.flatnonzero(close):
+        result.flat[idx] = compare(_significant(left.flat[idx].item()),
+                                   _significant(right.flat[idx].item()))
+    return result
+
+
+def _number(value):
+    """
+    Numbers and empty cells only: booleans and text compare differently
+    """
+    if value is None:
+        return 0
+    if is_number(value):
+        return value
+    raise Unsupported
+
+
+def _numeric(value):
+    """
+    Booleans resulting from comparisons as numbers for arithmetic
+    """
+    if isinstance(value, numpy.ndarray):
+        if value.dtype == numpy.bool_:
+            return value.astype(numpy.int64)
+    elif isinstance(value, (bool, numpy.bool_)):
+        return int(value)
+    return value
+
+
+def _is_bool(value):
+    return (isinstance(value, (bool, numpy.bool_))
+            or isinstance(value, numpy.ndarray) and value.dtype == numpy.bool_)
+
+
+def _array(values):
+    values = [_number(v) for v in values]
+    if all(type(v) is int for v in values):
+        try:
+            return numpy.array(values, dtype=numpy.int64)
+        except OverflowError:
+            raise Unsupported # Python integers are not limited to 64 bits
+    return numpy.array(values, dtype=numpy.float64)
+
+
+INT64_MAX = 2 ** 63 - 1
+
+
+def _magnitude(value):
+    """
+    Largest absolute value of an integer or array of integers, None for
+    floats
+    """
+    if isinstance(value, numpy.ndarray):
+        if value.dtype.kind not in "iu":
+            return
+        if not value.size:
+            return 0
+        return max(abs(int(value.min())), abs(int(value.max())))
+    if isinstance(value, (int, numpy.integer)):
+        return abs(int(value))
+
+
+def _check_overflow(magnitudes, product=False):
+    """
+    Integer arithmetic with NumPy wraps around silently where Python's does
+    not, so blocks whose results might not fit into 64 bits cannot be
+    vectorised
+    """
+    if None in magnitudes:
+        return
+    total = 1 if product else 0
+    for m in magnitudes:
+        if product:
+            total *= m
+        else:
+            total += m
+    if total > INT64_MAX:
+        raise Unsupported
+
+
+class VectorEvaluator(object):
+    """
+    Calculate the blocks of formulae in a workbook for an Evaluator
+    """
+
+    def __init__(self, evaluator):
+        self.evaluator = evaluator
+        self.blocks = {}
+        self._done = set()
+        self._active = set()
+
+
+    def run(self):
+        evaluator = self.evaluator
+        for ws in evaluator.workbook.worksheets:
+            for block in find_blocks(ws, evaluator._formula_rows(ws)):
+                for row in range(block.min_row, block.max_row + 1):
+                    self.blocks[(ws, row, block.col)] = block
+        for block in set(self.blocks.values()):
+            self.calculate(block)
+
+
+    def calculate(self, block):
+        """
+        Store the values of a block, unless it cannot be vectorised
+        """
+        if block in self._done or block in self._active:
+            return
+        self._active.add(block)
+        try:
+            tree = self.evaluator.parse(block.formula)
+            self._prepare(block, tree)
+            values = self._eval(tree, block)
+        except Unsupported:
+            return
+        finally:
+            self._active.discard(block)
+            self._done.add(block)
+
+        if isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        else:
+            values = [values] * len(block)
+        ws, col = block.ws, block.col
+        store = self.evaluator.values
+        for row, value in zip(range(block.min_row, block.max_row + 1), values):
+            store[(ws, row, col)] = value
+
+
+    def _target(self, node, block):
+        """
+        Worksheet, column and first and last rows of a reference over a block
+        """
+        if node.min_col != node.max_col or node.min_row != node.max_row:
+            raise Unsupported
+        ws = self.evaluator._sheet(node.sheet, block.ws)
+        if ws is None:
+            raise Unsupported
+        if "$" in node.ref.lstrip("$").lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"):
+            return ws, node.min_col, node.min_row, node.min_row
+        offset = node.min_row - block.min_row
+        return ws, node.min_col, block.min_row + offset, block.max_row + offset
+
+
+    def _prepare(self, block, tree):
+        """
+        Calculate the formulae a block depends upon
+        """
+        evaluator = self.evaluator
+        for ws, node in evaluator.references(tree, block.ws):
+            if isinstance(node, Reference) and (
+                node.min_col == node.max_col and node.min_row == node.max_row):
+                ws, col, first, last = self._target(node, block)
+            else:
+                # defined names and ranges
+                bounds = evaluator._bounds(node, ws)
+                if bounds[0] != bounds[2]:
+                    raise Unsupported
+                col, first, _, last = bounds
+
+            rows = evaluator._formula_rows(ws).get(col, [])
+            for row in rows[bisect_left(rows, first):bisect_right(rows, last)]:
+                key = (ws, row, col)
+                if key in evaluator.values:
+                    continue
+                other = self.blocks.get(key)
+                if other is block:
+                    raise Unsupported # refers to itself
+                if other is not None:
+                    self.calculate(other)
+                if key not in evaluator.values:
+                    evaluator.evaluate(ws._cells[(row, col)])
+
+
+    def _eval(self, node, block, empty=True):
+        if isinstance(node, Literal):
+            return _number(node.value)
+
+        if isinstance(node, Reference):
+            ws, col, first, last = self._target(node, block)
+            value = self.evaluator._cell_value
+            values = [value(ws, row, col) for row in range(first, last + 1)]
+            if not empty and None in values:
+                raise Unsupported
+            if first == last:
+                return _number(values[0])
+            return _array(values)
+
+        if isinstance(node, Name):
+            value = self.evaluator._value(node, block.ws, block.min_row, block.col)
+            if isinstance(value, RangeValue):
+                if value.height != 1 or value.width != 1:
+                    raise Unsupported
+                value = value.rows[0][0]
+            return _number(value)
+
+        if isinstance(node, UnaryOp):
+            value = _numeric(self._eval(node.operand, block))
+            if node.op == "-":
+                _check_overflow([_magnitude(value)])
+                return -value
+            if node.op == "%":
+                return value / 100
+            return value
+
+        if isinstance(node, BinaryOp):
+            return self._binary(node, block)
+
+        if isinstance(node, Function):
+            return self._call(node, block)
+
+        raise Unsupported
+
+
+    def _binary(self, node, block):
+        left = self._eval(node.left, block)
+        right = self._eval(node.right, block)
+        op = node.op
+        if op in COMPARISONS:
+            if _is_bool(left) or _is_bool(right):
+                raise Unsupported
+            return _compare(op, left, right)
+        left, right = _numeric(left), _numeric(right)
+        if op in ARITHMETIC:
+            if isinstance(left, numpy.ndarray) or isinstance(right, numpy.ndarray):
+                _check_overflow([_magnitude(left), _magnitude(right)], op == "*")
+            return ARITHMETIC[op](left, right)
+        if op == "/":
+            if numpy.any(numpy.equal(right, 0)):
+                raise Unsupported # #DIV/0!
+            return numpy.true_divide(left, right)
+        if op == "^":
+            # elementwise in Python: NumPy's power may differ in the last place
+            left, right = numpy.broadcast_arrays(left, right)
+            try:
+                values = [power_(a, b) for a, b in zip(left.ravel().tolist(),
+                                                      right.ravel().tolist())]
+            except (FormulaError, ArithmeticError):
+                raise Unsupported
+            return _array(values).reshape(left.shape)
+        raise Unsupported
+
+
+    def _call(self, node, block):
+        name = node.name
+        # MIN and MAX ignore empty cells rather than treating them as 0
+        empty = name not in ("MIN", "MAX")
+        args = [_numeric(self._eval(arg, block, empty)) for arg in node.args]
+        if name == "IF" and len(args) == 3:
+            return numpy.where(numpy.not_equal(args[0], 0), args[1], args[2])
+        if name == "ABS" and len(args) == 1:
+            _check_overflow([_magnitude(args[0])])
+            return numpy.abs(args[0])
+        if name == "INT" and len(args) == 1:
+            if _magnitude(args[0]) is not None:
+                return args[0]
+            value = numpy.floor(args[0])
+            if numpy.any(numpy.abs(value) >= 2.0 ** 63):
+                raise Unsupported
+            return value.astype(numpy.int64)
+        if name in ("MIN", "MAX") and args:
+            func = numpy.minimum if name == "MIN" else numpy.maximum
+            return func.reduce(numpy.broadcast_arrays(*args))
+        if name == "SUM" and args:
+            args = numpy.broadcast_arrays(*args)
+            _check_overflow([_magnitude(arg) for arg in args])
+            return numpy.add.reduce(args)
+        raise Unsupported
@@ -25,13 +25,14 @@ from openpyxl.descriptors.sequence import (
     MultiSequencePart,
 )
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import tostring, fromstring
 from openpyxl.packaging.relationship import (
     RelationshipList,
     Relationship,
     get_rels_path
 )
 
+from .record import RecordList
 from .table import (
     PivotArea,
     Reference,
@@ -978,7 +979,8 @@ class CacheDefinition(Serialisable):
     rel_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/pivotCacheDefinition"
     _id = 1
     _path = "/xl/pivotCache/pivotCacheDefinition{0}.xml"
-    records = None
+    _records = None
+    _records_src = None # xml of records that have not been parsed
 
     tagname = "pivotCacheDefinition"
 
@@ -1085,6 +1087,23 @@ class CacheDefinition(Serialisable):
         return node
 
 
+    @property
+    def records(self):
+        """
+        Records are parsed the first time they are used
+        """
+        if self._records_src is not None:
+            self._records = RecordList.from_tree(fromstring(self._records_src))
+            self._records_src = None
+        return self._records
+
+
+    @records.setter
+    def records(self, value):
+        self._records = value
+        self._records_src = None
+
+
     @property
     def path(self):
         return self._path.format(self._id)
@@ -1104,15 +1123,24 @@ class CacheDefinition(Serialisable):
         """
         Write the relevant child objects and add links
         """
-        if self.records is None:
+        src = self._records_src
+        records = self._records
+        if src is not None:
+            records = RecordList() # for the path and content type
+        elif records is None:
             return
 
+        records._id = self._id
         rels = RelationshipList()
-        r = Relationship(Type=self.records.rel_type, Target=self.records.path)
+        r = Relationship(Type=records.rel_type, Target=records.path)
         rels.append(r)
         self.id = r.id
-        self.records._id = self._id
-        self.records._write(archive, manifest)
+        if src is not None:
+            # records that have not been used are written as they were read
+            archive.writestr(records.path[1:], src)
+            manifest.append(records)
+        else:
+            records._write(archive, manifest)
 
         path = get_rels_path(self.path)
         xml = tostring(rels.to_tree())
@@ -17,7 +17,7 @@ from openpyxl.descriptors.nested import (
 )
 
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import archive_stream
 
 from .fields import (
     Boolean,
@@ -87,10 +87,10 @@ class RecordList(Serialisable):
         return len(self.r)
 
 
-    def to_tree(self):
-        tree = super(RecordList, self).to_tree()
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
+    def _element(self, tagname=None, namespace=None):
+        el, namespace = super(RecordList, self)._element(tagname, namespace)
+        el.set("xmlns", SHEET_MAIN_NS)
+        return el, namespace
 
 
     @property
@@ -102,8 +102,8 @@ class RecordList(Serialisable):
         """
         Write to zipfile and update manifest
         """
-        xml = tostring(self.to_tree())
-        archive.writestr(self.path[1:], xml)
+        with archive_stream(archive, self.path[1:]) as xf:
+            self.to_stream(xf)
         manifest.append(self)
 
 
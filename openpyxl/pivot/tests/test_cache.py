@@ -198,6 +198,35 @@ class TestPivotCacheDefinition:
         assert manifest.find(DummyCache.mime_type)
 
 
+    def test_write_unparsed_records(self, DummyCache, datadir):
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            xml = src.read()
+        DummyCache._records_src = xml
+        DummyCache._id = 2
+
+        out = BytesIO()
+        archive = ZipFile(out, mode="w")
+        manifest = Manifest()
+        DummyCache._write(archive, manifest)
+
+        assert archive.read("xl/pivotCache/pivotCacheRecords2.xml") == xml
+        assert DummyCache._records_src is xml
+        rels = archive.read("xl/pivotCache/_rels/pivotCacheDefinition2.xml.rels")
+        assert b"/xl/pivotCache/pivotCacheRecords2.xml" in rels
+
+
+    def test_records(self, DummyCache, datadir):
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            DummyCache._records_src = src.read()
+
+        records = DummyCache.records
+        assert len(records.r) == 17
+        assert DummyCache._records_src is None
+        assert DummyCache.records is records
+
+
 
 @pytest.fixture
 def CacheHierarchy():
@@ -10,7 +10,6 @@ from io import BytesIO
 import os.path
 import warnings
 
-from openpyxl.pivot.table import TableDefinition
 
 # Allow blanket setting of KEEP_VBA for testing
 try:
@@ -36,6 +35,7 @@ from openpyxl.xml.constants import (
     XLSX,
 )
 from openpyxl.cell import MergedCell
+from openpyxl.descriptors.trusted import validation
 from openpyxl.comments.comment_sheet import CommentSheet
 
 from .strings import read_string_table
@@ -55,11 +55,9 @@ from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet._reader import WorksheetReader
 from openpyxl.chartsheet import Chartsheet
 from openpyxl.worksheet.table import Table
-from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 
 from openpyxl.xml.functions import fromstring
 
-from .drawings import find_images
 
 
 SUPPORTED_FORMATS = ('.xlsx', '.xlsm', '.xltx', '.xltm')
@@ -120,13 +118,16 @@ class ExcelReader:
     """
 
     def __init__(self,  fn, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=True):
+                  data_only=False, keep_links=True, normalise_styles=False,
+                  validate=True):
         self.archive = _validate_archive(fn)
         self.valid_files = self.archive.namelist()
         self.read_only = read_only
         self.keep_vba = keep_vba
         self.data_only = data_only
         self.keep_links = keep_links
+        self.normalise_styles = normalise_styles
+        self.validate = validate
         self.shared_strings = []
 
 
@@ -179,6 +180,9 @@ class ExcelReader:
 
 
     def read_chartsheet(self, sheet, rel):
+        from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+        from .drawings import find_images
+
         sheet_path = rel.target
         rels_path = get_rels_path(sheet_path)
         rels = []
@@ -201,6 +205,10 @@ class ExcelReader:
 
 
     def read_worksheets(self):
+        from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+        from openpyxl.pivot.table import TableDefinition
+        from .drawings import find_images
+
         comment_warning = """Cell '{0}':{1} is part of a merged range but has a comment which will be removed because merged cells cannot contain any data."""
         for sheet, rel in self.parser.find_sheets():
             if rel.target not in self.valid_files:
@@ -273,20 +281,22 @@ class ExcelReader:
 
 
     def read(self):
-        self.read_manifest()
-        self.read_strings()
-        self.read_workbook()
-        self.read_properties()
-        self.read_theme()
-        apply_stylesheet(self.archive, self.wb)
-        self.read_worksheets()
-        self.parser.assign_names()
+        with validation(self.validate):
+            self.read_manifest()
+            self.read_strings()
+            self.read_workbook()
+            self.read_properties()
+            self.read_theme()
+            apply_stylesheet(self.archive, self.wb, self.normalise_styles)
+            self.read_worksheets()
+            self.parser.assign_names()
         if not self.read_only:
             self.archive.close()
 
 
 def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=True):
+                  data_only=False, keep_links=True, normalise_styles=False,
+                  validate=True):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -304,6 +314,12 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
     :param keep_links: whether links to external workbooks should be preserved. The default is True
     :type keep_links: bool
 
+    :param normalise_styles: fold duplicate fonts, fills, borders and cell formats together. The default is False
+    :type normalise_styles: bool
+
+    :param validate: check the values read from the file. Only switch this off for files known to be valid. The default is True
+    :type validate: bool
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
@@ -313,6 +329,6 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
 
     """
     reader = ExcelReader(filename, read_only, keep_vba,
-                        data_only, keep_links)
+                        data_only, keep_links, normalise_styles, validate)
     reader.read()
     return reader.wb
@@ -1,5 +1,6 @@
 # Copyright (c) 2010-2021 openpyxl
 
+from copy import copy
 from io import BytesIO
 from tempfile import NamedTemporaryFile
 from zipfile import BadZipfile, ZipFile
@@ -104,6 +105,34 @@ def test_style_assignment(datadir, load_workbook):
     assert len(wb._protections) == 1
 
 
+def test_normalise_styles(datadir, load_workbook):
+    datadir.chdir()
+
+    wb1 = load_workbook("complex-styles.xlsx")
+    wb2 = load_workbook("complex-styles.xlsx", normalise_styles=True)
+    assert len(wb1._cell_styles) == 29
+    assert len(wb2._cell_styles) == 25
+    ws1 = wb1.active
+    ws2 = wb2.active
+    for row1, row2 in zip(ws1.iter_rows(), ws2.iter_rows()):
+        for c1, c2 in zip(row1, row2):
+            assert c1.font._proxied == c2.font._proxied
+            assert c1.border._proxied == c2.border._proxied
+
+
+def test_without_validation(datadir, load_workbook):
+    datadir.chdir()
+
+    wb1 = load_workbook("complex-styles.xlsx")
+    wb2 = load_workbook("complex-styles.xlsx", validate=False)
+    assert wb1._fonts == wb2._fonts
+    assert wb1._cell_styles == wb2._cell_styles
+    font = copy(wb2._fonts[1])
+    assert type(font).__name__ == "Font"
+    with pytest.raises(TypeError):
+        font.sz = "large"
+
+
 @pytest.mark.parametrize("ro", [False, True])
 def test_close_read(datadir, load_workbook, ro):
     datadir.chdir()
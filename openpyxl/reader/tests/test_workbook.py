@@ -129,6 +129,10 @@ class TestWorkbookParser:
         parser = WorkbookParser(archive, ARC_WORKBOOK)
         parser.parse()
         assert list(parser.pivot_caches) == [68]
+        cache = parser.pivot_caches[68]
+        assert cache is parser.pivot_caches[68]
+        assert cache._records_src is not None
+        assert cache.records.count == 17
 
 
     def test_book_views(self, datadir, WorkbookParser):
@@ -18,8 +18,6 @@ from openpyxl.workbook.defined_name import (
     _unpack_print_titles,
 )
 from openpyxl.workbook.external_link.external import read_external_link
-from openpyxl.pivot.cache import CacheDefinition
-from openpyxl.pivot.record import RecordList
 
 from openpyxl.utils.datetime import CALENDAR_MAC_1904
 
@@ -27,6 +25,7 @@ from openpyxl.utils.datetime import CALENDAR_MAC_1904
 class WorkbookParser:
 
     _rels = None
+    _pivot_caches = None
 
     def __init__(self, archive, workbook_part_name, keep_links=True):
         self.archive = archive
@@ -115,12 +114,17 @@ class WorkbookParser:
     def pivot_caches(self):
         """
         Get PivotCache objects
+        Records are only parsed when they are used.
         """
-        d = {}
-        for c in self.caches:
-            cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
-            if cache.deps:
-                records = get_rel(self.archive, cache.deps, cache.id, RecordList)
-                cache.records = records
-            d[c.cacheId]  = cache
-        return d
+        from openpyxl.pivot.cache import CacheDefinition
+
+        if self._pivot_caches is None:
+            d = {}
+            for c in self.caches:
+                cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
+                if cache.deps:
+                    rel = cache.deps[cache.id]
+                    cache._records_src = self.archive.read(rel.target)
+                d[c.cacheId]  = cache
+            self._pivot_caches = d
+        return self._pivot_caches
@@ -4,6 +4,7 @@ from openpyxl.compat import safe_string
 
 from openpyxl.descriptors import Bool, MinMax, Min, Alias, NoneSet
 from openpyxl.descriptors.serialisable import Serialisable
+from .proxy import Freezable
 
 
 horizontal_alignments = (
@@ -13,7 +14,7 @@ vertical_aligments = (
     "top", "center", "bottom", "justify", "distributed",
 )
 
-class Alignment(Serialisable):
+class Alignment(Freezable, Serialisable):
     """Alignment options for use in styles."""
 
     tagname = "alignment"
@@ -10,6 +10,7 @@ from openpyxl.descriptors import (
     Integer,
 )
 from openpyxl.descriptors.serialisable import Serialisable
+from .proxy import Freezable
 
 from .colors import ColorDescriptor
 
@@ -30,7 +31,7 @@ BORDER_THICK = 'thick'
 BORDER_THIN = 'thin'
 
 
-class Side(Serialisable):
+class Side(Freezable, Serialisable):
 
     """Border options for use in styles.
     Caution: if you do not specify a border_style, other attributes will
@@ -53,7 +54,7 @@ class Side(Serialisable):
         self.color = color
 
 
-class Border(Serialisable):
+class Border(Freezable, Serialisable):
     """Border positioning for use in styles."""
 
     tagname = "border"
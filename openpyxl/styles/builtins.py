@@ -2,6 +2,8 @@
 
 # Builtins styles as defined in Part 4 Annex G.2
 
+from collections.abc import Mapping
+
 from .named_styles import NamedStyle
 from openpyxl.xml.functions import fromstring
 
@@ -1341,57 +1343,88 @@ pandas_highlight = """
   </namedStyle>
 """
 
-styles = dict(
+class BuiltinStyles(Mapping):
+    """
+    Builtin named styles by name. Styles are only created from their
+    definitions when they are first looked up.
+    """
+
+    def __init__(self, definitions):
+        self._definitions = definitions
+        self._styles = {}
+
+
+    def __getitem__(self, name):
+        style = self._styles.get(name)
+        if style is None:
+            style = NamedStyle.from_tree(fromstring(self._definitions[name]))
+            self._styles[name] = style
+        return style
+
+
+    def __iter__(self):
+        return iter(self._definitions)
+
+
+    def __len__(self):
+        return len(self._definitions)
+
+
+    def __contains__(self, name):
+        return name in self._definitions
+
+
+styles = BuiltinStyles(dict(
     [
-        ('Normal', NamedStyle.from_tree(fromstring(normal))),
-        ('Comma', NamedStyle.from_tree(fromstring(comma))),
-        ('Currency', NamedStyle.from_tree(fromstring(currency))),
-        ('Percent', NamedStyle.from_tree(fromstring(percent))),
-        ('Comma [0]', NamedStyle.from_tree(fromstring(comma_0))),
-        ('Currency [0]', NamedStyle.from_tree(fromstring(currency_0))),
-        ('Hyperlink', NamedStyle.from_tree(fromstring(hyperlink))),
-        ('Followed Hyperlink', NamedStyle.from_tree(fromstring(followed_hyperlink))),
-        ('Note', NamedStyle.from_tree(fromstring(note))),
-        ('Warning Text', NamedStyle.from_tree(fromstring(warning))),
-        ('Title', NamedStyle.from_tree(fromstring(title))),
-        ('Headline 1', NamedStyle.from_tree(fromstring(headline_1))),
-        ('Headline 2', NamedStyle.from_tree(fromstring(headline_2))),
-        ('Headline 3', NamedStyle.from_tree(fromstring(headline_3))),
-        ('Headline 4', NamedStyle.from_tree(fromstring(headline_4))),
-        ('Input', NamedStyle.from_tree(fromstring(input))),
-        ('Output', NamedStyle.from_tree(fromstring(output))),
-        ('Calculation',NamedStyle.from_tree(fromstring(calculation))),
-        ('Check Cell', NamedStyle.from_tree(fromstring(check_cell))),
-        ('Linked Cell', NamedStyle.from_tree(fromstring(linked_cell))),
-        ('Total', NamedStyle.from_tree(fromstring(total))),
-        ('Good', NamedStyle.from_tree(fromstring(good))),
-        ('Bad', NamedStyle.from_tree(fromstring(bad))),
-        ('Neutral', NamedStyle.from_tree(fromstring(neutral))),
-        ('Accent1', NamedStyle.from_tree(fromstring(accent_1))),
-        ('20 % - Accent1', NamedStyle.from_tree(fromstring(accent_1_20))),
-        ('40 % - Accent1', NamedStyle.from_tree(fromstring(accent_1_40))),
-        ('60 % - Accent1', NamedStyle.from_tree(fromstring(accent_1_60))),
-        ('Accent2', NamedStyle.from_tree(fromstring(accent_2))),
-        ('20 % - Accent2', NamedStyle.from_tree(fromstring(accent_2_20))),
-        ('40 % - Accent2', NamedStyle.from_tree(fromstring(accent_2_40))),
-        ('60 % - Accent2', NamedStyle.from_tree(fromstring(accent_2_60))),
-        ('Accent3', NamedStyle.from_tree(fromstring(accent_3))),
-        ('20 % - Accent3', NamedStyle.from_tree(fromstring(accent_3_20))),
-        ('40 % - Accent3', NamedStyle.from_tree(fromstring(accent_3_40))),
-        ('60 % - Accent3', NamedStyle.from_tree(fromstring(accent_3_60))),
-        ('Accent4', NamedStyle.from_tree(fromstring(accent_4))),
-        ('20 % - Accent4', NamedStyle.from_tree(fromstring(accent_4_20))),
-        ('40 % - Accent4', NamedStyle.from_tree(fromstring(accent_4_40))),
-        ('60 % - Accent4', NamedStyle.from_tree(fromstring(accent_4_60))),
-        ('Accent5', NamedStyle.from_tree(fromstring(accent_5))),
-        ('20 % - Accent5', NamedStyle.from_tree(fromstring(accent_5_20))),
-        ('40 % - Accent5', NamedStyle.from_tree(fromstring(accent_5_40))),
-        ('60 % - Accent5', NamedStyle.from_tree(fromstring(accent_5_60))),
-        ('Accent6', NamedStyle.from_tree(fromstring(accent_6))),
-        ('20 % - Accent6', NamedStyle.from_tree(fromstring(accent_6_20))),
-        ('40 % - Accent6', NamedStyle.from_tree(fromstring(accent_6_40))),
-        ('60 % - Accent6', NamedStyle.from_tree(fromstring(accent_6_60))),
-        ('Explanatory Text', NamedStyle.from_tree(fromstring(explanatory))),
-        ('Pandas', NamedStyle.from_tree(fromstring(pandas_highlight)))
+        ('Normal', normal),
+        ('Comma', comma),
+        ('Currency', currency),
+        ('Percent', percent),
+        ('Comma [0]', comma_0),
+        ('Currency [0]', currency_0),
+        ('Hyperlink', hyperlink),
+        ('Followed Hyperlink', followed_hyperlink),
+        ('Note', note),
+        ('Warning Text', warning),
+        ('Title', title),
+        ('Headline 1', headline_1),
+        ('Headline 2', headline_2),
+        ('Headline 3', headline_3),
+        ('Headline 4', headline_4),
+        ('Input', input),
+        ('Output', output),
+        ('Calculation',calculation),
+        ('Check Cell', check_cell),
+        ('Linked Cell', linked_cell),
+        ('Total', total),
+        ('Good', good),
+        ('Bad', bad),
+        ('Neutral', neutral),
+        ('Accent1', accent_1),
+        ('20 % - Accent1', accent_1_20),
+        ('40 % - Accent1', accent_1_40),
+        ('60 % - Accent1', accent_1_60),
+        ('Accent2', accent_2),
+        ('20 % - Accent2', accent_2_20),
+        ('40 % - Accent2', accent_2_40),
+        ('60 % - Accent2', accent_2_60),
+        ('Accent3', accent_3),
+        ('20 % - Accent3', accent_3_20),
+        ('40 % - Accent3', accent_3_40),
+        ('60 % - Accent3', accent_3_60),
+        ('Accent4', accent_4),
+        ('20 % - Accent4', accent_4_20),
+        ('40 % - Accent4', accent_4_40),
+        ('60 % - Accent4', accent_4_60),
+        ('Accent5', accent_5),
+        ('20 % - Accent5', accent_5_20),
+        ('40 % - Accent5', accent_5_40),
+        ('60 % - Accent5', accent_5_60),
+        ('Accent6', accent_6),
+        ('20 % - Accent6', accent_6_20),
+        ('40 % - Accent6', accent_6_40),
+        ('60 % - Accent6', accent_6_60),
+        ('Explanatory Text', explanatory),
+        ('Pandas', pandas_highlight)
     ]
-)
+))
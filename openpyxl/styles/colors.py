@@ -11,6 +11,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.sequence import NestedSequence
 from openpyxl.descriptors.serialisable import Serialisable
+from .proxy import Freezable
 
 # Default Color Index as per 18.8.27 of ECMA Part 4
 COLOR_INDEX = (
@@ -64,7 +65,7 @@ class RGB(Typed):
         super(RGB, self).__set__(instance, value)
 
 
-class Color(Serialisable):
+class Color(Freezable, Serialisable):
     """Named colors for use in styles."""
 
     tagname = "color"
@@ -11,6 +11,7 @@ from openpyxl.descriptors import (
     MinMax,
 )
 from openpyxl.descriptors.serialisable import Serialisable
+from .proxy import Freezable
 from openpyxl.compat import safe_string
 
 from .colors import ColorDescriptor, Color
@@ -48,7 +49,7 @@ fills = (FILL_SOLID, FILL_PATTERN_DARKDOWN, FILL_PATTERN_DARKGRAY,
          FILL_PATTERN_MEDIUMGRAY)
 
 
-class Fill(Serialisable):
+class Fill(Freezable, Serialisable):
 
     """Base class"""
 
@@ -119,7 +120,7 @@ DEFAULT_EMPTY_FILL = PatternFill()
 DEFAULT_GRAY_FILL = PatternFill(patternType='gray125')
 
 
-class Stop(Serialisable):
+class Stop(Freezable, Serialisable):
 
     tagname = "stop"
 
@@ -7,6 +7,7 @@ from openpyxl.descriptors import (
     Integer
 )
 from openpyxl.descriptors.serialisable import Serialisable
+from .proxy import Freezable
 
 from openpyxl.descriptors.nested import (
     NestedValue,
@@ -29,7 +30,7 @@ def _no_value(tagname, value, namespace=None):
         return Element(tagname, val=safe_string(value))
 
 
-class Font(Serialisable):
+class Font(Freezable, Serialisable):
     """Font options used in styles."""
 
     UNDERLINE_DOUBLE = 'double'
@@ -22,6 +22,7 @@ from .numbers import (
     BUILTIN_FORMATS_MAX_SIZE,
     BUILTIN_FORMATS_REVERSE,
 )
+from .proxy import _add_style
 from .cell_style import (
     StyleArray,
     CellStyle,
@@ -112,11 +113,11 @@ class NamedStyle(Serialisable):
 
 
     def _recalculate(self):
-        self._style.fontId =  self._wb._fonts.add(self.font)
-        self._style.borderId = self._wb._borders.add(self.border)
-        self._style.fillId =  self._wb._fills.add(self.fill)
-        self._style.protectionId = self._wb._protections.add(self.protection)
-        self._style.alignmentId = self._wb._alignments.add(self.alignment)
+        self._style.fontId =  _add_style(self._wb._fonts, self.font)
+        self._style.borderId = _add_style(self._wb._borders, self.border)
+        self._style.fillId =  _add_style(self._wb._fills, self.fill)
+        self._style.protectionId = _add_style(self._wb._protections, self.protection)
+        self._style.alignmentId = _add_style(self._wb._alignments, self.alignment)
         fmt = self.number_format
         if fmt in BUILTIN_FORMATS_REVERSE:
             fmt = BUILTIN_FORMATS_REVERSE[fmt]
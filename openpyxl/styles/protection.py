@@ -2,9 +2,10 @@
 
 from openpyxl.descriptors import Bool
 from openpyxl.descriptors.serialisable import Serialisable
+from .proxy import Freezable
 
 
-class Protection(Serialisable):
+class Protection(Freezable, Serialisable):
     """Protection options for use in styles."""
 
     tagname = "protection"
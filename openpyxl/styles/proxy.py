@@ -5,6 +5,114 @@ from copy import copy
 from openpyxl.compat import deprecated
 
 
+class Freezable(object):
+    """
+    Mixin for style objects that are shared once they have been added to a
+    workbook. Frozen objects cannot be changed and calculate their hash only
+    once.
+    """
+
+    _frozen = False
+
+
+    def _freeze(self):
+        """
+        Freeze the object and any style objects it contains. Contained
+        objects are replaced with frozen copies as they may be shared,
+        eg. default arguments.
+        """
+        if self._frozen:
+            return self
+        values = self.__dict__
+        for key in self.__elements__:
+            value = values.get(key)
+            if isinstance(value, Freezable) and not value._frozen:
+                values[key] = copy(value)._freeze()
+            elif isinstance(value, list):
+                children = []
+                for child in value:
+                    if isinstance(child, Freezable) and not child._frozen:
+                        child = copy(child)._freeze()
+                    children.append(child)
+                values[key] = children
+        values['_hash'] = super(Freezable, self).__hash__()
+        values['_frozen'] = True # last, so that copies can set the hash
+        return self
+
+
+    def __setattr__(self, attr, value):
+        if self._frozen:
+            raise AttributeError("Style objects are immutable and cannot be changed. "
+                                 "Reassign the style with a copy")
+        super(Freezable, self).__setattr__(attr, value)
+
+
+    def __hash__(self):
+        if self._frozen:
+            return self._hash
+        return super(Freezable, self).__hash__()
+
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if (self._frozen and getattr(other, "_frozen", False)
+            and self._hash != other._hash):
+            return False
+        return super(Freezable, self).__eq__(other)
+
+
+    def __ne__(self, other):
+        return not self == other
+
+
+    def __copy__(self):
+        cp = super(Freezable, self).__copy__()
+        values = cp.__dict__
+        values.pop('_frozen', None)
+        values.pop('_hash', None)
+        return cp
+
+
+# most recently added objects of users remembered for each collection
+INTERNED_SIZE = 256
+
+
+def _add_style(coll, value):
+    """
+    Return the index of a style object in a workbook collection. New objects
+    are added as frozen copies so that they cannot be changed by accident.
+
+    The objects of users are remembered, along with their hash, so that
+    assigning the same object again only needs its hash to be calculated.
+    Objects that have been changed since have a different hash.
+    """
+    if isinstance(value, StyleProxy):
+        value = value._proxied
+    if not isinstance(value, Freezable) or value._frozen:
+        try:
+            return coll.index(value)
+        except ValueError:
+            return coll.add(value)
+
+    interned = coll.__dict__.get("_interned")
+    if interned is None:
+        interned = coll._interned = {}
+    key = hash(value)
+    seen = interned.get(id(value))
+    if seen is not None and seen[0] is value and seen[1] == key:
+        return seen[2]
+
+    try:
+        idx = coll.index(value)
+    except ValueError:
+        idx = coll.add(copy(value)._freeze())
+    if len(interned) >= INTERNED_SIZE:
+        interned.clear()
+    interned[id(value)] = (value, key, idx) # keeps the id from being reused
+    return idx
+
+
 class StyleProxy(object):
     """
     Proxy formatting objects so that they cannot be altered
@@ -26,7 +134,7 @@ class StyleProxy(object):
 
     def __setattr__(self, attr, value):
         if attr != "_StyleProxy__target":
-            raise AttributeError("Style objects are immutable and cannot be changed."
+            raise AttributeError("Style objects are immutable and cannot be changed. "
                                  "Reassign the style with a copy")
         super(StyleProxy, self).__setattr__(attr, value)
 
@@ -58,5 +166,17 @@ class StyleProxy(object):
         return self.__target == other
 
 
+    def __hash__(self):
+        return hash(self.__target)
+
+
+    @property
+    def _proxied(self):
+        """
+        The object being proxied
+        """
+        return self.__target
+
+
     def __ne__(self, other):
         return not self == other
@@ -8,7 +8,7 @@ from .numbers import (
     BUILTIN_FORMATS_MAX_SIZE,
     BUILTIN_FORMATS_REVERSE,
 )
-from .proxy import StyleProxy
+from .proxy import StyleProxy, _add_style
 from .cell_style import StyleArray
 from .named_styles import NamedStyle
 from .builtins import styles
@@ -24,7 +24,7 @@ class StyleDescriptor(object):
         coll = getattr(instance.parent.parent, self.collection)
         if not getattr(instance, "_style"):
             instance._style = StyleArray()
-        setattr(instance._style, self.key, coll.add(value))
+        setattr(instance._style, self.key, _add_style(coll, value))
 
 
     def __get__(self, instance, cls):
@@ -1,5 +1,6 @@
 # Copyright (c) 2010-2021 openpyxl
 
+from copy import copy
 from warnings import warn
 
 from openpyxl.descriptors.serialisable import Serialisable
@@ -31,7 +32,7 @@ from .numbers import (
 from .named_styles import (
     _NamedCellStyleList
 )
-from .cell_style import CellStyle, CellStyleList
+from .cell_style import CellStyle, CellStyleList, StyleArray
 
 
 class Stylesheet(Serialisable):
@@ -185,9 +186,46 @@ class Stylesheet(Serialisable):
         return tree
 
 
-def apply_stylesheet(archive, wb):
+def _fold(items, keep=1):
     """
-    Add styles to workbook if present
+    Fold equal items together. The first `keep` items are retained in place.
+    Returns the distinct items and a list of their new indices.
+    """
+    folded = IndexedList(items[:keep])
+    mapping = list(range(len(folded)))
+    for item in items[keep:]:
+        mapping.append(folded.add(item))
+    return folded, mapping
+
+
+def normalise_styles(stylesheet):
+    """
+    Fold equal fonts, fills, borders and cell formats in a stylesheet.
+    Returns a list of the distinct cell formats for each original one.
+    """
+    fonts, font_ids = _fold(stylesheet.fonts)
+    fills, fill_ids = _fold(stylesheet.fills, 2)
+    borders, border_ids = _fold(stylesheet.borders)
+    stylesheet.fonts = fonts
+    stylesheet.fills = fills
+    stylesheet.borders = borders
+
+    for style in stylesheet.cell_styles:
+        for key, mapping in (('fontId', font_ids), ('fillId', fill_ids),
+                             ('borderId', border_ids)):
+            idx = getattr(style, key)
+            if idx < len(mapping):
+                setattr(style, key, mapping[idx])
+
+    cell_styles, xf_ids = _fold(stylesheet.cell_styles)
+    stylesheet.cell_styles = cell_styles
+    return [cell_styles[idx] for idx in xf_ids]
+
+
+def apply_stylesheet(archive, wb, normalise=False):
+    """
+    Add styles to workbook if present.
+    If `normalise` is True, duplicate styles are folded together.
     """
     try:
         src = archive.read(ARC_STYLE)
@@ -199,13 +237,21 @@ def apply_stylesheet(archive, wb):
 
     if stylesheet.cell_styles:
 
-        wb._borders = IndexedList(stylesheet.borders)
-        wb._fonts = IndexedList(stylesheet.fonts)
-        wb._fills = IndexedList(stylesheet.fills)
+        if normalise:
+            wb._style_remap = normalise_styles(stylesheet)
+
+        # named styles keep the objects they were read with, so that they can
+        # still be changed
+        def frozen(objs):
+            return [copy(obj)._freeze() for obj in objs]
+
+        wb._borders = IndexedList(frozen(stylesheet.borders))
+        wb._fonts = IndexedList(frozen(stylesheet.fonts))
+        wb._fills = IndexedList(frozen(stylesheet.fills))
         wb._differential_styles.styles = stylesheet.dxfs
         wb._number_formats = stylesheet.number_formats
-        wb._protections = stylesheet.protections
-        wb._alignments = stylesheet.alignments
+        wb._protections = IndexedList(frozen(stylesheet.protections))
+        wb._alignments = IndexedList(frozen(stylesheet.alignments))
         wb._table_styles = stylesheet.tableStyles
 
         # need to overwrite openpyxl defaults in case workbook has different ones
@@ -229,6 +275,120 @@ def apply_stylesheet(archive, wb):
         wb._colors = stylesheet.colors.index
 
 
+_COMPONENTS = (
+    ('fontId', '_fonts', 1),
+    ('fillId', '_fills', 2), # gray125 must follow the empty fill
+    ('borderId', '_borders', 1),
+    ('protectionId', '_protections', 1),
+    ('alignmentId', '_alignments', 1),
+)
+
+
+def _styled_objects(wb):
+    """
+    Cells, dimensions and named styles with a style
+    """
+    for ws in wb.worksheets:
+        yield from ws._cells.values()
+        yield from ws.row_dimensions.values()
+        yield from ws.column_dimensions.values()
+    yield from wb._named_styles
+
+
+def _compact(items, used, keep):
+    """
+    Return the used items and a mapping of old to new indices.
+    The first `keep` items are always retained in place.
+    """
+    kept = IndexedList()
+    mapping = {}
+    for idx, item in enumerate(items):
+        if idx < keep or idx in used:
+            mapping[idx] = len(kept)
+            list.append(kept, item)
+    kept._rebuild_dict()
+    return kept, mapping
+
+
+def _shared_dxfs(wb):
+    """
+    Differential styles can also be used by tables, pivot tables, filters and
+    table styles which keep their own references.
+    """
+    if wb._table_styles is not None and wb._table_styles.tableStyle:
+        return True
+    for ws in wb.worksheets:
+        af = ws.auto_filter
+        if ws._tables or ws._pivots or af.filterColumn or af.sortState:
+            return True
+    return False
+
+
+def _compact_dxfs(wb):
+    styles = wb._differential_styles.styles
+    wb._differential_styles.styles = []
+    for ws in wb.worksheets:
+        for cf in ws.conditional_formatting:
+            for rule in cf.rules:
+                if rule.dxf is None and rule.dxfId is not None:
+                    rule.dxf = styles[rule.dxfId]
+                if rule.dxf is not None:
+                    rule.dxfId = wb._differential_styles.add(rule.dxf)
+
+
+def compact_stylesheet(wb):
+    """
+    Remove fonts, fills, borders, protections, alignments, number formats and
+    cell formats that are not used by any cell, dimension or named style and
+    renumber the rest. Differential styles are compacted when only
+    conditional formats use them.
+    Write-only workbooks cannot be compacted.
+    """
+    if wb.write_only:
+        return
+
+    arrays = {}
+    distinct = {}
+    for obj in _styled_objects(wb):
+        style = obj._style
+        if style is not None:
+            arrays[id(style)] = style
+            distinct.setdefault(style.tobytes(), style)
+    distinct = list(distinct.values())
+
+    mappings = []
+    for key, collection, keep in _COMPONENTS:
+        used = set(getattr(style, key) for style in distinct)
+        kept, mapping = _compact(getattr(wb, collection), used, keep)
+        setattr(wb, collection, kept)
+        mappings.append((key, mapping))
+
+    used = set(style.numFmtId - BUILTIN_FORMATS_MAX_SIZE for style in distinct
+               if style.numFmtId >= BUILTIN_FORMATS_MAX_SIZE)
+    wb._number_formats, formats = _compact(wb._number_formats, used, 0)
+
+    remapped = {}
+    for style in distinct:
+        new = StyleArray(style)
+        for key, mapping in mappings:
+            setattr(new, key, mapping.get(getattr(style, key), 0))
+        idx = style.numFmtId - BUILTIN_FORMATS_MAX_SIZE
+        if idx in formats:
+            new.numFmtId = formats[idx] + BUILTIN_FORMATS_MAX_SIZE
+        elif idx >= 0:
+            new.numFmtId = 0
+        remapped[style.tobytes()] = new
+
+    for style in arrays.values():
+        style[:] = remapped[style.tobytes()]
+
+    # cell formats are added again as the worksheets are written
+    wb._cell_styles = IndexedList([StyleArray()])
+
+    if not _shared_dxfs(wb):
+        _compact_dxfs(wb)
+
+
 def write_stylesheet(wb):
     stylesheet = Stylesheet()
     stylesheet.fonts = wb._fonts
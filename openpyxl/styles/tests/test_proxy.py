@@ -64,3 +64,78 @@ def test_add(dummy_object):
 
     combined = o1 + o2
     assert combined.a == 1
+
+
+class TestFreezable:
+
+    def test_freeze(self):
+        from ..fonts import Font
+        ft = Font(bold=True)
+        h = hash(ft)
+        ft._freeze()
+        assert ft._hash == h
+        assert hash(ft) == h
+        with pytest.raises(AttributeError):
+            ft.bold = False
+
+
+    def test_children_copied(self):
+        from ..fills import PatternFill
+        fill = PatternFill()
+        color = fill.fgColor
+        fill._freeze()
+        assert fill.fgColor is not color
+        assert fill.fgColor._frozen
+        assert not color._frozen
+
+
+    def test_copy_unfrozen(self):
+        from ..fonts import Font
+        ft = Font(bold=True)._freeze()
+        cp = copy(ft)
+        assert cp == ft
+        assert not cp._frozen
+        cp.bold = False
+        assert cp != ft
+
+
+    def test_proxy_hash(self):
+        from ..fonts import Font
+        from ..proxy import StyleProxy
+        ft = Font(bold=True)._freeze()
+        proxy = StyleProxy(ft)
+        assert hash(proxy) == hash(ft)
+        assert proxy._proxied is ft
+
+
+def test_add_style():
+    from openpyxl.utils.indexed_list import IndexedList
+    from ..fonts import Font
+    from ..proxy import _add_style, StyleProxy
+
+    fonts = IndexedList()
+    ft = Font(bold=True)
+    assert _add_style(fonts, ft) == 0
+    assert fonts[0] is not ft
+    assert fonts[0]._frozen
+    assert not ft._frozen
+    assert _add_style(fonts, StyleProxy(fonts[0])) == 0
+    assert _add_style(fonts, Font(italic=True)) == 1
+
+
+def test_add_style_changed():
+    from openpyxl.utils.indexed_list import IndexedList
+    from ..fonts import Font
+    from ..proxy import _add_style
+
+    fonts = IndexedList()
+    ft = Font(bold=True)
+    assert _add_style(fonts, ft) == 0
+    assert _add_style(fonts, ft) == 0
+    ft.italic = True
+    assert _add_style(fonts, ft) == 1
+    ft.color = "FF0000"
+    assert _add_style(fonts, ft) == 2
+    ft.color.rgb = "FF00FF00"
+    assert _add_style(fonts, ft) == 3
+    assert fonts[2].color.rgb == "00FF0000"
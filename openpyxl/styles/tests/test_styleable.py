@@ -142,3 +142,14 @@ class TestNamedStyle:
         assert s1.pivotButton is False
         s1.pivotButton = True
         assert s1.pivotButton is True
+
+
+def test_assign_proxy(StyleableObject):
+    from ..fonts import Font
+    so = StyleableObject
+    ft = Font(name="Courier")
+    so.font = ft
+    ft.name = "Arial"
+    assert so.font.name == "Courier"
+    so.font = so.font
+    assert so.font.name == "Courier"
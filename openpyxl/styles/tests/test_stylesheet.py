@@ -247,6 +247,23 @@ class TestStylesheet:
         assert stylesheet.cellStyles.cellStyle[-1].xfId < stylesheet.cellStyleXfs.count
 
 
+def test_normalise_styles(Stylesheet, datadir):
+    from ..stylesheet import normalise_styles
+    datadir.chdir()
+    with open("styles_number_formats.xml") as src:
+        xml = src.read()
+    node = fromstring(xml)
+    stylesheet = Stylesheet.from_tree(node)
+    fonts = list(stylesheet.fonts)
+    xfs = [fonts[style.fontId] for style in stylesheet.cell_styles]
+
+    remap = normalise_styles(stylesheet)
+
+    assert len(stylesheet.fonts) == 3
+    assert [stylesheet.fonts[style.fontId] for style in remap] == xfs
+    assert remap[0] is stylesheet.cell_styles[0]
+
+
 def test_no_stylesheet():
     from ..stylesheet import apply_stylesheet
     wb1 = wb2 = Workbook()
@@ -267,6 +284,24 @@ def test_no_styles(recwarn):
     assert w.category == UserWarning
 
 
+def test_named_styles_can_be_changed(datadir):
+    from ..stylesheet import apply_stylesheet
+    datadir.chdir()
+    with open("complex-styles.xml") as src:
+        xml = src.read()
+    wb = Workbook()
+    archive = ZipFile(BytesIO(), "a")
+    archive.writestr("xl/styles.xml", xml)
+    apply_stylesheet(archive, wb)
+
+    style = wb._named_styles[0]
+    style.font.b = True
+    assert style.font.b is True
+    assert all(font._frozen for font in wb._fonts)
+    with pytest.raises(AttributeError):
+        wb._fonts[0].b = True
+
+
 def test_write_worksheet(Stylesheet):
     wb = Workbook()
     wb._colors = ('00000000', '00FFFFFF',)
@@ -371,3 +406,69 @@ def test_no_default_style(datadir):
     apply_stylesheet(archive, wb)
 
     assert wb._named_styles != []
+
+
+class TestCompactStylesheet:
+
+    def test_unused_styles(self):
+        from ..fonts import Font
+        from ..fills import PatternFill
+        from ..stylesheet import compact_stylesheet
+        wb = Workbook()
+        ws = wb.active
+        ws['A1'].font = Font(bold=True)
+        ws['A1'].font = Font(italic=True)
+        ws['A2'].fill = PatternFill("solid", fgColor="FF0000")
+        ws['A2'].fill = PatternFill()
+        ws['A3'].number_format = "0.0000"
+        ws['A3'].number_format = "0.000"
+        ws.row_dimensions[4].font = Font(size=20)
+        assert len(wb._fonts) == 4
+        assert len(wb._fills) == 3
+        assert len(wb._number_formats) == 2
+
+        compact_stylesheet(wb)
+
+        assert [(f.i, f.sz) for f in wb._fonts] == [(False, 11), (True, None), (False, 20)]
+        assert len(wb._fills) == 2
+        assert list(wb._number_formats) == ["0.000"]
+        assert ws['A1'].font.i is True
+        assert ws['A3'].number_format == "0.000"
+        assert ws['A3']._style.numFmtId == 164
+        assert ws.row_dimensions[4].font.sz == 20
+        assert list(wb._cell_styles) == [StyleArray()]
+
+
+    def test_named_styles(self):
+        from ..fonts import Font
+        from ..named_styles import NamedStyle
+        from ..stylesheet import compact_stylesheet
+        wb = Workbook()
+        ws = wb.active
+        ws['A1'].font = Font(bold=True)
+        wb.add_named_style(NamedStyle("Big", font=Font(sz=20)))
+        ws['A1'].font = Font()
+
+        compact_stylesheet(wb)
+
+        assert not any(f.b for f in wb._fonts)
+        assert wb._fonts[wb._named_styles["Big"]._style.fontId].sz == 20
+
+
+    def test_differential_styles(self):
+        from ..differential import DifferentialStyle
+        from ..fonts import Font
+        from openpyxl.formatting.rule import Rule
+        from ..stylesheet import compact_stylesheet
+        wb = Workbook()
+        ws = wb.active
+        unused = DifferentialStyle(font=Font(bold=True))
+        dxf = DifferentialStyle(font=Font(italic=True))
+        wb._differential_styles.add(unused)
+        rule = Rule(type="cellIs", operator="equal", formula=["1"], dxf=dxf)
+        ws.conditional_formatting.add("A1:A5", rule)
+
+        compact_stylesheet(wb)
+
+        assert wb._differential_styles.styles == [dxf]
+        assert rule.dxfId == 0
@@ -0,0 +1,27 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""Make sure importing openpyxl stays cheap"""
+
+import os
+import subprocess
+import sys
+
+import openpyxl
+
+
+CHECK = """
+import sys
+import openpyxl
+from openpyxl.styles.builtins import styles
+
+deferred = [name for name in sys.modules
+            if name.startswith(("openpyxl.chart.", "openpyxl.pivot."))]
+print(len(deferred), len(styles._styles))
+"""
+
+
+def test_deferred_imports():
+    root = os.path.dirname(os.path.dirname(openpyxl.__file__))
+    out = subprocess.check_output([sys.executable, "-c", CHECK], cwd=root,
+                                  universal_newlines=True)
+    assert out.split() == ["0", "0"]
@@ -0,0 +1,176 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Spatial index for rectangular cell ranges.
+
+Ranges are filed in a hierarchy of row bands: level *n* groups rows in bands
+of 2**n rows, and each range is stored at the lowest level at which it
+spans no more than two bands. Point and range queries only have to look at
+one or two bands per populated level and then filter on columns, so they
+scale with the number of matching ranges rather than the number of ranges in
+the index. Adding and removing ranges does not require the index to be
+rebuilt.
+"""
+
+from operator import itemgetter
+
+
+_seq = itemgetter(4)
+
+
+def _level(min_row, max_row):
+    """
+    Lowest level at which a range spans at most two bands
+    """
+    level = 0
+    while (max_row >> level) - (min_row >> level) > 1:
+        level += 1
+    return level
+
+
+class RangeIndex(object):
+    """
+    Index arbitrary objects by one or more rectangles.
+
+    Bounds are given as ``(min_col, min_row, max_col, max_row)`` tuples, the
+    same as :attr:`openpyxl.worksheet.cell_range.CellRange.bounds`. Objects
+    are tracked by identity and results are returned in insertion order.
+    """
+
+    def __init__(self):
+        self._levels = {}
+        self._items = {}
+        self._counter = 0
+
+
+    def add(self, item, bounds):
+        """
+        Add a rectangle for an object. An object can be added more than
+        once with different bounds.
+        """
+        min_col, min_row, max_col, max_row = bounds
+        key = id(item)
+        if key in self._items:
+            seq, _, entries = self._items[key]
+        else:
+            seq = self._counter
+            self._counter += 1
+            entries = []
+            self._items[key] = seq, item, entries
+
+        entry = (min_row, max_row, min_col, max_col, seq, item)
+        level = _level(min_row, max_row)
+        bands = self._levels.setdefault(level, {})
+        for band in {min_row >> level, max_row >> level}:
+            bands.setdefault(band, []).append(entry)
+            entries.append((level, band, entry))
+
+
+    def remove(self, item):
+        """
+        Remove all rectangles for an object.
+        Raises KeyError if the object is not in the index.
+        """
+        _, _, entries = self._items.pop(id(item))
+        for level, band, entry in entries:
+            bands = self._levels[level]
+            members = bands[band]
+            members.remove(entry)
+            if not members:
+                del bands[band]
+                if not bands:
+                    del self._levels[level]
+
+
+    def discard(self, item):
+        """
+        Remove an object if it is in the index
+        """
+        if id(item) in self._items:
+            self.remove(item)
+
+
+    def clear(self):
+        self._levels = {}
+        self._items = {}
+
+
+    def __len__(self):
+        return len(self._items)
+
+
+    def __bool__(self):
+        return bool(self._items)
+
+
+    def __contains__(self, item):
+        return id(item) in self._items
+
+
+    def __iter__(self):
+        for _, item, _ in sorted(self._items.values(), key=itemgetter(0)):
+            yield item
+
+
+    def _candidates(self, min_row, max_row):
+        for level, bands in self._levels.items():
+            first = min_row >> level
+            last = max_row >> level
+            if last - first < len(bands):
+                for band in range(first, last + 1):
+                    yield from bands.get(band, ())
+            else:
+                for band, members in bands.items():
+                    if first <= band <= last:
+                        yield from members
+
+
+    @staticmethod
+    def _collect(entries):
+        seen = set()
+        found = []
+        for entry in entries:
+            seq = entry[4]
+            if seq not in seen:
+                seen.add(seq)
+                found.append(entry)
+        found.sort(key=_seq)
+        return [entry[5] for entry in found]
+
+
+    def find(self, row, col):
+        """
+        Objects with a rectangle containing the cell at row, col
+        """
+        found = []
+        for level, bands in self._levels.items():
+            for entry in bands.get(row >> level, ()):
+                if (entry[0] <= row <= entry[1]
+                    and entry[2] <= col <= entry[3]):
+                    found.append(entry)
+        return self._collect(found)
+
+
+    def overlapping(self, bounds):
+        """
+        Objects with a rectangle sharing at least one cell with bounds
+        """
+        min_col, min_row, max_col, max_row = bounds
+        found = [entry for entry in self._candidates(min_row, max_row)
+                 if entry[0] <= max_row and entry[1] >= min_row
+                 and entry[2] <= max_col and entry[3] >= min_col]
+        return self._collect(found)
+
+
+    def enclosing(self, bounds):
+        """
+        Objects with a rectangle containing all of bounds
+        """
+        min_col, min_row, max_col, max_row = bounds
+        found = []
+        for level, bands in self._levels.items():
+            for entry in bands.get(min_row >> level, ()):
+                if (entry[0] <= min_row and entry[1] >= max_row
+                    and entry[2] <= min_col and entry[3] >= max_col):
+                    found.append(entry)
+        return self._collect(found)
@@ -52,3 +52,9 @@ def test_table_builder(list):
             sb.append(letter)
         assert sb.index(letter) == result[letter]
     assert sb == ['a', 'b', 'c', 'd']
+
+
+def test_index_missing(list):
+    l = list(['a', 'b'])
+    with pytest.raises(ValueError):
+        l.index('c')
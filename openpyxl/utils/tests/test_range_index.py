@@ -0,0 +1,136 @@
+import pytest
+
+
+@pytest.fixture
+def RangeIndex():
+    from ..range_index import RangeIndex
+    return RangeIndex
+
+
+@pytest.fixture
+def index(RangeIndex):
+    idx = RangeIndex()
+    idx.add("A1:B2", (1, 1, 2, 2))
+    idx.add("C5:C100", (3, 5, 3, 100))
+    idx.add("A:A", (1, 1, 1, 1048576))
+    idx.add("D10", (4, 10, 4, 10))
+    return idx
+
+
+@pytest.mark.parametrize("min_row, max_row, level",
+                         [
+                             (1, 1, 0),
+                             (1, 2, 0),
+                             (1, 3, 1),
+                             (7, 9, 1),
+                             (8, 9, 0),
+                             (5, 100, 6),
+                         ]
+                         )
+def test_level(min_row, max_row, level):
+    from ..range_index import _level
+    assert _level(min_row, max_row) == level
+
+
+def test_ctor(RangeIndex):
+    idx = RangeIndex()
+    assert len(idx) == 0
+    assert not idx
+    assert idx.find(1, 1) == []
+
+
+def test_len(index):
+    assert len(index) == 4
+    assert list(index) == ["A1:B2", "C5:C100", "A:A", "D10"]
+
+
+@pytest.mark.parametrize("row, col, expected",
+                         [
+                             (1, 1, ["A1:B2", "A:A"]),
+                             (2, 2, ["A1:B2"]),
+                             (50, 3, ["C5:C100"]),
+                             (101, 3, []),
+                             (1000000, 1, ["A:A"]),
+                             (10, 4, ["D10"]),
+                             (10, 5, []),
+                         ]
+                         )
+def test_find(index, row, col, expected):
+    assert index.find(row, col) == expected
+
+
+@pytest.mark.parametrize("bounds, expected",
+                         [
+                             ((1, 1, 4, 10), ["A1:B2", "C5:C100", "A:A", "D10"]),
+                             ((2, 3, 3, 4), []),
+                             ((3, 100, 10, 200), ["C5:C100"]),
+                             ((2, 2, 2, 2), ["A1:B2"]),
+                         ]
+                         )
+def test_overlapping(index, bounds, expected):
+    assert index.overlapping(bounds) == expected
+
+
+@pytest.mark.parametrize("bounds, expected",
+                         [
+                             ((1, 1, 2, 2), ["A1:B2"]),
+                             ((1, 1, 1, 2), ["A1:B2", "A:A"]),
+                             ((1, 1, 3, 3), []),
+                             ((3, 10, 3, 20), ["C5:C100"]),
+                         ]
+                         )
+def test_enclosing(index, bounds, expected):
+    assert index.enclosing(bounds) == expected
+
+
+def test_remove(index):
+    index.remove("A:A")
+    assert "A:A" not in index
+    assert index.find(1, 1) == ["A1:B2"]
+    assert index.find(1000, 1) == []
+    with pytest.raises(KeyError):
+        index.remove("A:A")
+
+
+def test_discard(index):
+    index.discard("A:A")
+    index.discard("A:A")
+    assert len(index) == 3
+
+
+def test_multiple_bounds(RangeIndex):
+    idx = RangeIndex()
+    item = object()
+    idx.add(item, (1, 1, 1, 1))
+    idx.add(item, (5, 5, 6, 6))
+    assert len(idx) == 1
+    assert idx.find(5, 6) == [item]
+    assert idx.overlapping((1, 1, 10, 10)) == [item]
+    idx.remove(item)
+    assert idx.find(1, 1) == []
+    assert idx._levels == {}
+
+
+def test_clear(index):
+    index.clear()
+    assert len(index) == 0
+    assert index.find(1, 1) == []
+
+
+def test_brute_force(RangeIndex):
+    from random import Random
+    rnd = Random(3)
+    idx = RangeIndex()
+    boxes = []
+    for i in range(200):
+        min_col, min_row = rnd.randint(1, 20), rnd.randint(1, 500)
+        box = (min_col, min_row,
+               min_col + rnd.randint(0, 5), min_row + rnd.randint(0, 300))
+        boxes.append(box)
+        idx.add(box, box)
+
+    for i in range(200):
+        row, col = rnd.randint(1, 800), rnd.randint(1, 25)
+        expected = [b for b in boxes
+                    if b[0] <= col <= b[2] and b[1] <= row <= b[3]]
+        assert idx.find(row, col) == expected
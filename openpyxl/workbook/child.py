@@ -100,6 +100,10 @@ class _WorkbookChild(object):
 
         self.__title = value
 
+        index = getattr(self.parent, "_formula_index", None)
+        if index is not None:
+            index.reset()
+
 
     @property
     def oddHeader(self):
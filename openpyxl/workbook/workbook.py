@@ -8,6 +8,7 @@ from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.copier import WorksheetCopy
+from openpyxl.formula.index import FormulaIndex
 
 from openpyxl.utils import quote_sheetname
 from openpyxl.utils.indexed_list import IndexedList
@@ -23,6 +24,8 @@ from openpyxl.styles.alignment import Alignment
 from openpyxl.styles.borders import DEFAULT_BORDER
 from openpyxl.styles.fills import DEFAULT_EMPTY_FILL, DEFAULT_GRAY_FILL
 from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.styles.proxy import _add_style
+from openpyxl.styles.stylesheet import compact_stylesheet
 from openpyxl.styles.protection import Protection
 from openpyxl.styles.colors import COLOR_INDEX
 from openpyxl.styles.named_styles import NamedStyleList
@@ -60,6 +63,7 @@ class Workbook(object):
                  iso_dates=False,
                  ):
         self._sheets = []
+        self._formula_index = None
         self._pivots = []
         self._active_sheet_index = 0
         self.defined_names = DefinedNameList()
@@ -91,25 +95,28 @@ class Workbook(object):
         """Bootstrap styles"""
 
         self._fonts = IndexedList()
-        self._fonts.add(DEFAULT_FONT)
+        _add_style(self._fonts, DEFAULT_FONT)
 
-        self._alignments = IndexedList([Alignment()])
+        self._alignments = IndexedList()
+        _add_style(self._alignments, Alignment())
 
         self._borders = IndexedList()
-        self._borders.add(DEFAULT_BORDER)
+        _add_style(self._borders, DEFAULT_BORDER)
 
         self._fills = IndexedList()
-        self._fills.add(DEFAULT_EMPTY_FILL)
-        self._fills.add(DEFAULT_GRAY_FILL)
+        _add_style(self._fills, DEFAULT_EMPTY_FILL)
+        _add_style(self._fills, DEFAULT_GRAY_FILL)
 
         self._number_formats = IndexedList()
         self._date_formats = {}
         self._timedelta_formats = {}
 
-        self._protections = IndexedList([Protection()])
+        self._protections = IndexedList()
+        _add_style(self._protections, Protection())
 
         self._colors = COLOR_INDEX
         self._cell_styles = IndexedList([StyleArray()])
+        self._style_remap = None # cell formats by id in the source file
         self._named_styles = NamedStyleList()
         self.add_named_style(NamedStyle(font=copy(DEFAULT_FONT), border=copy(DEFAULT_BORDER), builtinId=0))
         self._table_styles = TableStyleList()
@@ -213,6 +220,8 @@ class Workbook(object):
             self._sheets.append(sheet)
         else:
             self._sheets.insert(index, sheet)
+        if self._formula_index is not None:
+            self._formula_index.reset()
 
 
     def move_sheet(self, sheet, offset=0):
@@ -225,6 +234,8 @@ class Workbook(object):
         del self._sheets[idx]
         new_pos = idx + offset
         self._sheets.insert(new_pos, sheet)
+        if self._formula_index is not None:
+            self._formula_index.reset()
 
 
     def remove(self, worksheet):
@@ -234,6 +245,8 @@ class Workbook(object):
         for name in localnames:
             self.defined_names.delete(name, scope=idx)
         self._sheets.remove(worksheet)
+        if self._formula_index is not None:
+            self._formula_index.reset()
 
 
     @deprecated("Use wb.remove(worksheet) or del wb[sheetname]")
@@ -315,6 +328,17 @@ class Workbook(object):
         """
         return [s for s in self._sheets if isinstance(s, Chartsheet)]
 
+    @property
+    def formula_index(self):
+        """An index of the cells referred to by the formulae of the workbook,
+        built when it is first used
+
+        :type: :class:`openpyxl.formula.index.FormulaIndex`
+        """
+        if self._formula_index is None:
+            self._formula_index = FormulaIndex(self)
+        return self._formula_index
+
     @property
     def sheetnames(self):
         """Returns the list of the names of worksheets in this workbook.
@@ -391,10 +415,14 @@ class Workbook(object):
         return ct
 
 
-    def save(self, filename):
+    def save(self, filename, compact_styles=False):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        If `compact_styles` is True, styles that are not used by any cell,
+        row, column or named style are removed before saving. This has no
+        effect on write-only workbooks.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequents attempts to
@@ -404,6 +432,8 @@ class Workbook(object):
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
+        if compact_styles:
+            compact_stylesheet(self)
         save_workbook(self, filename)
 
 
@@ -76,6 +76,7 @@ class ReadOnlyWorksheet(object):
         parser = WorkSheetParser(src, self._shared_strings,
                                  data_only=self.parent.data_only, epoch=self.parent.epoch,
                                  date_formats=self.parent._date_formats)
+        parser.keep_cached = not values_only
         for idx, row in parser.parse():
             if max_row is not None and idx > max_row:
                 break
@@ -1,7 +1,6 @@
 # Copyright (c) 2010-2021 openpyxl
 
 """Reader for a single worksheet."""
-from copy import copy
 from warnings import warn
 
 # compatibility imports
@@ -21,7 +20,7 @@ from openpyxl.xml.constants import (
     EXT_TYPES,
 )
 from openpyxl.formatting.formatting import ConditionalFormatting
-from openpyxl.formula.translate import Translator
+from .formula import SharedFormula
 from openpyxl.utils import (
     get_column_letter,
     coordinate_to_tuple,
@@ -32,6 +31,7 @@ from openpyxl.descriptors.excel import ExtensionList
 from .filters import AutoFilter
 from .header_footer import HeaderFooter
 from .hyperlink import HyperlinkList
+from .cell_range import CellRange
 from .merge import MergeCells
 from .page import PageMargins, PrintOptions, PrintPageSetup
 from .pagebreak import RowBreak, ColBreak
@@ -102,6 +102,8 @@ class WorkSheetParser(object):
         self.column_dimensions = {}
         self.number_formats = []
         self.keep_vba = False
+        self.keep_shared = False # cells refer to their shared formula
+        self.keep_cached = False # values of formulae as well as the formulae
         self.hyperlinks = HyperlinkList()
         self.formatting = []
         self.legacy_drawing = None
@@ -193,11 +195,14 @@ class WorkSheetParser(object):
             self.col_counter += 1
             row, column = self.row_counter, self.col_counter
 
+        formula = None
         if not self.data_only and element.find(FORMULA_TAG) is not None:
-            data_type = 'f'
-            value = self.parse_formula(element)
+            formula = self.parse_formula(element)
+            if not self.keep_cached:
+                return {'row':row, 'column':column, 'value':formula,
+                        'data_type':'f', 'style_id':style_id}
 
-        elif value is not None:
+        if value is not None:
             if data_type == 'n':
                 value = _cast_number(value)
                 if style_id in self.date_formats:
@@ -227,6 +232,11 @@ class WorkSheetParser(object):
                     richtext = Text.from_tree(child)
                     value = richtext.content
 
+        if formula is not None:
+            # with the value calculated when the workbook was last saved
+            return {'row':row, 'column':column, 'value':formula,
+                    'data_type':'f', 'style_id':style_id, 'cached_value':value}
+
         return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
 
 
@@ -246,11 +256,18 @@ class WorkSheetParser(object):
 
         elif formula_type == "shared":
             idx = formula.get('si')
-            if idx in self.shared_formulae:
-                trans = self.shared_formulae[idx]
-                value = trans.translate_formula(coordinate)
-            elif value != "=":
-                self.shared_formulae[idx] = Translator(value, coordinate)
+            if coordinate:
+                row, column = coordinate_to_tuple(coordinate)
+            else:
+                row, column = self.row_counter, self.col_counter
+            group = self.shared_formulae.get(idx)
+            if group is None and value != "=":
+                group = self.shared_formulae[idx] = SharedFormula(value, row, column)
+            if group is not None:
+                if self.keep_shared:
+                    value = group
+                else:
+                    value = group.formula(row, column)
 
         return value
 
@@ -344,16 +361,21 @@ class WorksheetReader(object):
         self.parser = WorkSheetParser(xml_source, shared_strings,
                 data_only, ws.parent.epoch, ws.parent._date_formats,
                 ws.parent._timedelta_formats)
+        self.parser.keep_shared = True
+        self.parser.keep_cached = True
         self.tables = []
+        self.cell_styles = ws.parent._style_remap or ws.parent._cell_styles
 
 
     def bind_cells(self):
         for idx, row in self.parser.parse():
             for cell in row:
-                style = self.ws.parent._cell_styles[cell['style_id']]
+                style = self.cell_styles[cell['style_id']]
                 c = Cell(self.ws, row=cell['row'], column=cell['column'], style_array=style)
                 c._value = cell['value']
                 c.data_type = cell['data_type']
+                if c.data_type == 'f':
+                    c.cached_value = cell['cached_value']
                 self.ws._cells[(cell['row'], cell['column'])] = c
         self.ws.formula_attributes = self.parser.array_formulae
         if self.ws._cells:
@@ -395,12 +417,8 @@ class WorksheetReader(object):
                 link.target = rel.Target
             if ":" in link.ref:
                 # range of cells
-                for row in self.ws[link.ref]:
-                    for cell in row:
-                        try:
-                            cell.hyperlink = copy(link)
-                        except AttributeError:
-                            pass
+                cr = CellRange(link.ref)
+                self.ws._hyperlink_ranges.add(link, cr.bounds)
             else:
                 cell = self.ws[link.ref]
                 if isinstance(cell, MergedCell):
@@ -412,15 +430,14 @@ class WorksheetReader(object):
         Returns the appropriate cell to which a hyperlink, which references a merged cell at the specified coordinates,
         should be bound.
         """
-        for rng in self.ws.merged_cells:
-            if coord in rng:
-                return self.ws.cell(*rng.top[0])
+        for rng in self.ws.merged_cells.find(coord):
+            return self.ws.cell(*rng.top[0])
 
     def bind_col_dimensions(self):
         for col, cd in self.parser.column_dimensions.items():
             if 'style' in cd:
                 key = int(cd['style'])
-                cd['style'] = self.ws.parent._cell_styles[key]
+                cd['style'] = self.cell_styles[key]
             self.ws.column_dimensions[col] = ColumnDimension(self.ws, **cd)
 
 
@@ -428,7 +445,7 @@ class WorksheetReader(object):
         for row, rd in self.parser.row_dimensions.items():
             if 's' in rd:
                 key = int(rd['s'])
-                rd['s'] = self.ws.parent._cell_styles[key]
+                rd['s'] = self.cell_styles[key]
             self.ws.row_dimensions[int(row)] = RowDimension(self.ws, **rd)
 
 
@@ -2,6 +2,7 @@
 
 import atexit
 from collections import defaultdict
+from itertools import chain
 from io import BytesIO
 import os
 from tempfile import NamedTemporaryFile
@@ -15,6 +16,7 @@ from openpyxl.packaging.relationship import Relationship, RelationshipList
 from openpyxl.styles.differential import DifferentialStyle
 
 from .dimensions import SheetDimension
+from .formula import shared_formulae
 from .hyperlink import HyperlinkList
 from .merge import MergeCell, MergeCells
 from .related import Related
@@ -52,6 +54,7 @@ class WorksheetWriter:
             out = create_temporary_file()
         self.out = out
         self._rels = RelationshipList()
+        self._shared = {}
         self.xf = self.get_stream()
         next(self.xf) # start generator
 
@@ -107,8 +110,10 @@ class WorksheetWriter:
         """Return all rows, and any cells that they contain"""
         # order cells by row
         rows = defaultdict(list)
-        for (row, col), cell in sorted(self.ws._cells.items()):
-            rows[row].append(cell)
+        cells = [cell for _, cell in sorted(self.ws._cells.items())]
+        for cell in cells:
+            rows[cell.row].append(cell)
+        self._shared = shared_formulae(cells)
 
         # add empty rows if styling has been applied
         for row in self.ws.row_dimensions.keys() - rows.keys():
@@ -144,7 +149,7 @@ class WorksheetWriter:
                     and not cell._comment
                     ):
                     continue
-                write_cell(xf, self.ws, cell, cell.has_style)
+                write_cell(xf, self.ws, cell, cell.has_style, self._shared)
 
 
     def write_protection(self):
@@ -199,7 +204,8 @@ class WorksheetWriter:
     def write_hyperlinks(self):
         links = HyperlinkList()
 
-        for link in self.ws._hyperlinks:
+        ranges = getattr(self.ws, "_hyperlink_ranges", ())
+        for link in chain(self.ws._hyperlinks, ranges):
             if link.target:
                 rel = Relationship(type="hyperlink", TargetMode="External", Target=link.target)
                 self._rels.append(rel)
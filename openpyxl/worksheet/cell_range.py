@@ -12,6 +12,45 @@ from openpyxl.utils import (
     get_column_letter,
     quote_sheetname,
 )
+from openpyxl.utils.range_index import RangeIndex
+
+
+def _own(item, owner):
+    """
+    Record that an object belongs to a container, which must be told when it
+    changes
+    """
+    owners = item.__dict__.get("_owners")
+    if owners is None:
+        owners = item.__dict__["_owners"] = {}
+    owners[id(owner)] = owner
+
+
+def _disown(item, owner):
+    owners = item.__dict__.get("_owners")
+    if owners is not None:
+        owners.pop(id(owner), None)
+
+
+def _notify(item):
+    """
+    Tell the containers of an object that it has changed
+    """
+    owners = item.__dict__.get("_owners")
+    if owners:
+        for owner in list(owners.values()):
+            owner._changed()
+
+
+class _Bound(MinMax):
+    """
+    A boundary of a range. Moving a range that belongs to a MultiCellRange
+    makes the index of its ranges out of date.
+    """
+
+    def __set__(self, instance, value):
+        MinMax.__set__(self, instance, value)
+        _notify(instance)
 
 
 class CellRange(Serialisable):
@@ -38,10 +77,10 @@ class CellRange(Serialisable):
 
     """
 
-    min_col = MinMax(min=1, max=18278, expected_type=int)
-    min_row = MinMax(min=1, max=1048576, expected_type=int)
-    max_col = MinMax(min=1, max=18278, expected_type=int)
-    max_row = MinMax(min=1, max=1048576, expected_type=int)
+    min_col = _Bound(min=1, max=18278, expected_type=int)
+    min_row = _Bound(min=1, max=1048576, expected_type=int)
+    max_col = _Bound(min=1, max=18278, expected_type=int)
+    max_row = _Bound(min=1, max=1048576, expected_type=int)
 
 
     def __init__(self, range_string=None, min_col=None, min_row=None,
@@ -417,6 +456,73 @@ class CellRange(Serialisable):
         return [(row, self.max_col) for row in range(self.min_row, self.max_row+1)]
 
 
+def _subtract(bounds, other):
+    """
+    Return the bounds of the rectangles that remain when other is removed
+    from bounds.
+    """
+    min_col, min_row, max_col, max_row = bounds
+    o_min_col, o_min_row, o_max_col, o_max_row = other
+    if (o_min_col > max_col or o_max_col < min_col
+        or o_min_row > max_row or o_max_row < min_row):
+        return [bounds]
+
+    pieces = []
+    if o_min_row > min_row:
+        pieces.append((min_col, min_row, max_col, o_min_row - 1))
+    if o_max_row < max_row:
+        pieces.append((min_col, o_max_row + 1, max_col, max_row))
+    top = max(min_row, o_min_row)
+    bottom = min(max_row, o_max_row)
+    if o_min_col > min_col:
+        pieces.append((min_col, top, o_min_col - 1, bottom))
+    if o_max_col < max_col:
+        pieces.append((o_max_col + 1, top, max_col, bottom))
+    return pieces
+
+
+def _adjacent(bounds, other):
+    """
+    Check whether two rectangles share a complete edge
+    """
+    min_col, min_row, max_col, max_row = bounds
+    o_min_col, o_min_row, o_max_col, o_max_row = other
+    if min_row == o_min_row and max_row == o_max_row:
+        return o_max_col == min_col - 1 or o_min_col == max_col + 1
+    if min_col == o_min_col and max_col == o_max_col:
+        return o_max_row == min_row - 1 or o_min_row == max_row + 1
+    return False
+
+
+class _CountingList(list):
+    """
+    A list that tells the MultiCellRange it belongs to when it is changed
+    """
+
+    _owner = None
+
+    def _changed(self):
+        if self._owner is not None:
+            self._owner._changed()
+
+
+def _changes(name):
+    method = getattr(list, name)
+
+    def change(self, *args, **kw):
+        result = method(self, *args, **kw)
+        self._changed()
+        return result
+
+    change.__name__ = name
+    return change
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append",
+              "extend", "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_CountingList, _name, _changes(_name))
+
+
 class MultiCellRange(Strict):
 
 
@@ -429,12 +535,96 @@ class MultiCellRange(Strict):
         self.ranges = ranges
 
 
+    _index = None
+    _index_version = None
+    _version = 0
+
+
+    def __setattr__(self, name, value):
+        super(MultiCellRange, self).__setattr__(name, value)
+        if name == "ranges":
+            ranges = self.__dict__["ranges"] = _CountingList(self.ranges)
+            ranges._owner = self
+            self._index = None
+            self._changed()
+
+
+    def _changed(self):
+        """
+        Count a change to the ranges and tell the owners of this object
+        """
+        self._version += 1
+        _notify(self)
+
+
+    def _indexed(self):
+        """
+        Mark the index as up to date with the ranges
+        """
+        self._index_version = self._version
+
+
+    @property
+    def _range_index(self):
+        """
+        Spatial index of the member ranges.
+
+        The index is maintained by the methods that change the ranges and
+        rebuilt if the list of ranges, or any of the ranges, have been changed
+        directly.
+        """
+        index = self._index
+        if index is None or self._index_version != self._version:
+            index = RangeIndex()
+            for r in self.ranges:
+                _own(r, self)
+                index.add(r, r.bounds)
+            self._index = index
+            self._indexed()
+        return index
+
+
+    def find(self, coord):
+        """
+        Return the member ranges that contain a cell coordinate or CellRange
+        """
+        if not isinstance(coord, CellRange):
+            coord = CellRange(coord)
+        return [r for r in self._range_index.enclosing(coord.bounds) if coord <= r]
+
+
+    def overlapping(self, coord):
+        """
+        Return the member ranges that share at least one cell with a cell
+        coordinate or CellRange
+        """
+        if not isinstance(coord, CellRange):
+            coord = CellRange(coord)
+        return self._range_index.overlapping(coord.bounds)
+
+
     def __contains__(self, coord):
+        """
+        Check whether every cell of a cell coordinate or CellRange is in one
+        of the ranges. The cells do not need to be in the same range, unlike
+        :meth:`find` which only returns ranges that contain all of them.
+        """
         if isinstance(coord, str):
             coord = CellRange(coord)
-        for r in self.ranges:
+        index = self._range_index
+        for r in index.enclosing(coord.bounds):
             if coord <= r:
                 return True
+
+        # the range may still be covered by several ranges together
+        remaining = [coord.bounds]
+        for r in index.overlapping(coord.bounds):
+            if r.title and coord.title and r.title != coord.title:
+                continue
+            remaining = [piece for bounds in remaining
+                         for piece in _subtract(bounds, r.bounds)]
+            if not remaining:
+                return True
         return False
 
 
@@ -459,8 +649,12 @@ class MultiCellRange(Strict):
             cr = CellRange(coord)
         elif not isinstance(coord, CellRange):
             raise ValueError("You can only add CellRanges")
-        if cr not in self:
+        if not self.find(cr): # not already part of a single range
+            index = self._range_index
             self.ranges.append(cr)
+            _own(cr, self)
+            index.add(cr, cr.bounds)
+            self._indexed()
 
 
     def __iadd__(self, coord):
@@ -468,6 +662,140 @@ class MultiCellRange(Strict):
         return self
 
 
+    @staticmethod
+    def _to_ranges(other):
+        """
+        Convert a range string, CellRange or MultiCellRange to a list of
+        CellRanges
+        """
+        if isinstance(other, str):
+            return [CellRange(r) for r in other.split()]
+        if isinstance(other, CellRange):
+            return [other]
+        return list(other)
+
+
+    def _replace(self, index, removed, added):
+        """
+        Remove and add ranges that have already been removed from and added to
+        the index.
+        """
+        if removed:
+            for r in self.ranges:
+                if id(r) in removed:
+                    _disown(r, self)
+            added = [r for r in added if id(r) not in removed]
+            self.ranges[:] = [r for r in self.ranges if id(r) not in removed] + added
+        else:
+            self.ranges.extend(added)
+        for r in added:
+            _own(r, self)
+        self._indexed()
+
+
+    def _coalesce(self, index, cr, removed, added):
+        """
+        Merge a range with any neighbours that share a complete edge
+        """
+        while True:
+            min_col, min_row, max_col, max_row = cr.bounds
+            search = (min_col - 1, min_row - 1, max_col + 1, max_row + 1)
+            for other in index.overlapping(search):
+                if other is not cr and _adjacent(cr.bounds, other.bounds):
+                    break
+            else:
+                return
+
+            for r in (cr, other):
+                index.remove(r)
+                removed.add(id(r))
+            cr = CellRange(
+                min_col=min(min_col, other.min_col),
+                min_row=min(min_row, other.min_row),
+                max_col=max(max_col, other.max_col),
+                max_row=max(max_row, other.max_row),
+            )
+            index.add(cr, cr.bounds)
+            added.append(cr)
+
+
+    def update(self, other):
+        """
+        Add all the cells of a range string, CellRange or MultiCellRange.
+
+        Unlike :meth:`add`, ranges are kept as a normalised set of disjoint
+        rectangles: parts already covered are skipped and neighbouring
+        ranges are combined where possible.
+        """
+        index = self._range_index
+        removed = set()
+        added = []
+        for cr in self._to_ranges(other):
+            pieces = [cr.bounds]
+            for r in index.overlapping(cr.bounds):
+                pieces = [piece for bounds in pieces
+                          for piece in _subtract(bounds, r.bounds)]
+            for min_col, min_row, max_col, max_row in pieces:
+                piece = CellRange(min_col=min_col, min_row=min_row,
+                                  max_col=max_col, max_row=max_row)
+                index.add(piece, piece.bounds)
+                added.append(piece)
+                self._coalesce(index, piece, removed, added)
+        self._replace(index, removed, added)
+
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+    def difference_update(self, other):
+        """
+        Remove all the cells of a range string, CellRange or MultiCellRange.
+        Ranges that are only partly covered are split.
+        """
+        index = self._range_index
+        removed = set()
+        added = []
+        for cr in self._to_ranges(other):
+            for r in index.overlapping(cr.bounds):
+                index.remove(r)
+                removed.add(id(r))
+                for min_col, min_row, max_col, max_row in _subtract(r.bounds, cr.bounds):
+                    piece = CellRange(min_col=min_col, min_row=min_row,
+                                      max_col=max_col, max_row=max_row)
+                    index.add(piece, piece.bounds)
+                    added.append(piece)
+        self._replace(index, removed, added)
+
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+
+    def union(self, other):
+        """
+        Return a new MultiCellRange with the cells of both
+        """
+        new = copy(self)
+        new.update(other)
+        return new
+
+    __or__ = union
+
+
+    def difference(self, other):
+        """
+        Return a new MultiCellRange with the cells that are not in other
+        """
+        new = copy(self)
+        new.difference_update(other)
+        return new
+
+    __sub__ = difference
+
+
     def __eq__(self, other):
         if  isinstance(other, str):
             other = self.__class__(other)
@@ -485,7 +813,11 @@ class MultiCellRange(Strict):
     def remove(self, coord):
         if not isinstance(coord, CellRange):
             coord = CellRange(coord)
-        self.ranges.remove(coord)
+        index = self._range_index
+        removed = self.ranges.pop(self.ranges.index(coord))
+        index.remove(removed)
+        _disown(removed, self)
+        self._indexed()
 
 
     def __iter__(self):
@@ -494,8 +826,4 @@ class MultiCellRange(Strict):
 
 
     def __copy__(self):
-        n = MultiCellRange()
-
-        for r in self.ranges:
-            n.ranges.append(copy(r))
-        return n
+        return MultiCellRange([copy(r) for r in self.ranges])
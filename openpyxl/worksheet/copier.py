@@ -3,6 +3,7 @@
 #standard lib imports
 from copy import copy
 
+from .cell_range import CellRange
 from .worksheet import Worksheet
 
 
@@ -39,6 +40,9 @@ class WorksheetCopy(object):
         self.target.sheet_format = copy(self.source.sheet_format)
         self.target.sheet_properties = copy(self.source.sheet_properties)
         self.target.merged_cells = copy(self.source.merged_cells)
+        for link in self.source._hyperlink_ranges:
+            cr = CellRange(link.ref)
+            self.target._hyperlink_ranges.add(copy(link), cr.bounds)
         self.target.page_margins = copy(self.source.page_margins)
         self.target.page_setup = copy(self.source.page_setup)
         self.target.print_options = copy(self.source.print_options)
@@ -54,8 +58,8 @@ class WorksheetCopy(object):
             if source_cell.has_style:
                 target_cell._style = copy(source_cell._style)
 
-            if source_cell.hyperlink:
-                target_cell._hyperlink = copy(source_cell.hyperlink)
+            if source_cell._hyperlink:
+                target_cell._hyperlink = copy(source_cell._hyperlink)
 
             if source_cell.comment:
                 target_cell.comment = copy(source_cell.comment)
@@ -1,8 +1,6 @@
 # Copyright (c) 2010-2021 openpyxl
 
-from collections import defaultdict
-from itertools import chain
-from operator import itemgetter
+from operator import is_
 
 from openpyxl.descriptors.serialisable import Serialisable
 from openpyxl.descriptors import (
@@ -16,11 +14,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.nested import NestedText
 
-from openpyxl.utils import (
-    rows_from_range,
-    coordinate_to_tuple,
-    get_column_letter,
-)
+from openpyxl.utils import get_column_letter
 
 
 def collapse_cell_addresses(cells, input_ranges=()):
@@ -29,30 +23,12 @@ def collapse_cell_addresses(cells, input_ranges=()):
 
         E.g. Cells A1, A2, A3, B1, B2 and B3 should have the data-validation
         object applied, attempt to collapse down to a single range, A1:B3.
-
-        Currently only collapsing contiguous vertical ranges (i.e. above
-        example results in A1:A3 B1:B3).
     """
-
+    collapsed = MultiCellRange()
+    for cell in cells:
+        collapsed.update(cell)
     ranges = list(input_ranges)
-
-    # convert cell into row, col tuple
-    raw_coords = (coordinate_to_tuple(cell) for cell in cells)
-
-    # group by column in order
-    grouped_coords = defaultdict(list)
-    for row, col in sorted(raw_coords, key=itemgetter(1)):
-        grouped_coords[col].append(row)
-
-    # create range string from first and last row in column
-    for col, cells in grouped_coords.items():
-        col = get_column_letter(col)
-        fmt = "{0}{1}:{2}{3}"
-        if len(cells) == 1:
-            fmt = "{0}{1}"
-        r = fmt.format(col, min(cells), col, max(cells))
-        ranges.append(r)
-
+    ranges.extend(str(r) for r in collapsed)
     return " ".join(ranges)
 
 
@@ -62,13 +38,14 @@ def expand_cell_ranges(range_string):
     Reverse of collapse_cell_addresses
     Eg. converts "A1:A2 B1:B2" to (A1, A2, B1, B2)
     """
-    # expand ranges to rows and then flatten
-    rows = (rows_from_range(rs) for rs in range_string.split()) # list of rows
-    cells = (chain(*row) for row in rows) # flatten rows
-    return set(chain(*cells))
+    expanded = MultiCellRange()
+    expanded.update(range_string)
+    return set(u"{0}{1}".format(get_column_letter(col), row)
+               for cr in expanded for row, col in cr.cells)
 
 
-from .cell_range import MultiCellRange
+from openpyxl.utils.range_index import RangeIndex
+from .cell_range import CellRange, MultiCellRange, _own, _notify
 
 
 class DataValidation(Serialisable):
@@ -141,11 +118,25 @@ class DataValidation(Serialisable):
         self.errorTitle = errorTitle
 
 
+    def __setattr__(self, name, value):
+        super(DataValidation, self).__setattr__(name, value)
+        if name == "sqref":
+            _own(self.sqref, self)
+            self._changed()
+
+
+    def _changed(self):
+        """
+        Tell the lists of validations that the cell ranges have changed
+        """
+        _notify(self)
+
+
     def add(self, cell):
         """Adds a cell or cell coordinate to this validator"""
         if hasattr(cell, "coordinate"):
             cell = cell.coordinate
-        self.sqref += cell
+        self.sqref.update(cell)
 
 
     def __contains__(self, cell):
@@ -192,6 +183,51 @@ class DataValidationList(Serialisable):
         self.dataValidation.append(dv)
 
 
+    _version = 0
+
+
+    def _changed(self):
+        self._version += 1
+
+
+    def _range_index(self):
+        """
+        Spatial index of the validations by their cell ranges.
+
+        Validations can be changed after they have been added so the index is
+        rebuilt when validations have been added or removed, or the ranges of
+        any validation have changed.
+        """
+        validations = self.dataValidation
+        cached = self.__dict__.get("_index")
+        if cached is not None:
+            members, version, index = cached
+            if (version == self._version and len(members) == len(validations)
+                and all(map(is_, members, validations))):
+                return index
+
+        index = RangeIndex()
+        for dv in validations:
+            _own(dv, self)
+            for cr in dv.sqref:
+                _own(cr, dv.sqref)
+                index.add(dv, cr.bounds)
+        self._index = list(validations), self._version, index
+        return index
+
+
+    def find(self, coord):
+        """
+        Return the validations that apply to any part of a cell, cell
+        coordinate or range
+        """
+        if hasattr(coord, "coordinate"):
+            coord = coord.coordinate
+        if not isinstance(coord, CellRange):
+            coord = CellRange(coord)
+        return self._range_index().overlapping(coord.bounds)
+
+
     def to_tree(self, tagname=None):
         """
         Need to skip validations that have no cell ranges
@@ -0,0 +1,124 @@
+# Copyright (c) 2010-2021 openpyxl
+
+"""
+Shared formulae: a formula entered in one cell and filled across a range of
+cells, stored once instead of once per cell.
+"""
+
+from openpyxl.formula.tokenizer import TokenizerError
+from openpyxl.formula.translate import compile_formula, TranslatorError
+from openpyxl.utils import get_column_letter
+
+
+# shortest run of formulae filled down a column written as a shared formula
+MIN_SHARED = 2
+
+
+class SharedFormula(object):
+    """
+    A formula shared by a group of cells read from a file.
+
+    Every cell in the group refers to the same object. The formula of a cell
+    is the formula of the first cell translated to it, and is only worked out
+    when the value of the cell is used.
+    """
+
+    __slots__ = ("text", "row", "column", "_template")
+
+    def __init__(self, text, row, column):
+        self.text = text
+        self.row = row
+        self.column = column
+        self._template = None
+
+
+    def formula(self, row, column):
+        """
+        The formula for a cell in the group
+        """
+        if row == self.row and column == self.column:
+            return self.text
+        template = self._template
+        if template is None:
+            template = self._template = compile_formula(self.text)
+        return template.translate(row - self.row, column - self.column)
+
+
+    def __repr__(self):
+        return "<{0} {1} at {2}{3}>".format(self.__class__.__name__,
+            self.text, get_column_letter(self.column), self.row)
+
+
+def _fills(master, cell):
+    """
+    Whether the formula of a cell is that of the cell above it filled down
+    """
+    try:
+        template = compile_formula(master._value)
+        return template.translate_rows(cell.row - master.row) == cell._value
+    except (TokenizerError, TranslatorError):
+        return False
+
+
+def shared_formulae(cells, size=MIN_SHARED):
+    """
+    The <f> elements of the cells of a worksheet, given in order of rows,
+    that are written as shared formulae: attributes and the text for the
+    first cell of a group, by coordinate.
+
+    Groups read from files are kept and runs of at least size formulae
+    filled down a column are shared. The first cell of a group is the top
+    left cell of its range. The cells are not changed, and formulae are
+    only tokenised when the cell below has a formula as well.
+    """
+    groups = {}
+    runs = {} # column: cells of the current run
+    for cell in cells:
+        if cell.data_type != "f":
+            continue
+        value = cell._value
+        if value.__class__ is SharedFormula:
+            groups.setdefault(value, []).append(cell)
+            continue
+        if value.__class__ is not str:
+            continue
+
+        col = cell.column
+        run = runs.get(col)
+        if (run is not None and run[-1].row == cell.row - 1
+            and _fills(run[0], cell)):
+            run.append(cell)
+            continue
+        if run is not None:
+            groups[run[0]] = run
+        attributes = cell.parent.formula_attributes
+        if attributes and cell.coordinate in attributes:
+            runs.pop(col, None) # array formula
+        else:
+            runs[col] = [cell]
+    for run in runs.values():
+        groups[run[0]] = run
+
+    masters = []
+    for members in groups.values():
+        if len(members) < size:
+            continue
+        min_row = min(c.row for c in members)
+        min_col = min(c.column for c in members)
+        master = members[0]
+        if (master.row, master.column) != (min_row, min_col):
+            continue # written as ordinary formulae
+        max_row = max(c.row for c in members)
+        max_col = max(c.column for c in members)
+        ref = "{0}{1}:{2}{3}".format(get_column_letter(min_col), min_row,
+                                     get_column_letter(max_col), max_row)
+        masters.append(((min_row, min_col), ref, members))
+
+    shared = {}
+    masters.sort(key=lambda m: m[0])
+    for si, (coord, ref, members) in enumerate(masters):
+        si = f"{si}"
+        for cell in members[1:]:
+            shared[(cell.row, cell.column)] = ({'t': 'shared', 'si': si}, None)
+        shared[coord] = ({'t': 'shared', 'ref': ref, 'si': si}, members[0].value)
+    return shared
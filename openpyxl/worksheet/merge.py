@@ -1,7 +1,5 @@
 # Copyright (c) 2010-2021 openpyxl
 
-import copy
-
 from openpyxl.descriptors.serialisable import Serialisable
 from openpyxl.descriptors import (
     Integer,
@@ -59,8 +57,8 @@ class MergedCellRange(CellRange):
     """
     MergedCellRange stores the border information of a merged cell in the top
     left cell of the merged cell.
-    The remaining cells in the merged cell are stored as MergedCell objects and
-    get their border information from the upper left cell.
+    The remaining cells in the merged cell are represented by MergedCell
+    objects, which get their border information from the upper left cell.
     """
 
     def __init__(self, worksheet, coord):
@@ -92,8 +90,9 @@ class MergedCellRange(CellRange):
 
     def format(self):
         """
-        Each cell of the merged cell is created as MergedCell if it does not
-        already exist.
+        Only the MergedCells at the edge of the merged cell that need borders
+        are created. Other MergedCells are created by the worksheet when they
+        are accessed.
 
         The MergedCells at the edge of the merged cell gets its borders from
         the upper left cell.
@@ -105,6 +104,7 @@ class MergedCellRange(CellRange):
         """
 
         names = ['top', 'left', 'right', 'bottom']
+        start = (self.min_row, self.min_col)
 
         for name in names:
             side = getattr(self.start_cell.border, name)
@@ -112,6 +112,8 @@ class MergedCellRange(CellRange):
                 continue # don't need to do anything if there is no border style
             border = Border(**{name:side})
             for coord in getattr(self, name):
+                if coord == start:
+                    continue
                 cell = self.ws._cells.get(coord)
                 if cell is None:
                     row, col = coord
@@ -119,19 +121,6 @@ class MergedCellRange(CellRange):
                     self.ws._cells[(cell.row, cell.column)] = cell
                 cell.border += border
 
-        protected = self.start_cell.protection is not None
-        if protected:
-            protection = copy.copy(self.start_cell.protection)
-        for coord in self.cells:
-            cell = self.ws._cells.get(coord)
-            if cell is None:
-                row, col = coord
-                cell = MergedCell(self.ws, row=row, column=col)
-                self.ws._cells[(cell.row, cell.column)] = cell
-
-            if protected:
-                cell.protection = protection
-
 
     def __contains__(self, coord):
         return coord in CellRange(self.coord)
@@ -14,7 +14,7 @@ from openpyxl.descriptors import (
 from openpyxl.descriptors.excel import ExtensionList, CellRange
 from openpyxl.descriptors.sequence import NestedSequence
 from openpyxl.xml.constants import SHEET_MAIN_NS, REL_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import archive_stream
 from openpyxl.utils import range_boundaries
 from openpyxl.utils.escape import escape, unescape
 
@@ -292,10 +292,10 @@ class Table(Serialisable):
         self.tableStyleInfo = tableStyleInfo
 
 
-    def to_tree(self):
-        tree = super(Table, self).to_tree()
-        tree.set("xmlns", SHEET_MAIN_NS)
-        return tree
+    def _element(self, tagname=None, namespace=None):
+        el, namespace = super(Table, self)._element(tagname, namespace)
+        el.set("xmlns", SHEET_MAIN_NS)
+        return el, namespace
 
 
     @property
@@ -310,8 +310,8 @@ class Table(Serialisable):
         """
         Serialise to XML and write to archive
         """
-        xml = self.to_tree()
-        archive.writestr(self.path[1:], tostring(xml))
+        with archive_stream(archive, self.path[1:]) as xf:
+            self.to_stream(xf)
 
 
     def _initialise_columns(self):
@@ -327,6 +327,12 @@ class TestMultiCellRange:
         assert cells == "A1:D4"
 
 
+    def test_add_spanning(self, MultiCellRange):
+        cells = MultiCellRange("A1:A2 A3:A4")
+        cells.add("A1:A4")
+        assert cells == "A1:A2 A3:A4 A1:A4"
+
+
     def test_repr(self, MultiCellRange, CellRange):
         cr1 = CellRange("a1")
         cr2 = CellRange("B2")
@@ -345,6 +351,112 @@ class TestMultiCellRange:
         assert "F6" not in cells
 
 
+    def test_contains_after_change(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:D5")
+        cells.add("F6:F10")
+        assert "F8" in cells
+        cells.remove("A1:D5")
+        assert "C3" not in cells
+        cells.ranges.append(CellRange("Z1"))
+        assert "Z1" in cells
+        cells.ranges = [CellRange("A1")]
+        assert "F8" not in cells
+
+
+    def test_contains_after_moving_member(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:B2 D4")
+        assert "A1" in cells
+        cells.ranges[0].shift(row_shift=10)
+        assert "A11" in cells
+        assert "A1" not in cells
+        cells.ranges[0] = CellRange("C3:D4")
+        assert "C3" in cells
+        assert "A11" not in cells
+
+
+    def test_index_per_container(self, MultiCellRange):
+        first = MultiCellRange("A1:B2")
+        second = MultiCellRange("D4")
+        index = second._range_index
+        first.ranges[0].shift(row_shift=10)
+        first.add("F6")
+        assert second._range_index is index
+        shared = MultiCellRange(first.ranges)
+        assert "A11" in shared
+        first.ranges[0].shift(col_shift=5)
+        assert "A11" not in shared
+
+
+    def test_find(self, MultiCellRange):
+        cells = MultiCellRange("A1:D5 C3:E7 G1")
+        assert [str(r) for r in cells.find("C4")] == ["A1:D5", "C3:E7"]
+        assert [str(r) for r in cells.find("D4:E5")] == ["C3:E7"]
+        assert cells.find("H1") == []
+
+
+    def test_overlapping(self, MultiCellRange):
+        cells = MultiCellRange("A1:D5 C3:E7 G1")
+        assert [str(r) for r in cells.overlapping("E1:G2")] == ["G1"]
+        assert [str(r) for r in cells.overlapping("D5:G7")] == ["A1:D5", "C3:E7"]
+
+
+    def test_contains_spanning(self, MultiCellRange):
+        cells = MultiCellRange("A1:B2 C1:C2")
+        assert "A2:C2" in cells
+        assert "A2:D2" not in cells
+        assert cells.find("A2:C2") == []
+        cells = MultiCellRange("Sheet1!A1:B2 Sheet2!C1:C2")
+        assert "Sheet1!A2:C2" not in cells
+
+
+    @pytest.mark.parametrize("ranges, other, expected",
+                             [
+                                 ("A1:B2", "B2:C3", "A1:B2 B3:C3 C2"),
+                                 ("A1", "A2", "A1:A2"),
+                                 ("A1 C1", "B1", "A1:C1"),
+                                 ("A1:D4", "B2", "A1:D4"),
+                                 ("A1:B1 A3:B3", "A2:B2", "A1:B3"),
+                             ]
+                             )
+    def test_update(self, MultiCellRange, ranges, other, expected):
+        cells = MultiCellRange(ranges)
+        cells.update(other)
+        assert cells == expected
+
+
+    def test_update_cell_by_cell(self, MultiCellRange):
+        cells = MultiCellRange()
+        for row in range(1, 101):
+            cells.update("A{0}".format(row))
+        assert cells == "A1:A100"
+        assert "A50" in cells
+
+
+    @pytest.mark.parametrize("ranges, other, expected",
+                             [
+                                 ("A1:C3", "B2", "A1:C1 A3:C3 A2 C2"),
+                                 ("A1:A1048576", "A1", "A2:A1048576"),
+                                 ("A1 B1", "A1:B1", ""),
+                                 ("A1:B2", "D4", "A1:B2"),
+                             ]
+                             )
+    def test_difference_update(self, MultiCellRange, ranges, other, expected):
+        cells = MultiCellRange(ranges)
+        cells.difference_update(other)
+        assert cells == expected
+        assert "A1" not in cells or "A1" not in MultiCellRange(other)
+
+
+    def test_operators(self, MultiCellRange):
+        cells = MultiCellRange("A1:A10")
+        assert cells | "B1:B10" == "A1:B10"
+        assert cells - "A1:A5" == "A6:A10"
+        assert cells == "A1:A10"
+        cells |= "A11"
+        cells -= "A1"
+        assert cells == "A2:A11"
+
+
     def test_eq(self, MultiCellRange):
         cells = MultiCellRange("A1:D4 E5")
         assert cells == "A1:D4 E5"
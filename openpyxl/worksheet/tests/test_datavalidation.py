@@ -84,7 +84,7 @@ class TestDataValidation:
         dv = DataValidation()
         dv.sqref = "A1"
         dv.add(DummyCell())
-        assert dv.cells == MultiCellRange("A1 A2")
+        assert dv.cells == MultiCellRange("A1:A2")
 
 
     def test_read_formula(self, DataValidation):
@@ -160,15 +160,52 @@ class TestDataValidationList:
         assert diff is None, diff
 
 
+    def test_find(self, DataValidationList, DataValidation):
+        dv1 = DataValidation(sqref="A1:A10")
+        dv2 = DataValidation(sqref="A5:C5")
+        dvs = DataValidationList(dataValidation=[dv1, dv2])
+        assert dvs.find("A5") == [dv1, dv2]
+        assert dvs.find("B1:B4") == []
+        dv2.add("B2")
+        assert dvs.find("B1:B4") == [dv2]
+        dv3 = DataValidation(sqref="B3")
+        dvs.append(dv3)
+        assert dvs.find("B3") == [dv3]
+        dv3.sqref = "D1"
+        assert dvs.find("B3") == []
+        dv1.sqref.ranges[0].shift(col_shift=3)
+        assert dvs.find("A1") == []
+        assert dvs.find("D1") == [dv1, dv3]
+        dvs.dataValidation.remove(dv1)
+        assert dvs.find("D1") == [dv3]
+        dvs.dataValidation[1] = dv2
+        assert dvs.find("D1") == []
+        assert type(dvs.dataValidation) is list
+
+
+    def test_copy_after_find(self, DataValidationList, DataValidation):
+        from copy import copy
+        dv = DataValidation(sqref="A1")
+        dvs = DataValidationList(dataValidation=[dv])
+        dvs.find("A1")
+        cp = copy(dvs)
+        assert cp.dataValidation[0] is not dv
+        assert "_index" not in cp.__dict__
+        assert cp.find("A1") == [cp.dataValidation[0]]
+
+
 COLLAPSE_TEST_DATA = [
     (
         ["A1"], "A1"
         ),
     (
-        ["A1", "B1"], "A1 B1"
+        ["A1", "B1"], "A1:B1"
+        ),
+    (
+        ["A1", "A3"], "A1 A3"
         ),
     (
-        ["A1", "A2", "A3", "A4", "B1", "B2", "B3", "B4"], "A1:A4 B1:B4"
+        ["A1", "A2", "A3", "A4", "B1", "B2", "B3", "B4"], "A1:B4"
         ),
     (
         ["A2", "A4", "A3", "A1", "A5"], "A1:A5"
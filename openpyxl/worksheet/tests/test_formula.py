@@ -0,0 +1,116 @@
+# Copyright (c) 2010-2021 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+from openpyxl import Workbook, load_workbook
+
+
+@pytest.fixture
+def SharedFormula():
+    from ..formula import SharedFormula
+    return SharedFormula
+
+
+class TestSharedFormula:
+
+    def test_formula(self, SharedFormula):
+        group = SharedFormula("=SUM(A1:B1)*$C$1", 1, 3)
+        assert group.formula(1, 3) == "=SUM(A1:B1)*$C$1"
+        assert group.formula(5, 4) == "=SUM(B5:C5)*$C$1"
+
+
+    def test_cell_value(self, SharedFormula):
+        ws = Workbook().active
+        group = SharedFormula("=A1+1", 1, 2)
+        for row in (1, 2):
+            ws.cell(row=row, column=2)._value = group
+            ws.cell(row=row, column=2).data_type = "f"
+        assert ws["B2"].value == "=A2+1"
+
+
+def test_shared_formulae():
+    from ..formula import shared_formulae
+    ws = Workbook().active
+    for row in range(1, 5):
+        ws.cell(row=row, column=1, value="=B{0}+$C$1".format(row))
+    ws["A5"] = "=B1"
+    ws["C1"] = "=B1"
+    shared = shared_formulae(cell for _, cell in sorted(ws._cells.items()))
+
+    assert shared == {
+        (1, 1): ({'t': 'shared', 'ref': 'A1:A4', 'si': '0'}, "=B1+$C$1"),
+        (2, 1): ({'t': 'shared', 'si': '0'}, None),
+        (3, 1): ({'t': 'shared', 'si': '0'}, None),
+        (4, 1): ({'t': 'shared', 'si': '0'}, None),
+    }
+    assert [ws.cell(row=row, column=1)._value for row in range(1, 6)] == [
+        "=B1+$C$1", "=B2+$C$1", "=B3+$C$1", "=B4+$C$1", "=B1"]
+
+
+def test_shared_formulae_read(SharedFormula):
+    from ..formula import shared_formulae
+    ws = Workbook().active
+    group = SharedFormula("=A1", 1, 2)
+    for row in range(1, 5):
+        ws.cell(row=row, column=2)._value = group
+        ws.cell(row=row, column=2).data_type = "f"
+    ws["B1"] = 5
+    # the top left cell of the range is not part of the group
+    other = SharedFormula("=A1", 1, 4)
+    for coord in ("D2", "C3", "D3"):
+        ws[coord]._value = other
+        ws[coord].data_type = "f"
+
+    shared = shared_formulae(cell for _, cell in sorted(ws._cells.items()))
+    assert shared[(2, 2)] == ({'t': 'shared', 'ref': 'B2:B4', 'si': '0'}, "=A2")
+    assert shared[(4, 2)] == ({'t': 'shared', 'si': '0'}, None)
+    assert (2, 4) not in shared
+    assert (3, 3) not in shared
+
+
+def test_save_unchanged():
+    wb = Workbook()
+    ws = wb.active
+    for row in range(1, 11):
+        ws.cell(row=row, column=1, value=row)
+        ws.cell(row=row, column=2, value="=A{0}*2".format(row))
+    before = [ws.cell(row=row, column=2)._value for row in range(1, 11)]
+    wb.save(BytesIO())
+    wb.save(BytesIO())
+    assert [ws.cell(row=row, column=2)._value for row in range(1, 11)] == before
+
+
+def test_round_trip():
+    wb = Workbook()
+    ws = wb.active
+    for row in range(1, 101):
+        ws.cell(row=row, column=1, value=row)
+        ws.cell(row=row, column=2, value="=A{0}*2".format(row))
+    out = BytesIO()
+    wb.save(out)
+
+    wb = load_workbook(out)
+    ws = wb.active
+    assert ws["B2"]._value is ws["B100"]._value
+    ws.insert_rows(1)
+    assert ws["B101"].value == "=A100*2"
+
+    out = BytesIO()
+    wb.save(out)
+    ws = load_workbook(out, read_only=True).active
+    assert [row[1] for row in ws.iter_rows(values_only=True)][-1] == "=A100*2"
+
+
+def test_save_malformed_formula():
+    wb = Workbook()
+    ws = wb.active
+    values = ['="unterminated', "=A1+'", "=[1", "=[1"]
+    for row, value in enumerate(values, 1):
+        ws.cell(row=row, column=1, value=value)
+    out = BytesIO()
+    wb.save(out)
+
+    ws = load_workbook(out).active
+    assert [ws.cell(row=row, column=1).value for row in range(1, 5)] == values
@@ -176,12 +176,14 @@ class TestMergedCellRange:
         ws = Workbook().active
         mcr = MergedCellRange(ws, 'A1:C1')
         mcr.start_cell.protection = Protection(locked=False,hidden=False)
+        ws.merged_cells.add(mcr)
         mcr.format()
         assert ws['B1'].protection == Protection(locked=False,hidden=False)
         assert ws['C1'].protection == Protection(locked=False,hidden=False)
 
         mcr = MergedCellRange(ws, 'D1:F1')
         mcr.start_cell.protection = Protection(locked=True,hidden=True)
+        ws.merged_cells.add(mcr)
         mcr.format()
         assert ws['E1'].protection == Protection(locked=True,hidden=True)
         assert ws['F1'].protection == Protection(locked=True,hidden=True)
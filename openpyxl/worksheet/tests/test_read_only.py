@@ -69,6 +69,26 @@ class TestReadOnlyWorksheet:
         assert cell is EMPTY_CELL
 
 
+    def test_formula_cached_value(self, DummyWorkbook):
+        from .._read_only import ReadOnlyWorksheet
+        src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1">
+            <c r="A1" t="str"><f>"a"&amp;"b"</f><v>ab</v></c>
+          </row>
+        </sheetData>
+        </worksheet>
+        """
+        wb = DummyWorkbook
+        wb._archive.writestr("sheet2.xml", src)
+        ws = ReadOnlyWorksheet(wb, "Sheet", "sheet2.xml", [])
+
+        cell = ws._get_cell(1, 1)
+        assert cell.value == '="a"&"b"'
+        assert cell.cached_value == "ab"
+        assert list(ws.values) == [('="a"&"b"',)]
+
+
     def test_empty_cell(self, ReadOnlyWorksheet):
         row = [
             {'column':4, 'value':None, 'row':1},
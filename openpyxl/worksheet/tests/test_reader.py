@@ -15,7 +15,7 @@ from openpyxl.utils.datetime  import CALENDAR_WINDOWS_1900, CALENDAR_MAC_1904
 from openpyxl.styles.styleable import StyleArray
 from openpyxl.styles.borders import DEFAULT_BORDER
 from openpyxl.styles.differential import DifferentialStyle
-from openpyxl.formula.translate import Translator
+from ..formula import SharedFormula
 from ..worksheet import Worksheet
 from ..pagebreak import Break, RowBreak, ColBreak
 from ..scenario import ScenarioList, Scenario, InputCells
@@ -47,6 +47,7 @@ def Workbook():
         _colors = []
         encoding = "utf8"
         epoch = CALENDAR_WINDOWS_1900
+        _style_remap = None
 
         def __init__(self):
             self._differential_styles = [DifferentialStyle()] * 5
@@ -236,6 +237,23 @@ class TestWorksheetParser:
                         'style_id':0, 'value': '=IF(TRUE, "y", "n")'}
 
 
+    def test_formula_cached_value(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.keep_cached = True
+
+        src = """
+        <c r="A1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+            <f>1+2</f>
+            <v>3</v>
+        </c>
+        """
+        element = fromstring(src)
+
+        cell = parser.parse_cell(element)
+        assert cell == {'column': 1, 'data_type': 'f', 'row': 1,
+                        'style_id':0, 'value': '=1+2', 'cached_value': 3}
+
+
     def test_formula_data_only(self, WorkSheetParser):
         parser = WorkSheetParser
         parser.data_only = True
@@ -451,11 +469,26 @@ class TestWorksheetParser:
         </c>
         """
         element = fromstring(src)
-        parser.shared_formulae['0'] = Translator("=A4*B4", "A1")
+        parser.shared_formulae['0'] = SharedFormula("=A4*B4", 1, 1)
         formula = parser.parse_formula(element)
         assert formula == "=A12*B12"
 
 
+    def test_keep_shared_formula(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.keep_shared = True
+        src = """
+        <c r="B2" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <f t="shared" ref="B2:B4" si="0">A2*2</f>
+          <v>2</v>
+        </c>
+        """
+        element = fromstring(src)
+        group = parser.parse_formula(element)
+        assert parser.shared_formulae['0'] is group
+        assert group.formula(4, 2) == "=A4*2"
+
+
     def test_array_formula(self, WorkSheetParser, datadir):
         parser = WorkSheetParser
 
@@ -958,7 +991,10 @@ class TestWorksheetReader:
         reader.bind_hyperlinks()
 
         assert ws['B4'].hyperlink.location == "'STP nn000TL-10, PKG 2.52'!A1"
-        assert ws['B4'].hyperlink.ref == "B4"
+        assert ws['B4'].hyperlink.ref == "B4:B7"
+        assert ws['B7'].hyperlink is ws['B4'].hyperlink
+        assert ws['B8'].hyperlink is None
+        assert (5, 2) not in ws._cells
 
 
     def test_merged_hyperlinks(self, PrimedWorksheetReader):
@@ -108,6 +108,31 @@ class TestWorksheet:
         assert "test" == ws['A1'].value
 
 
+    def test_add_hyperlink(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['C3'].hyperlink = "http://cell.com"
+        ws.add_hyperlink("B2:D4", "http://range.com")
+        assert ws['C3'].hyperlink.target == "http://range.com"
+        assert ws['C3'].hyperlink.ref == "B2:D4"
+        assert ws['E5'].hyperlink is None
+        assert ws['B2'].value is None
+        ws.add_hyperlink("E5", "http://cell.com")
+        assert ws['E5'].hyperlink.ref == "E5"
+        assert ws['E5'].value == "http://cell.com"
+
+
+    def test_hyperlink_in_range(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.add_hyperlink("B2:D4", "http://range.com")
+        ws['C3'].hyperlink = None
+        assert ws['C3'].hyperlink is None
+        ws['B3'].hyperlink = "http://cell.com"
+        assert ws['B3'].hyperlink.target == "http://cell.com"
+        assert ws['D4'].hyperlink.target == "http://range.com"
+        refs = sorted(link.ref for link in ws._hyperlink_ranges)
+        assert refs == ["B2:D2", "B4:D4", "D3"]
+
+
     def test_append(self, Worksheet):
         ws = Worksheet(Workbook())
         ws.append(['value'])
@@ -260,6 +285,136 @@ class TestWorksheet:
         assert next(vals) == (4, 5, 6)
 
 
+    def test_set_values(self, Worksheet):
+        from datetime import date
+        ws = Worksheet(Workbook())
+        ws.set_values("B2", [[1, "a", date(2021, 1, 1)], [2.5, "=B2", None, True]])
+        assert ws.get_values("B2:E3") == (
+            (1, "a", date(2021, 1, 1), None),
+            (2.5, "=B2", None, True),
+        )
+        assert [c.data_type for c in ws[2][1:4]] == ['n', 's', 'd']
+        assert [c.data_type for c in ws[3][1:5]] == ['n', 'f', 'n', 'b']
+        assert ws["D2"].number_format == "yyyy-mm-dd"
+        assert ws.max_row == 3
+
+
+    def test_set_values_keeps_style(self, Worksheet):
+        from openpyxl.styles import Font
+        ws = Worksheet(Workbook())
+        ws["A1"].font = Font(bold=True)
+        ws.set_values("A1", [["x"]], types="s")
+        assert ws["A1"].value == "x"
+        assert ws["A1"].font.bold is True
+
+
+    @pytest.mark.parametrize("values, types",
+                             [
+                                 ([["\x01"]], None),
+                                 ([["\x01"]], "s"),
+                                 ([[object()]], None),
+                                 ([[1]], "x"),
+                                 ([[1, 2]], "s"),
+                                 ([["a"]], "n"),
+                                 ([[1, True]], "n"),
+                                 ([[1, "2021-01-01"]], [None, "d"]),
+                             ]
+                             )
+    def test_set_invalid_values(self, Worksheet, values, types):
+        from openpyxl.utils.exceptions import IllegalCharacterError
+        ws = Worksheet(Workbook())
+        with pytest.raises((ValueError, IllegalCharacterError)):
+            ws.set_values("A1", values, types)
+
+
+    def test_set_declared_values(self, Worksheet):
+        from datetime import date
+        ws = Worksheet(Workbook())
+        ws.set_values("A1", [[1, "a", date(2021, 1, 1)], [2.5, "=B1", None]],
+                      types=["n", "s", "d"])
+        assert [c.data_type for c in ws[1]] == ['n', 's', 'd']
+        assert [c.data_type for c in ws[2][:2]] == ['n', 's']
+        assert ws["B2"].value == "=B1"
+
+
+    def test_set_declared_long_string(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.set_values("A1", [["x" * 40000]], types="s")
+        assert len(ws["A1"].value) == 32767
+
+
+    def test_set_values_merged(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("B1:C1")
+        ws.set_values("A1", [[1, 2, None]])
+        assert ws["B1"].value == 2
+        with pytest.raises(ValueError, match="C1"):
+            ws.set_values("A1", [[1, 2, 3]])
+
+
+    def test_apply_style(self, Worksheet):
+        from openpyxl.styles import Font, PatternFill
+        ws = Worksheet(Workbook())
+        ws["B2"].fill = PatternFill("solid", fgColor="FF0000")
+        ws.apply_style("A1:C3", font=Font(bold=True), number_format="0.00")
+        assert len(ws._cells) == 9
+        assert ws["A1"].font.bold is True
+        assert ws["A1"].number_format == "0.00"
+        assert ws["B2"].font.bold is True
+        assert ws["B2"].fill.fgColor.rgb == "00FF0000"
+        assert ws["A1"]._style is not ws["C3"]._style
+        assert ws["A1"]._style == ws["C3"]._style
+        assert ws.max_row == 3
+
+
+    def test_apply_style_columns(self, Worksheet):
+        from openpyxl.styles import Font
+        ws = Worksheet(Workbook())
+        ws["B5"] = 1
+        ws.apply_style("B:C", font=Font(italic=True))
+        assert ws.column_dimensions["B"].font.italic is True
+        assert ws.column_dimensions["C"].font.italic is True
+        assert ws["B5"].font.italic is True
+        assert list(ws._cells) == [(5, 2)]
+
+
+    def test_apply_style_rows(self, Worksheet):
+        from openpyxl.styles import Alignment
+        ws = Worksheet(Workbook())
+        ws["B5"] = 1
+        ws.apply_style("5:6", alignment=Alignment(wrap_text=True))
+        assert ws.row_dimensions[6].alignment.wrap_text is True
+        assert ws["B5"].alignment.wrap_text is True
+
+
+    def test_apply_named_style(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.apply_named_style("A1:B2", "Note")
+        assert ws["B2"].style == "Note"
+        assert "Note" in ws.parent.named_styles
+
+
+    def test_get_values(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws["B2"] = 5
+        assert ws.get_values("A1:B2") == ((None, None), (None, 5))
+        assert ws.get_values("B:B") == ((None,), (5,))
+        assert list(ws._cells) == [(2, 2)]
+
+
+    @pytest.mark.numpy_required
+    def test_numpy_values(self, Worksheet):
+        import numpy
+        from datetime import datetime
+        ws = Worksheet(Workbook())
+        ws.set_values("A1", numpy.arange(4).reshape(2, 2), types="n")
+        ws.set_values("C1", numpy.array([["2021-01-01"]], dtype="datetime64[ns]"))
+        values = ws.get_values("A1:C2", as_numpy=True)
+        assert values.shape == (2, 3)
+        assert values.tolist() == [[0, 1, datetime(2021, 1, 1)], [2, 3, None]]
+        assert type(values[0, 0]) is int
+
+
     def test_auto_filter(self, Worksheet):
         ws = Worksheet(Workbook())
 
@@ -387,6 +542,49 @@ class TestWorksheet:
         assert ws.merged_cells == "A1:B4"
 
 
+    def test_merge_does_not_create_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A1:XFD1")
+        assert list(ws._cells) == [(1, 1)]
+        cell = ws["C1"]
+        assert cell.__class__.__name__ == "MergedCell"
+        assert ws["C1"] is cell
+        assert ws["A2"].__class__.__name__ == "Cell"
+
+
+    def test_merged_cell_protection(self, Worksheet):
+        from openpyxl.styles import Protection
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A1:B2")
+        ws["A1"].protection = Protection(locked=False)
+        cell = ws["B2"]
+        assert cell.protection == Protection(locked=False)
+        assert cell.has_style
+        ws["A1"].protection = Protection(hidden=True)
+        assert cell.protection == Protection(hidden=True)
+        assert cell.style_id == ws["A1"].style_id
+        cell.protection = Protection(locked=False)
+        assert cell.protection == Protection(locked=False)
+
+
+    def test_merged_dimensions(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws["B2"] = 1
+        ws.merge_cells("B2:D5")
+        assert (ws.min_row, ws.max_row) == (2, 5)
+        assert (ws.min_column, ws.max_column) == (2, 4)
+        assert ws.calculate_dimension() == "B2:D5"
+
+
+    def test_unmerge_accessed(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A1:D4")
+        ws["C3"]
+        ws.unmerge_cells("A1:D4")
+        assert list(ws._cells) == [(1, 1)]
+        assert ws["C3"].__class__.__name__ == "Cell"
+
+
     def test_unmerge_range_string(self, Worksheet):
         ws = Worksheet(Workbook())
         ws.merge_cells("A1:D4")
@@ -74,6 +74,17 @@ class TestWorksheetCopy:
         assert ws1.merged_cells.ranges == ws2.merged_cells.ranges
 
 
+    def test_range_hyperlink_copy(self, copier):
+        from ..hyperlink import Hyperlink
+        ws1 = copier.source
+        ws2 = copier.target
+        link = Hyperlink(ref="B2:C3", target="http://www.example.com")
+        ws1._hyperlink_ranges.add(link, (2, 2, 3, 3))
+        copier.copy_worksheet()
+        assert ws2["C3"].hyperlink == link
+        assert ws2["C3"].hyperlink is not link
+
+
     def test_cell_copy_value(self, copier):
         ws1 = copier.source
         ws2 = copier.target
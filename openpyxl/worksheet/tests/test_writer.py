@@ -283,6 +283,27 @@ class TestWorksheetWriter:
         assert diff is None, diff
 
 
+    def test_range_hyperlinks(self, writer):
+        from ..hyperlink import Hyperlink
+
+        ws = writer.ws
+        link = Hyperlink(ref="A1:Z1000", location="Sheet!A1")
+        ws._hyperlink_ranges.add(link, (1, 1, 26, 1000))
+        writer.write_hyperlinks()
+
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <hyperlinks>
+          <hyperlink location="Sheet!A1" ref="A1:Z1000"/>
+        </hyperlinks>
+        </worksheet>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+        assert ws._cells == {}
+
+
     def test_print(self, writer):
 
         writer.ws.print_options.headings = True
@@ -517,6 +538,38 @@ class TestWorksheetWriter:
         assert diff is None, diff
 
 
+    def test_write_rows_shared_formula(self, writer):
+
+        ws = writer.ws
+        for row in range(1, 4):
+            ws.cell(row=row, column=2, value="=A{0}*2".format(row))
+        ws["B4"] = "=A1*2"
+        writer.write_rows()
+
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1">
+            <c r="B1"><f t="shared" ref="B1:B3" si="0">A1*2</f><v></v></c>
+          </row>
+          <row r="2">
+            <c r="B2"><f t="shared" si="0"/><v></v></c>
+          </row>
+          <row r="3">
+            <c r="B3"><f t="shared" si="0"/><v></v></c>
+          </row>
+          <row r="4">
+            <c r="B4"><f>A1*2</f><v></v></c>
+          </row>
+        </sheetData>
+        </worksheet>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+        assert ws["B3"].value == "=A3*2"
+
+
     def test_write_rows_comment(self, writer):
 
         cell = writer.ws['F1']
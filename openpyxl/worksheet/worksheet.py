@@ -4,6 +4,7 @@
 
 
 # Python stdlib imports
+from copy import copy
 from itertools import chain
 from operator import itemgetter
 from inspect import isgenerator
@@ -13,6 +14,7 @@ from warnings import warn
 from openpyxl.compat import (
     deprecated,
 )
+from openpyxl.compat.numbers import NUMPY
 
 # package imports
 from openpyxl.utils import (
@@ -23,6 +25,14 @@ from openpyxl.utils import (
     absolute_coordinate,
 )
 from openpyxl.cell import Cell, MergedCell
+from openpyxl.cell.cell import (
+    _TYPES,
+    get_type,
+    ILLEGAL_CHARACTERS_RE,
+    ERROR_CODES,
+)
+from openpyxl.utils.exceptions import IllegalCharacterError
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.formatting.formatting import ConditionalFormattingList
 from openpyxl.packaging.relationship import RelationshipList
 from openpyxl.workbook.child import _WorkbookChild
@@ -48,7 +58,9 @@ from .views import (
     Selection,
     SheetViewList,
 )
-from .cell_range import MultiCellRange, CellRange
+from .cell_range import MultiCellRange, CellRange, _subtract
+from .hyperlink import Hyperlink
+from openpyxl.utils.range_index import RangeIndex
 from .merge import MergedCellRange
 from .properties import WorksheetProperties
 from .pagebreak import RowBreak, ColBreak
@@ -115,6 +127,7 @@ class Worksheet(_WorkbookChild):
         self._pivots = []
         self.data_validations = DataValidationList()
         self._hyperlinks = []
+        self._hyperlink_ranges = RangeIndex()
         self.sheet_state = 'visible'
         self.page_setup = PrintPageSetup(worksheet=self)
         self.print_options = PrintOptions()
@@ -253,11 +266,27 @@ class Worksheet(_WorkbookChild):
             raise ValueError("Row numbers must be between 1 and 1048576")
         coordinate = (row, column)
         if not coordinate in self._cells:
-            cell = Cell(self, row=row, column=column)
-            self._add_cell(cell)
+            cell = None
+            if self.merged_cells:
+                cell = self._get_merged_cell(row, column)
+            if cell is None:
+                cell = Cell(self, row=row, column=column)
+                self._add_cell(cell)
+            else:
+                self._cells[coordinate] = cell
         return self._cells[coordinate]
 
 
+    def _get_merged_cell(self, row, column):
+        """
+        Internal method for creating the placeholder of a cell covered by a
+        merged range. Returns None if the cell is not covered by one.
+        """
+        for mcr in self.merged_cells._range_index.find(row, column):
+            if (row, column) != (mcr.min_row, mcr.min_col):
+                return MergedCell(self, row=row, column=column)
+
+
     def _add_cell(self, cell):
         """
         Internal method for adding cell objects.
@@ -321,6 +350,29 @@ class Worksheet(_WorkbookChild):
         row, column = coordinate_to_tuple(key)
         if (row, column) in self._cells:
             del self._cells[(row, column)]
+            self._reset_formula_index()
+
+
+    def _rows(self):
+        """
+        Indices of the rows containing cells, including merged cells that
+        have not been accessed
+        """
+        rows = set(c[0] for c in self._cells)
+        for mcr in self.merged_cells.ranges:
+            rows.update((mcr.min_row, mcr.max_row))
+        return rows
+
+
+    def _columns(self):
+        """
+        Indices of the columns containing cells, including merged cells that
+        have not been accessed
+        """
+        cols = set(c[1] for c in self._cells)
+        for mcr in self.merged_cells.ranges:
+            cols.update((mcr.min_col, mcr.max_col))
+        return cols
 
 
     @property
@@ -330,8 +382,8 @@ class Worksheet(_WorkbookChild):
         :type: int
         """
         min_row = 1
-        if self._cells:
-            rows = set(c[0] for c in self._cells)
+        rows = self._rows()
+        if rows:
             min_row = min(rows)
         return min_row
 
@@ -343,8 +395,8 @@ class Worksheet(_WorkbookChild):
         :type: int
         """
         max_row = 1
-        if self._cells:
-            rows = set(c[0] for c in self._cells)
+        rows = self._rows()
+        if rows:
             max_row = max(rows)
         return max_row
 
@@ -356,8 +408,8 @@ class Worksheet(_WorkbookChild):
         :type: int
         """
         min_col = 1
-        if self._cells:
-            cols = set(c[1] for c in self._cells)
+        cols = self._columns()
+        if cols:
             min_col = min(cols)
         return min_col
 
@@ -369,8 +421,8 @@ class Worksheet(_WorkbookChild):
         :type: int
         """
         max_col = 1
-        if self._cells:
-            cols = set(c[1] for c in self._cells)
+        cols = self._columns()
+        if cols:
             max_col = max(cols)
         return max_col
 
@@ -380,18 +432,14 @@ class Worksheet(_WorkbookChild):
 
         :rtype: string
         """
-        if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
-        else:
+        rows = self._rows()
+        if not rows:
             return "A1:A1"
+        cols = self._columns()
+        max_row = max(rows)
+        max_col = max(cols)
+        min_col = min(cols)
+        min_row = min(rows)
 
         return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
 
@@ -541,6 +589,45 @@ class Worksheet(_WorkbookChild):
         self.data_validations.append(data_validation)
 
 
+    def add_hyperlink(self, ref, link):
+        """
+        Add a hyperlink to a cell or a range of cells such as "B2:D10". Any
+        other hyperlinks of the cells are removed.
+
+        :param ref: the coordinate of the cell or range
+        :param link: a :class:`openpyxl.worksheet.hyperlink.Hyperlink` or its
+            target
+        """
+        cr = CellRange(ref)
+        if cr.size == {"rows": 1, "columns": 1}:
+            self.cell(row=cr.min_row, column=cr.min_col).hyperlink = link
+            return
+
+        if not isinstance(link, Hyperlink):
+            link = Hyperlink(ref="", target=link)
+        link.ref = cr.coord
+        self._clear_hyperlinks(cr.bounds)
+        for (row, col), cell in self._cells.items():
+            if (cell._hyperlink is not None and cr.min_row <= row <= cr.max_row
+                and cr.min_col <= col <= cr.max_col):
+                cell._hyperlink = None
+        self._hyperlink_ranges.add(link, cr.bounds)
+
+
+    def _clear_hyperlinks(self, bounds):
+        """
+        Split the hyperlinks of ranges so that none of them include any cell
+        of bounds
+        """
+        ranges = self._hyperlink_ranges
+        for link in ranges.overlapping(bounds):
+            ranges.remove(link)
+            for piece in _subtract(CellRange(link.ref).bounds, bounds):
+                part = copy(link)
+                part.ref = CellRange(None, *piece).coord
+                ranges.add(part, piece)
+
+
     def add_chart(self, chart, anchor=None):
         """
         Add a chart to the sheet
@@ -599,14 +686,33 @@ class Worksheet(_WorkbookChild):
         Remove all but the top left-cell from a range of merged cells
         and recreate the lost border information.
         Borders are then applied
+
+        The remaining cells are not created: they are returned as
+        MergedCells when they are accessed.
         """
-        cells = mcr.cells
-        next(cells) # skip first cell
-        for row, col in cells:
-            self._cells[row, col] = MergedCell(self, row, col)
+        self._remove_cells(mcr, skip_first=True)
         mcr.format()
 
 
+    def _remove_cells(self, cr, skip_first=False):
+        """
+        Remove any cells within a range, optionally keeping the top-left cell
+        """
+        min_col, min_row, max_col, max_row = cr.bounds
+        size = (max_col - min_col + 1) * (max_row - min_row + 1)
+        if size > len(self._cells):
+            coords = [
+                (row, col) for (row, col) in self._cells
+                if min_row <= row <= max_row and min_col <= col <= max_col
+                ]
+        else:
+            coords = cr.cells
+        for coord in coords:
+            if skip_first and coord == (min_row, min_col):
+                continue
+            self._cells.pop(coord, None)
+
+
     @property
     @deprecated("Use ws.merged_cells.ranges")
     def merged_cell_ranges(self):
@@ -623,11 +729,7 @@ class Worksheet(_WorkbookChild):
             raise ValueError("Cell range {0} is not merged".format(cr.coord))
 
         self.merged_cells.remove(cr)
-
-        cells = cr.cells
-        next(cells) # skip first cell
-        for row, col in cells:
-            del self._cells[(row, col)]
+        self._remove_cells(cr, skip_first=True)
 
 
     def append(self, iterable):
@@ -678,6 +780,265 @@ class Worksheet(_WorkbookChild):
         self._current_row = row_idx
 
 
+    def set_values(self, anchor, values, types=None):
+        """
+        Write a block of values with the top left value at the anchor.
+
+        Data types are inferred once for each type of value rather than for
+        each cell. If the types of the columns are known they can be passed
+        in as a single data type for all columns or a sequence with one data
+        type, or None, per column. The type of the values in columns with a
+        declared type is only checked once for each type of value and strings
+        are not treated as formulae or errors.
+
+        Values cannot be written to merged cells, other than None.
+
+        :param anchor: coordinate of the top left cell, eg. "B2"
+        :type anchor: string
+
+        :param values: rows of values or a two-dimensional numpy array
+        :type values: iterable
+
+        :param types: the data types of the columns: 'n', 's', 'b' or 'd'
+        :type types: string or sequence
+
+        """
+        min_row, min_col = coordinate_to_tuple(anchor)
+        rows = self._block_rows(values)
+        if not rows:
+            return
+
+        max_row = min_row + len(rows) - 1
+        max_col = min_col + max(len(row) for row in rows) - 1
+        if max_row > 1048576:
+            raise ValueError("Row numbers must be between 1 and 1048576")
+
+        if types is None or isinstance(types, str):
+            types = [types] * (max_col - min_col + 1)
+        else:
+            types = list(types)
+            types.extend([None] * (max_col - min_col + 1 - len(types)))
+        for dt in types:
+            if dt not in (None, 'n', 's', 'b', 'd'):
+                raise ValueError("{0!r} is not a valid data type".format(dt))
+
+        merged = self.merged_cells and self.merged_cells.overlapping(
+            CellRange(min_col=min_col, min_row=min_row,
+                      max_col=max_col, max_row=max_row)
+        )
+        cells = self._cells
+        date_styles = {}
+        checked = [set() for dt in types] # types of value matching each column
+
+        for row_idx, row in enumerate(rows, min_row):
+            for (col_idx, value), declared, seen in zip(enumerate(row, min_col),
+                                                        types, checked):
+                coord = (row_idx, col_idx)
+                cell = cells.get(coord)
+                if cell is None and merged:
+                    cell = self._get_cell(row_idx, col_idx)
+                if isinstance(cell, MergedCell):
+                    if value is None:
+                        continue
+                    raise ValueError("Cannot write {0!r} to {1}, which is part "
+                                     "of a merged range".format(value, cell.coordinate))
+                if value is None:
+                    if cell is not None:
+                        cell.value = None
+                    continue
+
+                t = type(value)
+                dt = declared
+                if dt is None:
+                    dt = _TYPES.get(t) or get_type(t, value)
+                    if dt is None:
+                        raise ValueError("Cannot convert {0!r} to Excel".format(value))
+                elif t not in seen:
+                    if (_TYPES.get(t) or get_type(t, value)) != dt:
+                        raise ValueError("{0!r} is not of type {1!r}".format(value, dt))
+                    seen.add(t)
+
+                if dt == 's':
+                    if not isinstance(value, str):
+                        value = str(value, self.encoding)
+                    value = value[:32767]
+                    if ILLEGAL_CHARACTERS_RE.search(value):
+                        raise IllegalCharacterError
+                    if declared is None:
+                        if len(value) > 1 and value.startswith("="):
+                            dt = 'f'
+                        elif value in ERROR_CODES:
+                            dt = 'e'
+
+                if cell is None:
+                    style = None
+                    if dt == 'd':
+                        style = date_styles.get(t)
+                        if style is None:
+                            style = Cell(self, value=value)._style
+                            date_styles[t] = style
+                    cell = Cell(self, row=row_idx, column=col_idx, style_array=style)
+                    cells[coord] = cell
+                elif dt == 'd':
+                    cell.value = value # keep any existing date format
+                    continue
+
+                cell._value = value
+                cell.data_type = dt
+
+        self._current_row = max(self._current_row, max_row)
+        self._reset_formula_index()
+
+
+    @staticmethod
+    def _block_rows(values):
+        """
+        Convert a block of values to a list of rows
+        """
+        if NUMPY:
+            import numpy
+            if isinstance(values, numpy.ndarray):
+                if values.ndim != 2:
+                    raise ValueError("Only two-dimensional arrays can be written")
+                if values.dtype.kind in "mM":
+                    values = values.astype(values.dtype.kind + "8[us]")
+                return values.tolist()
+        return list(values)
+
+
+    def get_values(self, range_string, as_numpy=False):
+        """
+        Return the values of a range as a tuple of rows without creating any
+        cells.
+
+        :param range_string: the range, eg. "B2:K10000", "A:C" or "2:10"
+        :type range_string: string
+
+        :param as_numpy: return a two-dimensional numpy array of objects
+        :type as_numpy: bool
+
+        """
+        min_col, min_row, max_col, max_row = range_boundaries(range_string)
+        if min_col is None:
+            min_col, max_col = 1, self.max_column
+        if min_row is None:
+            min_row, max_row = 1, self.max_row
+
+        get = self._cells.get
+        cols = range(min_col, max_col + 1)
+        rows = []
+        for row in range(min_row, max_row + 1):
+            values = []
+            for col in cols:
+                cell = get((row, col))
+                values.append(cell.value if cell is not None else None)
+            rows.append(tuple(values))
+
+        if as_numpy:
+            import numpy
+            values = numpy.empty((len(rows), len(cols)), dtype=object)
+            values[:] = rows
+            return values
+        return tuple(rows)
+
+
+    def apply_style(self, range_string, font=None, fill=None, border=None,
+                    alignment=None, number_format=None, protection=None):
+        """
+        Apply formatting to all the cells in a range.
+
+        The styles are added to the workbook once and the resulting style is
+        worked out once for each different style already in the range.
+        Missing cells in a range are created. For whole rows or columns, eg.
+        "1:5" or "A:C", the row or column styles are set and only existing
+        cells are changed.
+
+        Only the aspects passed in are changed: any others are kept.
+        """
+        template = Cell(self)
+        changes = []
+        for name, value, key in (
+            ("font", font, "fontId"),
+            ("fill", fill, "fillId"),
+            ("border", border, "borderId"),
+            ("alignment", alignment, "alignmentId"),
+            ("number_format", number_format, "numFmtId"),
+            ("protection", protection, "protectionId"),
+            ):
+            if value is not None:
+                setattr(template, name, value)
+                changes.append((key, getattr(template._style, key)))
+        if not changes:
+            return
+
+        styles = {}
+
+        def restyle(style):
+            key = None if style is None else style.tobytes()
+            new = styles.get(key)
+            if new is None:
+                new = StyleArray() if style is None else StyleArray(style)
+                for attr, idx in changes:
+                    setattr(new, attr, idx)
+                styles[key] = new
+            return StyleArray(new)
+
+        self._restyle(range_string, restyle)
+
+
+    def apply_named_style(self, range_string, style):
+        """
+        Apply a named style, or the name of one, to all the cells in a range.
+        Missing cells and whole rows or columns are handled as in
+        :meth:`apply_style`.
+        """
+        template = Cell(self)
+        template.style = style
+        style = template._style
+        self._restyle(range_string, lambda existing: StyleArray(style))
+
+
+    def _restyle(self, range_string, restyle):
+        """
+        Replace the style of the cells, rows or columns in a range
+        """
+        min_col, min_row, max_col, max_row = range_boundaries(range_string)
+        cells = self._cells
+
+        if min_row is None or min_col is None:
+            if min_row is None:
+                for col in range(min_col, max_col + 1):
+                    dim = self.column_dimensions[get_column_letter(col)]
+                    dim._style = restyle(dim._style)
+                for (row, col), cell in cells.items():
+                    if min_col <= col <= max_col:
+                        cell._style = restyle(cell._style)
+            else:
+                for row in range(min_row, max_row + 1):
+                    dim = self.row_dimensions[row]
+                    dim._style = restyle(dim._style)
+                for (row, col), cell in cells.items():
+                    if min_row <= row <= max_row:
+                        cell._style = restyle(cell._style)
+            return
+
+        merged = self.merged_cells and self.merged_cells.overlapping(
+            CellRange(min_col=min_col, min_row=min_row,
+                      max_col=max_col, max_row=max_row)
+        )
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                cell = cells.get((row, col))
+                if cell is None:
+                    if merged:
+                        cell = self._get_cell(row, col)
+                    else:
+                        cell = Cell(self, row=row, column=col)
+                        cells[(row, col)] = cell
+                cell._style = restyle(cell._style)
+        self._current_row = max(self._current_row, max_row)
+
+
     def _move_cells(self, min_row=None, min_col=None, offset=0, row_or_col="row"):
         """
         Move either rows or columns around by the offset
@@ -704,6 +1065,7 @@ class Worksheet(_WorkbookChild):
                 continue
 
             self._move_cell(row, column, row_offset, col_offset)
+        self._reset_formula_index()
 
 
     def insert_rows(self, idx, amount=1):
@@ -788,6 +1150,7 @@ class Worksheet(_WorkbookChild):
 
         # rebase moved range
         cell_range.shift(row_shift=rows, col_shift=cols)
+        self._reset_formula_index()
 
 
     def _move_cell(self, row, column, row_offset, col_offset, translate=False):
@@ -797,6 +1160,8 @@ class Worksheet(_WorkbookChild):
         Rebase coordinate
         """
         cell = self._get_cell(row, column)
+        if cell.data_type == "f":
+            cell._value = cell.value # a shared formula depends on the position
         new_row = cell.row + row_offset
         new_col = cell.column + col_offset
         self._cells[new_row, new_col] = cell
@@ -808,6 +1173,16 @@ class Worksheet(_WorkbookChild):
             cell.value = t.translate_formula(row_delta=row_offset, col_delta=col_offset)
 
 
+    def _reset_formula_index(self):
+        """
+        Cells have been moved or removed, so the formula index of the
+        workbook, if there is one, must be built again
+        """
+        index = getattr(self.parent, "_formula_index", None)
+        if index is not None:
+            index.reset()
+
+
     def _invalid_row(self, iterable):
         raise TypeError('Value must be a list, tuple, range or generator, or a dict. Supplied value is {0}'.format(
             type(iterable))
@@ -26,8 +26,12 @@ from openpyxl.xml.constants import (
     PACKAGE_IMAGES,
     PACKAGE_XL
     )
-from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
-from openpyxl.xml.functions import tostring, fromstring, Element
+from openpyxl.xml.functions import (
+    tostring,
+    fromstring,
+    Element,
+    archive_stream,
+)
 from openpyxl.packaging.manifest import Manifest
 from openpyxl.packaging.relationship import (
     get_rels_path,
@@ -35,6 +39,7 @@ from openpyxl.packaging.relationship import (
     Relationship,
 )
 from openpyxl.comments.comment_sheet import CommentSheet
+from openpyxl.comments.shape_writer import ShapeWriter
 from openpyxl.packaging.extended import ExtendedProperties
 from openpyxl.styles.stylesheet import write_stylesheet
 from openpyxl.worksheet._writer import WorksheetWriter
@@ -105,8 +110,8 @@ class ExcelWriter(object):
                              )
 
         if self.workbook.vba_archive:
-            for name in set(self.workbook.vba_archive.namelist()) - self.vba_modified:
-                if ARC_VBA.match(name):
+            for name in self.workbook.vba_archive.namelist():
+                if name not in self.vba_modified and ARC_VBA.match(name):
                     self._archive.writestr(name, self.workbook.vba_archive.read(name))
 
 
@@ -169,7 +174,8 @@ class ExcelWriter(object):
         cs = CommentSheet.from_comments(ws._comments)
         self._comments.append(cs)
         cs._id = len(self._comments)
-        self._archive.writestr(cs.path[1:], tostring(cs.to_tree()))
+        with archive_stream(self._archive, cs.path[1:]) as xf:
+            cs.to_stream(xf)
         self.manifest.append(cs)
 
         if ws.legacy_drawing is None or self.workbook.vba_archive is None:
@@ -178,9 +184,8 @@ class ExcelWriter(object):
         else:
             vml = fromstring(self.workbook.vba_archive.read(ws.legacy_drawing))
 
-        vml = cs.write_shapes(vml)
-
-        self._archive.writestr(ws.legacy_drawing, vml)
+        with archive_stream(self._archive, ws.legacy_drawing) as xf:
+            ShapeWriter(cs.comments).to_stream(xf, vml)
         self.vba_modified.add(ws.legacy_drawing)
 
         comment_rel = Relationship(Id="comments", type=cs._rel_type, Target=cs.path)
@@ -188,6 +193,7 @@ class ExcelWriter(object):
 
 
     def write_worksheet(self, ws):
+        from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
         ws._drawing = SpreadsheetDrawing()
         ws._drawing.charts = ws._charts
         ws._drawing.images = ws._images
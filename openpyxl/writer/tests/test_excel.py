@@ -161,6 +161,9 @@ def test_merge_vba(ExcelWriter, archive, datadir):
         'xl/ctrlProps/ctrlProp8.xml',
         'xl/ctrlProps/ctrlProp2.xml',
     ])
+    # in the order of the original archive
+    names = archive.namelist()
+    assert names == [n for n in wb.vba_archive.namelist() if n in names]
 
 
 def test_duplicate_chart(ExcelWriter, archive):
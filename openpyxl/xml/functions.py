@@ -5,6 +5,7 @@ XML compatability functions
 """
 
 # Python stdlib imports
+from contextlib import contextmanager
 import re
 from functools import partial
 
@@ -70,6 +71,16 @@ register_namespace('xml', XML_NS)
 
 tostring = partial(tostring, encoding="utf-8")
 
+
+@contextmanager
+def archive_stream(archive, arcname):
+    """
+    xmlfile that writes straight into a member of a zip archive
+    """
+    with archive.open(arcname, "w") as out:
+        with xmlfile(out) as xf:
+            yield xf
+
 NS_REGEX = re.compile("({(?P<namespace>.*)})?(?P<localname>.*)")
 
 def localname(node):